@@ -1,6 +1,6 @@
 """
 Script to add sample reviews to the database
-Run this after running migrate_add_reviews.py
+Run this after applying migrations (flask migrate)
 """
 import sys
 import os
@@ -10,12 +10,13 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect, text
 from datetime import datetime, timedelta
 import random
 
 # Initialize Flask app
 app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///erugah.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///erugah.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
 db = SQLAlchemy(app)
@@ -171,6 +172,9 @@ def add_sample_reviews():
                 added_count += 1
                 print(f"  ✓ Added review from {review_data['customer_name']} ({review_data['event_type']}, {review_data['rating']} stars)")
             
+            # The review_stat aggregates are rebuilt from the reviews on next use once their rows are gone
+            if inspect(db.engine).has_table('review_stat'):
+                db.session.execute(text('DELETE FROM review_stat'))
             db.session.commit()
             print(f"\n✓ Successfully added {added_count} sample reviews!")
             
@@ -0,0 +1,95 @@
+"""
+Structured, leveled logging for e-Rugah.
+
+Use get_logger(__name__) and pass structured fields as keyword arguments:
+
+    log = get_logger(__name__)
+    log.debug("code generated", identifier=email, expires_at=expires_at)
+
+Messages and fields are only formatted when the level is enabled, so debug
+logging costs a level check when it is off. Configure with LOG_LEVEL
+(default INFO) and LOG_FORMAT ('text' or 'json').
+"""
+import json
+import logging
+import os
+import sys
+
+_configured = False
+
+
+class StructuredFormatter(logging.Formatter):
+    """Renders the message followed by key=value fields (or one JSON object per line)."""
+
+    def __init__(self, fmt='text'):
+        super().__init__()
+        self.fmt = fmt
+
+    def format(self, record):
+        fields = getattr(record, 'fields', None) or {}
+        if self.fmt == 'json':
+            payload = {
+                'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+                'level': record.levelname,
+                'logger': record.name,
+                'message': record.getMessage(),
+            }
+            payload.update({k: v if isinstance(v, (int, float, bool)) or v is None else str(v) for k, v in fields.items()})
+            if record.exc_info:
+                payload['exc_info'] = self.formatException(record.exc_info)
+            return json.dumps(payload)
+
+        line = f"{self.formatTime(record, '%Y-%m-%d %H:%M:%S')} {record.levelname:<7} {record.name}: {record.getMessage()}"
+        if fields:
+            line += ' ' + ' '.join(f"{k}={v}" for k, v in fields.items())
+        if record.exc_info:
+            line += '\n' + self.formatException(record.exc_info)
+        return line
+
+
+class StructuredLogger(logging.LoggerAdapter):
+    """Logger adapter that turns keyword arguments into structured fields."""
+
+    def log(self, level, msg, *args, exc_info=None, stack_info=False, stacklevel=1, **fields):
+        """Like Logger.log; stacklevel counts from the caller, so the record shows the right line."""
+        if self.isEnabledFor(level):
+            self.logger.log(level, msg, *args, exc_info=exc_info, stack_info=stack_info,
+                            extra={'fields': fields}, stacklevel=stacklevel + 1)
+
+    def debug(self, msg, *args, **fields):
+        self.log(logging.DEBUG, msg, *args, stacklevel=2, **fields)
+
+    def info(self, msg, *args, **fields):
+        self.log(logging.INFO, msg, *args, stacklevel=2, **fields)
+
+    def warning(self, msg, *args, **fields):
+        self.log(logging.WARNING, msg, *args, stacklevel=2, **fields)
+
+    def error(self, msg, *args, **fields):
+        self.log(logging.ERROR, msg, *args, stacklevel=2, **fields)
+
+    def exception(self, msg, *args, **fields):
+        self.log(logging.ERROR, msg, *args, exc_info=True, stacklevel=2, **fields)
+
+def configure_logging(level=None, fmt=None, stream=None):
+    """Install the structured handler on the 'erugah' logger (idempotent)."""
+    global _configured
+
+    logger = logging.getLogger('erugah')
+    level = level or os.getenv('LOG_LEVEL', 'INFO')
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+
+    if not _configured:
+        handler = logging.StreamHandler(stream or sys.stderr)
+        handler.setFormatter(StructuredFormatter(fmt or os.getenv('LOG_FORMAT', 'text')))
+        logger.addHandler(handler)
+        logger.propagate = False
+        _configured = True
+    return logger
+
+
+def get_logger(name):
+    """Return a structured logger under the 'erugah' namespace."""
+    if not name.startswith('erugah'):
+        name = f'erugah.{name}'
+    return StructuredLogger(logging.getLogger(name), {})
@@ -0,0 +1,85 @@
+"""
+CSS/JS bundles for the templates.
+
+Page styles and scripts live in assets/ and are referenced from templates with
+{{ asset_url('css/index.css') }}. build_assets.py minifies them into
+content-hashed files under static/dist/ with .gz/.br siblings and a
+manifest.json; asset_url() then points at /assets/<hashed name>, served with
+the best encoding the browser accepts and cached for a year (the name changes
+whenever the content does).
+
+Without a build (development, tests) asset_url() serves the sources from
+assets/ uncached, so the build is optional until deployment.
+"""
+import json
+import mimetypes
+import os
+
+from flask import Blueprint, current_app, request, send_from_directory, url_for
+from werkzeug.security import safe_join
+
+from app_logging import get_logger
+
+log = get_logger(__name__)
+
+SOURCE_DIR = 'assets'
+DIST_DIR = os.path.join('static', 'dist')
+MANIFEST_NAME = 'manifest.json'
+# Preferred first; the suffixes build_assets.py writes
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+ONE_YEAR = 365 * 24 * 3600
+
+bp = Blueprint('assets', __name__)
+
+
+def load_manifest(dist_dir):
+    """{source name: hashed file name} from the last build, or {} if never built."""
+    try:
+        with open(os.path.join(dist_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def asset_url(name):
+    manifest = current_app.extensions['assets']['manifest']
+    if name in manifest:
+        return url_for('assets.bundle', filename=manifest[name])
+    return url_for('assets.source', filename=name)
+
+
+@bp.route('/assets/<path:filename>')
+def bundle(filename):
+    dist_dir = current_app.extensions['assets']['dist_dir']
+    mimetype = mimetypes.guess_type(filename)[0]
+    for encoding, suffix in ENCODINGS:
+        path = safe_join(dist_dir, filename + suffix)
+        if request.accept_encodings[encoding] and path and os.path.isfile(path):
+            response = send_from_directory(dist_dir, filename + suffix, mimetype=mimetype)
+            response.headers['Content-Encoding'] = encoding
+            break
+    else:
+        response = send_from_directory(dist_dir, filename, mimetype=mimetype)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.max_age = ONE_YEAR
+    response.cache_control.immutable = True
+    return response
+
+
+@bp.route('/assets/src/<path:filename>')
+def source(filename):
+    response = send_from_directory(current_app.extensions['assets']['source_dir'], filename)
+    response.cache_control.no_cache = True
+    return response
+
+
+def init_assets(app):
+    source_dir = os.path.join(app.root_path, app.config.get('ASSETS_SOURCE_DIR', SOURCE_DIR))
+    dist_dir = os.path.join(app.root_path, app.config.get('ASSETS_DIST_DIR', DIST_DIR))
+    manifest = load_manifest(dist_dir)
+    if not manifest:
+        log.info("asset bundles not built, serving sources", hint="python build_assets.py")
+    app.extensions['assets'] = {'source_dir': source_dir, 'dist_dir': dist_dir, 'manifest': manifest}
+    app.jinja_env.globals['asset_url'] = asset_url
+    app.register_blueprint(bp)
@@ -0,0 +1,658 @@
+// Custom Menu Modal Functionality - Declare at top for global access
+let customSelectedDishes = [];
+const MAX_CUSTOM_DISHES = 10;
+
+// Animate elements on scroll
+const observerOptions = {
+    threshold: 0.1,
+    rootMargin: '0px 0px -50px 0px'
+};
+
+const observer = new IntersectionObserver((entries) => {
+    entries.forEach((entry, index) => {
+        if (entry.isIntersecting) {
+            setTimeout(() => {
+                entry.target.classList.add('visible');
+            }, index * 100);
+        }
+    });
+}, observerOptions);
+
+document.querySelectorAll('.animate-on-scroll').forEach(el => {
+    observer.observe(el);
+});
+
+// Progress indicator animation
+const form = document.getElementById('eventForm');
+const progressSteps = document.querySelectorAll('.progress-step');
+
+// Update progress based on form completion
+const inputs = {
+    location: ['county', 'sub_county', 'town'],
+    event: ['event_date', 'adult_guests', 'child_guests'],
+    menu: ['dishes']
+};
+
+function updateProgress() {
+    // Check location fields
+    const locationComplete = inputs.location.every(id => 
+        document.getElementById(id).value.trim() !== ''
+    );
+    if (locationComplete) {
+        progressSteps[0].classList.add('active');
+        progressSteps[1].classList.add('active');
+    }
+
+    // Check event fields
+    const eventComplete = inputs.event.every(id => 
+        document.getElementById(id).value.trim() !== ''
+    );
+    if (eventComplete && locationComplete) {
+        progressSteps[2].classList.add('active');
+    }
+
+    // Check menu selection
+    const menuSelected = document.querySelectorAll('input[name="dishes"]:checked').length > 0;
+    if (menuSelected && eventComplete && locationComplete) {
+        progressSteps[3].classList.add('active');
+    }
+}
+
+// Add event listeners to all form inputs
+form.querySelectorAll('input').forEach(input => {
+    input.addEventListener('input', updateProgress);
+    input.addEventListener('change', updateProgress);
+});
+
+// Add ripple effect to submit button
+const submitBtn = document.querySelector('.btn-primary');
+submitBtn.addEventListener('click', function(e) {
+    const ripple = document.createElement('span');
+    const rect = this.getBoundingClientRect();
+    const size = Math.max(rect.width, rect.height);
+    const x = e.clientX - rect.left - size / 2;
+    const y = e.clientY - rect.top - size / 2;
+
+    ripple.style.cssText = `
+        position: absolute;
+        width: ${size}px;
+        height: ${size}px;
+        left: ${x}px;
+        top: ${y}px;
+        background: rgba(255, 255, 255, 0.5);
+        border-radius: 50%;
+        transform: scale(0);
+        animation: ripple 0.6s ease-out;
+        pointer-events: none;
+    `;
+
+    this.appendChild(ripple);
+    setTimeout(() => ripple.remove(), 600);
+});
+
+// Add CSS for ripple animation
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes ripple {
+        to {
+            transform: scale(4);
+            opacity: 0;
+        }
+    }
+`;
+document.head.appendChild(style);
+
+// Smooth scroll to form sections
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+    anchor.addEventListener('click', function (e) {
+        e.preventDefault();
+        const target = document.querySelector(this.getAttribute('href'));
+        if (target) {
+            target.scrollIntoView({
+                behavior: 'smooth',
+                block: 'start'
+            });
+        }
+    });
+});
+
+// Add hover effect to menu items
+document.querySelectorAll('.menu-item-card').forEach(card => {
+    card.addEventListener('mouseenter', function() {
+        this.style.transform = 'translateY(-5px) scale(1.02)';
+    });
+
+    card.addEventListener('mouseleave', function() {
+        this.style.transform = 'translateY(0) scale(1)';
+    });
+});
+
+// Set minimum date to today
+const dateInput = document.getElementById('event_date');
+const today = new Date().toISOString().split('T')[0];
+dateInput.setAttribute('min', today);
+
+// Form validation with custom messages
+form.addEventListener('submit', function(e) {
+    const menuSelected = document.querySelectorAll('input[name="dishes"]:checked').length > 0;
+
+    if (!menuSelected) {
+        e.preventDefault();
+        alert('Please select at least one menu item for your event! 🍽️');
+        document.querySelector('.section-title').scrollIntoView({ behavior: 'smooth' });
+    }
+});
+
+// Calculate Total Price Button Handler
+document.getElementById('calculateTotalBtn').addEventListener('click', function() {
+    const adultGuests = parseInt(document.getElementById('adult_guests').value) || 0;
+    const childGuests = parseInt(document.getElementById('child_guests').value) || 0;
+    const totalGuests = adultGuests + childGuests;
+
+    if (totalGuests === 0) {
+        alert('Please enter the number of guests first.');
+        return;
+    }
+
+    // Get all selected regular dishes
+    const selectedDishes = [];
+    const regularCheckboxes = document.querySelectorAll('.dish-checkbox:checked');
+
+    console.log('=== CALCULATE PRICE DEBUG ===');
+    console.log('Regular checkboxes found:', regularCheckboxes.length);
+
+    regularCheckboxes.forEach(checkbox => {
+        console.log('Regular dish:', checkbox.getAttribute('data-dish-name'), 'ID:', checkbox.value);
+        selectedDishes.push({
+            id: checkbox.value,
+            name: checkbox.getAttribute('data-dish-name')
+        });
+    });
+
+    // Add custom dishes to the list
+    console.log('Custom dishes array:', customSelectedDishes);
+    if (customSelectedDishes && customSelectedDishes.length > 0) {
+        customSelectedDishes.forEach(dish => {
+            console.log('Custom dish:', dish.name, 'ID:', dish.id);
+            selectedDishes.push({
+                id: dish.id,
+                name: dish.name
+            });
+        });
+    }
+
+    console.log('Total dishes to calculate:', selectedDishes.length);
+    console.log('All selected dishes:', selectedDishes);
+    console.log('=== END DEBUG ===');
+
+    if (selectedDishes.length === 0) {
+        alert('Please select at least one dish (regular or custom).');
+        return;
+    }
+
+    // Show loading
+    const modal = new bootstrap.Modal(document.getElementById('priceModal'));
+    document.getElementById('priceModalBody').innerHTML = '<div class="text-center py-3"><div class="spinner-border" role="status" style="width: 1.5rem; height: 1.5rem; color: #ff6b35; border-width: 2px;"><span class="visually-hidden">Loading...</span></div><p class="mt-2 mb-0" style="font-size: 0.7rem; color: #6c757d;">Calculating prices...</p></div>';
+    modal.show();
+
+    // Fetch prices for all selected dishes (regular + custom)
+    const fetchPromises = selectedDishes.map(dish => 
+        fetch('/api/calculate-dish-price', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/x-www-form-urlencoded',
+            },
+            body: new URLSearchParams({
+                'dish_id': dish.id,
+                'guests': totalGuests
+            })
+        }).then(response => response.json())
+    );
+
+    Promise.all(fetchPromises)
+        .then(results => {
+            let html = `
+                <div style="background: linear-gradient(135deg, #ff6b3515, #ff8c4215); padding: 0.5rem; border-radius: 10px; margin-bottom: 0.75rem; border-left: 3px solid #ff6b35;">
+                    <div style="font-size: 0.7rem; color: #ff6b35; font-weight: 600;">
+                        <i class="bi bi-people-fill"></i> ${totalGuests} Guests
+                    </div>
+                </div>
+            `;
+
+            let grandTotal = 0;
+
+            results.forEach((data, index) => {
+                grandTotal += data.selling_price;
+
+                html += `
+                    <div style="background: white; border-radius: 12px; margin-bottom: 0.75rem; overflow: hidden; box-shadow: 0 2px 8px rgba(0,0,0,0.08);">
+                        <div style="background: linear-gradient(135deg, #f8f9fa, #e9ecef); padding: 0.5rem 0.75rem; border-bottom: 1px solid #dee2e6;">
+                            <div style="font-size: 0.8rem; font-weight: 600; color: #2c3e50;">
+                                <span style="display: inline-block; width: 20px; height: 20px; background: linear-gradient(135deg, #ff6b35, #ff8c42); color: white; border-radius: 50%; text-align: center; line-height: 20px; font-size: 0.7rem; margin-right: 0.4rem;">${index + 1}</span>
+                                ${data.dish_name}
+                            </div>
+                        </div>
+                        <div style="padding: 0.5rem;">
+                            <table style="width: 100%; font-size: 0.7rem; margin-bottom: 0;">
+                                <thead>
+                                    <tr style="border-bottom: 1px solid #e9ecef;">
+                                        <th style="padding: 0.25rem; font-weight: 600; color: #6c757d;">Item</th>
+                                        <th style="padding: 0.25rem; font-weight: 600; color: #6c757d; text-align: center;">Qty</th>
+                                        <th style="padding: 0.25rem; font-weight: 600; color: #6c757d; text-align: right;">Cost</th>
+                                    </tr>
+                                </thead>
+                                <tbody>
+                `;
+
+                data.ingredient_breakdown.forEach(item => {
+                    html += `
+                        <tr style="border-bottom: 1px solid #f8f9fa;">
+                            <td style="padding: 0.25rem; color: #495057;">${item.name}</td>
+                            <td style="padding: 0.25rem; color: #6c757d; text-align: center; font-size: 0.65rem;">${item.scaled_quantity}${item.unit}</td>
+                            <td style="padding: 0.25rem; color: #495057; text-align: right; font-weight: 500;">${item.cost.toLocaleString()}</td>
+                        </tr>
+                    `;
+                });
+
+                html += `
+                                </tbody>
+                            </table>
+                            <div style="margin-top: 0.5rem; padding-top: 0.5rem; border-top: 2px solid #e9ecef;">
+                                <div style="display: flex; justify-content: space-between; font-size: 0.65rem; color: #6c757d; margin-bottom: 0.2rem;">
+                                    <span>Ingredients</span>
+                                    <span>KSh ${data.total_cost.toLocaleString()}</span>
+                                </div>
+                                <div style="display: flex; justify-content: space-between; font-size: 0.65rem; color: #6c757d; margin-bottom: 0.3rem;">
+                                    <span>Markup (${data.markup_percentage}%)</span>
+                                    <span>KSh ${data.markup_amount.toLocaleString()}</span>
+                                </div>
+                                <div style="display: flex; justify-content: space-between; font-size: 0.8rem; font-weight: 700; color: #ff6b35; padding: 0.3rem; background: #ff6b3510; border-radius: 6px;">
+                                    <span>Total</span>
+                                    <span>KSh ${data.selling_price.toLocaleString()}</span>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                `;
+            });
+
+            // Add grand total
+            html += `
+                <div style="background: linear-gradient(135deg, #ff6b35, #ff8c42); border-radius: 12px; padding: 0.75rem; margin-top: 0.5rem; box-shadow: 0 4px 12px rgba(255, 107, 53, 0.3);">
+                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                        <div>
+                            <div style="font-size: 0.75rem; font-weight: 600; color: white; margin-bottom: 0.2rem;">
+                                <i class="bi bi-cash-stack"></i> Grand Total
+                            </div>
+                            <div style="font-size: 0.65rem; color: rgba(255,255,255,0.8);">
+                                ${results.length} dish${results.length > 1 ? 'es' : ''} × ${totalGuests} guests
+                            </div>
+                        </div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: white;">
+                            KSh ${grandTotal.toLocaleString()}
+                        </div>
+                    </div>
+                </div>
+            `;
+
+            document.getElementById('priceModalBody').innerHTML = html;
+        })
+        .catch(error => {
+            document.getElementById('priceModalBody').innerHTML = '<div class="alert alert-danger"><i class="bi bi-exclamation-triangle-fill"></i> Error calculating prices. Please try again.</div>';
+            console.error('Error:', error);
+        });
+});
+
+// Check dish button handler
+document.getElementById('checkDishBtn').addEventListener('click', function() {
+    const dishName = document.getElementById('customDishSearch').value.trim();
+
+    if (!dishName) {
+        alert('Please enter a dish name');
+        return;
+    }
+
+    // Show loading
+    document.getElementById('customDishResults').innerHTML = `
+        <div class="text-center py-3">
+            <div class="spinner-border" role="status" style="color: #ff6b35;">
+                <span class="visually-hidden">Loading...</span>
+            </div>
+            <p class="mt-2 mb-0" style="font-size: 0.8rem; color: #666;">Searching for "${dishName}"...</p>
+        </div>
+    `;
+
+    // Check if dish exists
+    fetch('/api/check-custom-dish', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/x-www-form-urlencoded',
+        },
+        body: new URLSearchParams({
+            'dish_name': dishName
+        })
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success && data.found) {
+            displayDishDetails(data.dish, data.suggestions || []);
+        } else {
+            displayDishNotFound(dishName, data.suggestions || []);
+        }
+    })
+    .catch(error => {
+        document.getElementById('customDishResults').innerHTML = `
+            <div class="alert" style="background: #fff5f2; border: 2px solid #ff6b35; color: #ff6b35; border-radius: 8px; font-size: 0.85rem;">
+                <i class="bi bi-exclamation-triangle-fill"></i> Error searching for dish. Please try again.
+            </div>
+        `;
+        console.error('Error:', error);
+    });
+});
+
+// Allow Enter key to trigger search
+document.getElementById('customDishSearch').addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        document.getElementById('checkDishBtn').click();
+    }
+});
+
+// Clicking a suggested dish searches for it by name
+document.getElementById('customDishResults').addEventListener('click', function(e) {
+    const suggestion = e.target.closest('[data-dish-name]');
+    if (suggestion) {
+        document.getElementById('customDishSearch').value = suggestion.dataset.dishName;
+        document.getElementById('checkDishBtn').click();
+    }
+});
+
+function escapeHtml(value) {
+    const div = document.createElement('div');
+    div.textContent = value;
+    return div.innerHTML.replace(/"/g, '&quot;');
+}
+
+function renderDishMatches(matches, heading) {
+    if (!matches.length) {
+        return '';
+    }
+    let html = `
+        <div style="margin-top: 0.75rem;">
+            <small style="color: #999; font-size: 0.75rem;">${heading}</small>
+            <div class="d-flex flex-wrap gap-1 mt-1">
+    `;
+    matches.forEach(match => {
+        const name = escapeHtml(match.name);
+        html += `
+                <button type="button" class="btn btn-sm" data-dish-name="${name}" style="border: 1px solid #ff6b35; color: #ff6b35; border-radius: 8px; font-size: 0.75rem; padding: 0.15rem 0.6rem;">
+                    ${name}
+                </button>
+        `;
+    });
+    html += `
+            </div>
+        </div>
+    `;
+    return html;
+}
+
+function displayDishDetails(dish, matches) {
+    let html = `
+        <div class="card" style="border: 2px solid #ff6b35; border-radius: 12px; overflow: hidden; box-shadow: 0 4px 15px rgba(255, 107, 53, 0.2);">
+            <div class="card-header" style="background: linear-gradient(135deg, #ff6b35, #ff8c42); color: white; padding: 0.75rem;">
+                <h6 class="mb-0" style="font-weight: 600; font-size: 0.9rem;">
+                    <i class="bi bi-check-circle-fill"></i> ${dish.name} Found!
+                </h6>
+            </div>
+            <div class="card-body" style="padding: 0.75rem;">
+                <p style="color: #666; font-size: 0.8rem; margin-bottom: 0.75rem;">${dish.description || 'No description available'}</p>
+
+                <div class="row mb-3">
+                    <div class="col-6">
+                        <small style="color: #999; font-size: 0.75rem;">Base Servings:</small>
+                        <div style="font-weight: 600; color: #333; font-size: 0.85rem;">${dish.base_servings} people</div>
+                    </div>
+                    <div class="col-6">
+                        <small style="color: #999; font-size: 0.75rem;">Markup:</small>
+                        <div style="font-weight: 600; color: #333; font-size: 0.85rem;">${dish.markup}%</div>
+                    </div>
+                </div>
+
+                <h6 style="font-weight: 600; color: #ff6b35; margin-bottom: 0.5rem; font-size: 0.85rem;">
+                    <i class="bi bi-basket2-fill"></i> Ingredients & Prices
+                </h6>
+                <div class="table-responsive">
+                    <table class="table table-sm" style="font-size: 0.75rem;">
+                        <thead style="background: #fff5f2;">
+                            <tr>
+                                <th style="color: #ff6b35; font-size: 0.75rem;">Ingredient</th>
+                                <th class="text-center" style="color: #ff6b35; font-size: 0.75rem;">Quantity</th>
+                                <th class="text-end" style="color: #ff6b35; font-size: 0.75rem;">Cost</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+    `;
+
+    dish.ingredients.forEach(ing => {
+        html += `
+            <tr>
+                <td style="font-weight: 600; color: #333;">${ing.name}</td>
+                <td class="text-center" style="color: #666;">${ing.quantity}${ing.unit}</td>
+                <td class="text-end" style="color: #333;">KSh ${ing.total_cost.toLocaleString()}</td>
+            </tr>
+        `;
+    });
+
+    html += `
+                        </tbody>
+                    </table>
+                </div>
+
+                <div style="background: #fff5f2; padding: 0.6rem; border-radius: 8px; margin-top: 0.75rem; border: 1px solid #ff6b35;">
+                    <div class="d-flex justify-content-between mb-2" style="font-size: 0.75rem;">
+                        <span style="color: #666;">Ingredients Cost:</span>
+                        <span style="font-weight: 600; color: #333;">KSh ${dish.total_base_cost.toLocaleString()}</span>
+                    </div>
+                    <div class="d-flex justify-content-between mb-2" style="font-size: 0.75rem;">
+                        <span style="color: #666;">Markup (${dish.markup}%):</span>
+                        <span style="font-weight: 600; color: #333;">KSh ${dish.markup_amount.toLocaleString()}</span>
+                    </div>
+                    <div class="d-flex justify-content-between" style="font-size: 0.85rem; font-weight: 700; color: #ff6b35;">
+                        <span>Base Price (${dish.base_servings} servings):</span>
+                        <span>KSh ${dish.base_selling_price.toLocaleString()}</span>
+                    </div>
+                </div>
+
+                <div class="text-center mt-3">
+                    <button class="btn" onclick="selectCustomDish('${dish.id}', '${dish.name}')" style="background: linear-gradient(135deg, #ff6b35, #ff8c42); color: white; border: none; border-radius: 8px; padding: 0.4rem 1.5rem; font-size: 0.85rem; font-weight: 600;">
+                        <i class="bi bi-plus-circle"></i> Select This Dish
+                    </button>
+                </div>
+                ${renderDishMatches(matches, 'Not the dish you meant? Other matches:')}
+            </div>
+        </div>
+    `;
+
+    document.getElementById('customDishResults').innerHTML = html;
+}
+
+function displayDishNotFound(dishName, matches) {
+    let html = `
+        <div class="card" style="border: 2px solid #ff6b35; border-radius: 12px; overflow: hidden;">
+            <div class="card-header" style="background: linear-gradient(135deg, #ff6b35, #ff8c42); color: white; padding: 0.75rem;">
+                <h6 class="mb-0" style="font-weight: 600; font-size: 0.9rem;">
+                    <i class="bi bi-exclamation-triangle-fill"></i> Dish Not Found
+                </h6>
+            </div>
+            <div class="card-body" style="padding: 1rem; text-align: center;">
+                <p style="font-size: 0.85rem; color: #666; margin-bottom: 1rem;">
+                    "${dishName}" is not currently in our menu database.
+                </p>
+                ${renderDishMatches(matches, 'Similar dishes on our menu:')}
+                <p style="font-size: 0.8rem; color: #666; margin-bottom: 1rem;">
+                    Would you like to request this dish? We'll send your request to our admin team.
+                </p>
+
+                <div class="mb-3">
+                    <textarea class="form-control" id="customDishNotes" rows="3" placeholder="Add any additional notes about this dish (optional)" style="border-radius: 8px; font-size: 0.8rem; border: 2px solid #ff6b35;"></textarea>
+                </div>
+
+                <button class="btn" onclick="requestCustomDish('${dishName}')" style="background: linear-gradient(135deg, #ff6b35, #ff8c42); color: white; border: none; border-radius: 8px; padding: 0.4rem 1.5rem; font-weight: 600; font-size: 0.85rem;">
+                    <i class="bi bi-envelope-fill"></i> Request This Dish
+                </button>
+            </div>
+        </div>
+    `;
+
+    document.getElementById('customDishResults').innerHTML = html;
+}
+
+window.selectCustomDish = function(dishId, dishName) {
+    console.log('=== SELECT CUSTOM DISH ===');
+    console.log('Dish ID:', dishId, 'Type:', typeof dishId);
+    console.log('Dish Name:', dishName);
+
+    if (customSelectedDishes.length >= MAX_CUSTOM_DISHES) {
+        alert('Maximum 10 custom dishes allowed');
+        return;
+    }
+
+    // Check if already selected
+    if (customSelectedDishes.find(d => d.id === dishId)) {
+        alert('This dish is already selected');
+        return;
+    }
+
+    customSelectedDishes.push({ id: dishId, name: dishName });
+    console.log('Custom dishes array after adding:', customSelectedDishes);
+    updateSelectedCustomDishes();
+
+    // Clear search
+    document.getElementById('customDishSearch').value = '';
+    document.getElementById('customDishResults').innerHTML = `
+        <div class="alert" style="background: #fff5f2; border: 2px solid #ff6b35; color: #ff6b35; border-radius: 8px; font-size: 0.85rem;">
+            <i class="bi bi-check-circle-fill"></i> "${dishName}" added to your selection!
+        </div>
+    `;
+};
+
+window.requestCustomDish = function(dishName) {
+    const notes = document.getElementById('customDishNotes').value;
+
+    // Show loading
+    document.getElementById('customDishResults').innerHTML = `
+        <div class="text-center py-3">
+            <div class="spinner-border" role="status" style="color: #ff6b35;">
+                <span class="visually-hidden">Loading...</span>
+            </div>
+            <p class="mt-2 mb-0" style="font-size: 0.8rem; color: #666;">Sending request...</p>
+        </div>
+    `;
+
+    fetch('/api/request-custom-dish', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/x-www-form-urlencoded',
+        },
+        body: new URLSearchParams({
+            'dish_name': dishName,
+            'notes': notes
+        })
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            document.getElementById('customDishResults').innerHTML = `
+                <div class="alert" style="background: #fff5f2; border: 2px solid #ff6b35; color: #ff6b35; border-radius: 8px; font-size: 0.85rem;">
+                    <i class="bi bi-check-circle-fill"></i> ${data.message}
+                </div>
+            `;
+        } else {
+            document.getElementById('customDishResults').innerHTML = `
+                <div class="alert" style="background: #fff5f2; border: 2px solid #ff6b35; color: #ff6b35; border-radius: 8px; font-size: 0.85rem;">
+                    <i class="bi bi-exclamation-triangle-fill"></i> ${data.message}
+                </div>
+            `;
+        }
+    })
+    .catch(error => {
+        document.getElementById('customDishResults').innerHTML = `
+            <div class="alert" style="background: #fff5f2; border: 2px solid #ff6b35; color: #ff6b35; border-radius: 8px; font-size: 0.85rem;">
+                <i class="bi bi-exclamation-triangle-fill"></i> Error sending request. Please try again.
+            </div>
+        `;
+        console.error('Error:', error);
+    });
+};
+
+function updateSelectedCustomDishes() {
+    if (customSelectedDishes.length === 0) {
+        document.getElementById('selectedCustomDishes').style.display = 'none';
+        return;
+    }
+
+    document.getElementById('selectedCustomDishes').style.display = 'block';
+    document.getElementById('customDishCount').textContent = customSelectedDishes.length;
+
+    let html = '';
+    customSelectedDishes.forEach((dish, index) => {
+        html += `
+            <div class="d-flex justify-content-between align-items-center p-2 mb-2" style="background: #fff5f2; border-radius: 8px; border: 2px solid #ff6b35;">
+                <span style="font-weight: 600; color: #333; font-size: 0.85rem;">
+                    <i class="bi bi-check-circle-fill" style="color: #ff6b35;"></i> ${dish.name}
+                </span>
+                <button class="btn btn-sm" onclick="removeCustomDish(${index})" style="background: #ff6b35; color: white; border: none; border-radius: 6px; padding: 0.25rem 0.5rem; font-size: 0.75rem;">
+                    <i class="bi bi-trash"></i>
+                </button>
+            </div>
+        `;
+    });
+
+    document.getElementById('selectedCustomDishesList').innerHTML = html;
+}
+
+window.removeCustomDish = function(index) {
+    customSelectedDishes.splice(index, 1);
+    updateSelectedCustomDishes();
+};
+
+// Add custom dishes to event
+document.getElementById('addCustomDishesBtn').addEventListener('click', function() {
+    if (customSelectedDishes.length === 0) {
+        alert('Please select at least one custom dish');
+        return;
+    }
+
+    // Update hidden input
+    const dishIds = customSelectedDishes.map(d => d.id);
+    document.getElementById('customDishesInput').value = JSON.stringify(dishIds);
+
+    // Update display
+    let displayHtml = '';
+    customSelectedDishes.forEach(dish => {
+        displayHtml += `
+            <span class="badge me-2 mb-2" style="background: linear-gradient(135deg, #6c757d, #5a6268); font-size: 0.8rem; padding: 0.4rem 0.8rem; border-radius: 8px;">
+                <i class="bi bi-star-fill"></i> ${dish.name}
+            </span>
+        `;
+    });
+    document.getElementById('customDishesListDisplay').innerHTML = displayHtml;
+    document.getElementById('customDishesDisplay').style.display = 'block';
+
+    // Close modal
+    bootstrap.Modal.getInstance(document.getElementById('customMenuModal')).hide();
+
+    // Show success message
+    alert(`${customSelectedDishes.length} custom dish${customSelectedDishes.length > 1 ? 'es' : ''} added to your event!`);
+});
+
+// Reset modal when closed
+document.getElementById('customMenuModal').addEventListener('hidden.bs.modal', function() {
+    document.getElementById('customDishSearch').value = '';
+    document.getElementById('customDishResults').innerHTML = `
+        <div class="text-center text-muted" style="padding: 2rem;">
+            <i class="bi bi-search" style="font-size: 3rem; opacity: 0.3;"></i>
+            <p style="margin-top: 1rem; font-size: 0.9rem;">Enter a dish name and click "Check" to see if it's available</p>
+        </div>
+    `;
+});
@@ -0,0 +1,142 @@
+let selectedRating = 0;
+let currentBookingId = null;
+
+// Rating modal functions
+function openRatingModal(bookingId, chefName) {
+    currentBookingId = bookingId;
+    selectedRating = 0;
+    document.getElementById('chefNameDisplay').textContent = chefName;
+    document.getElementById('ratingComment').value = '';
+    document.getElementById('ratingModal').classList.add('show');
+    updateStars();
+}
+
+function closeRatingModal() {
+    document.getElementById('ratingModal').classList.remove('show');
+}
+
+function updateStars() {
+    document.querySelectorAll('.rating-star').forEach((star, index) => {
+        if (index < selectedRating) {
+            star.classList.add('active');
+        } else {
+            star.classList.remove('active');
+        }
+    });
+}
+
+async function submitRating() {
+    if (selectedRating === 0) {
+        alert('Please select a rating');
+        return;
+    }
+
+    const submitBtn = document.getElementById('submitRatingBtn');
+    submitBtn.disabled = true;
+    submitBtn.innerHTML = '<i class="bi bi-hourglass-split"></i> Submitting...';
+
+    try {
+        const response = await fetch(`/booking/${currentBookingId}/rate`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                rating: selectedRating,
+                comment: document.getElementById('ratingComment').value
+            })
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            alert(data.message);
+            closeRatingModal();
+            location.reload();
+        } else {
+            alert(data.message || 'Failed to submit rating');
+            submitBtn.disabled = false;
+            submitBtn.innerHTML = '<i class="bi bi-send-fill"></i> Submit Rating';
+        }
+    } catch (error) {
+        console.error('Error submitting rating:', error);
+        alert('Failed to submit rating. Please try again.');
+        submitBtn.disabled = false;
+        submitBtn.innerHTML = '<i class="bi bi-send-fill"></i> Submit Rating';
+    }
+}
+
+// Event listeners
+document.addEventListener('DOMContentLoaded', function() {
+    // Star rating interaction
+    document.querySelectorAll('.rating-star').forEach(star => {
+        star.addEventListener('click', function() {
+            selectedRating = parseInt(this.dataset.rating);
+            updateStars();
+        });
+    });
+
+    // Rate chef buttons
+    document.querySelectorAll('.rate-chef-btn').forEach(btn => {
+        btn.addEventListener('click', function() {
+            const bookingId = this.dataset.bookingId;
+            const chefName = this.dataset.chefName;
+            openRatingModal(bookingId, chefName);
+        });
+    });
+
+    // Close modal on background click
+    document.getElementById('ratingModal').addEventListener('click', function(e) {
+        if (e.target === this) {
+            closeRatingModal();
+        }
+    });
+});
+
+// Add smooth scroll behavior
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+    anchor.addEventListener('click', function (e) {
+        e.preventDefault();
+        document.querySelector(this.getAttribute('href')).scrollIntoView({
+            behavior: 'smooth'
+        });
+    });
+});
+
+// Add ripple effect to buttons
+document.querySelectorAll('.create-event-btn, .action-btn, .empty-state-btn').forEach(button => {
+    button.addEventListener('click', function(e) {
+        const ripple = document.createElement('span');
+        const rect = this.getBoundingClientRect();
+        const size = Math.max(rect.width, rect.height);
+        const x = e.clientX - rect.left - size / 2;
+        const y = e.clientY - rect.top - size / 2;
+
+        ripple.style.width = ripple.style.height = size + 'px';
+        ripple.style.left = x + 'px';
+        ripple.style.top = y + 'px';
+        ripple.classList.add('ripple');
+
+        this.appendChild(ripple);
+
+        setTimeout(() => ripple.remove(), 600);
+    });
+});
+
+// Animate stats on scroll
+const observerOptions = {
+    threshold: 0.5,
+    rootMargin: '0px 0px -100px 0px'
+};
+
+const observer = new IntersectionObserver((entries) => {
+    entries.forEach(entry => {
+        if (entry.isIntersecting) {
+            entry.target.style.animation = 'fadeInUp 0.6s ease-out forwards';
+        }
+    });
+}, observerOptions);
+
+document.querySelectorAll('.stat-card').forEach(card => {
+    observer.observe(card);
+});
@@ -0,0 +1,468 @@
+// Image Slider Functionality
+document.addEventListener('DOMContentLoaded', function() {
+    // Left Triangle Slider
+    const slides = document.querySelectorAll('.hero-slide');
+    const dots = document.querySelectorAll('.slider-dot');
+    let currentSlide = 0;
+    const slideInterval = 5000; // 5 seconds
+
+    function showSlide(index) {
+        // Remove active class from all slides and dots
+        slides.forEach(slide => slide.classList.remove('active'));
+        dots.forEach(dot => dot.classList.remove('active'));
+
+        // Add active class to current slide and dot
+        slides[index].classList.add('active');
+        dots[index].classList.add('active');
+    }
+
+    function nextSlide() {
+        currentSlide = (currentSlide + 1) % slides.length;
+        showSlide(currentSlide);
+    }
+
+    // Auto-advance slides
+    let autoSlide = setInterval(nextSlide, slideInterval);
+
+    // Manual navigation with dots
+    dots.forEach((dot, index) => {
+        dot.addEventListener('click', () => {
+            currentSlide = index;
+            showSlide(currentSlide);
+            // Reset auto-advance timer
+            clearInterval(autoSlide);
+            autoSlide = setInterval(nextSlide, slideInterval);
+        });
+    });
+
+    // Right Triangle Slider (Independent with offset)
+    const slidesRight = document.querySelectorAll('.hero-slide-right');
+    let currentSlideRight = 0;
+    const slideIntervalRight = 5000; // 5 seconds (same as left triangle)
+
+    function showSlideRight(index) {
+        // Remove active class from all right slides
+        slidesRight.forEach(slide => slide.classList.remove('active'));
+
+        // Add active class to current right slide
+        slidesRight[index].classList.add('active');
+    }
+
+    function nextSlideRight() {
+        currentSlideRight = (currentSlideRight + 1) % slidesRight.length;
+        showSlideRight(currentSlideRight);
+    }
+
+    // Start right triangle slider after 2.5 second delay for alternating effect
+    setTimeout(() => {
+        let autoSlideRight = setInterval(nextSlideRight, slideIntervalRight);
+    }, 2500); // 2.5 second offset
+
+    // Chef Slider
+    const chefSlides = document.querySelectorAll('.chef-slide');
+    let currentChefSlide = 0;
+    const chefSlideInterval = 5000; // 5 seconds
+
+    function showChefSlide(index) {
+        chefSlides.forEach(slide => slide.classList.remove('active'));
+        chefSlides[index].classList.add('active');
+    }
+
+    function nextChefSlide() {
+        currentChefSlide = (currentChefSlide + 1) % chefSlides.length;
+        showChefSlide(currentChefSlide);
+    }
+
+    // Start chef slider
+    let autoChefSlide = setInterval(nextChefSlide, chefSlideInterval);
+
+    // Add click functionality to show chef name
+    chefSlides.forEach((slide, index) => {
+        slide.addEventListener('click', () => {
+            const overlay = slide.querySelector('.overlay h4');
+            overlay.style.color = '#ff6b6b';
+            overlay.style.fontSize = '1.8rem';
+            setTimeout(() => {
+                overlay.style.color = 'white';
+                overlay.style.fontSize = '1.5rem';
+            }, 1000);
+        });
+    });
+
+    // Ingredient Slider
+    const ingredientSlides = document.querySelectorAll('.ingredient-slide');
+    let currentIngredientSlide = 0;
+    const ingredientSlideInterval = 5000; // 5 seconds
+
+    function showIngredientSlide(index) {
+        ingredientSlides.forEach(slide => slide.classList.remove('active'));
+        ingredientSlides[index].classList.add('active');
+    }
+
+    function nextIngredientSlide() {
+        currentIngredientSlide = (currentIngredientSlide + 1) % ingredientSlides.length;
+        showIngredientSlide(currentIngredientSlide);
+    }
+
+    // Start ingredient slider
+    let autoIngredientSlide = setInterval(nextIngredientSlide, ingredientSlideInterval);
+
+    // M-Pesa Slider
+    const mpesaSlides = document.querySelectorAll('.mpesa-slide');
+    let currentMpesaSlide = 0;
+    const mpesaSlideInterval = 5000; // 5 seconds
+
+    function showMpesaSlide(index) {
+        mpesaSlides.forEach(slide => slide.classList.remove('active'));
+        mpesaSlides[index].classList.add('active');
+    }
+
+    function nextMpesaSlide() {
+        currentMpesaSlide = (currentMpesaSlide + 1) % mpesaSlides.length;
+        showMpesaSlide(currentMpesaSlide);
+    }
+
+    // Start mpesa slider
+    let autoMpesaSlide = setInterval(nextMpesaSlide, mpesaSlideInterval);
+});
+
+function scrollChefsSliderWelcome(direction) {
+    const slider = document.getElementById('chefsSliderWelcome');
+    const scrollAmount = 320;
+    if (direction === 'left') {
+        slider.scrollBy({ left: -scrollAmount, behavior: 'smooth' });
+    } else {
+        slider.scrollBy({ left: scrollAmount, behavior: 'smooth' });
+    }
+}
+
+// Auto-scroll chefs slider
+let chefsAutoScrollWelcome;
+function startChefsAutoScrollWelcome() {
+    chefsAutoScrollWelcome = setInterval(() => {
+        const slider = document.getElementById('chefsSliderWelcome');
+        if (slider && slider.scrollLeft + slider.clientWidth >= slider.scrollWidth - 10) {
+            slider.scrollTo({ left: 0, behavior: 'smooth' });
+        } else if (slider) {
+            slider.scrollBy({ left: 320, behavior: 'smooth' });
+        }
+    }, 5000);
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const chefsSlider = document.getElementById('chefsSliderWelcome');
+    if (chefsSlider) {
+        startChefsAutoScrollWelcome();
+
+        chefsSlider.addEventListener('mouseenter', () => {
+            clearInterval(chefsAutoScrollWelcome);
+        });
+
+        chefsSlider.addEventListener('mouseleave', () => {
+            startChefsAutoScrollWelcome();
+        });
+    }
+});
+
+// Set on the bundle's <script> tag by the template
+const defaultChefPhoto = document.currentScript.dataset.defaultChefPhoto;
+
+// Reviews Slider Functionality for Welcome Page
+document.addEventListener('DOMContentLoaded', () => {
+    // Generate Particles
+    const particlesContainer = document.getElementById('particles');
+    const particleCount = 50;
+
+    if (particlesContainer) {
+        for (let i = 0; i < particleCount; i++) {
+            const particle = document.createElement('div');
+            particle.className = 'particle';
+            particle.style.left = Math.random() * 100 + '%';
+            particle.style.animationDelay = Math.random() * 15 + 's';
+            particle.style.animationDuration = (Math.random() * 10 + 10) + 's';
+            particlesContainer.appendChild(particle);
+        }
+    }
+
+    // Parallax Effect on Mouse Move
+    document.addEventListener('mousemove', (e) => {
+        const orbs = document.querySelectorAll('.orb');
+        const mouseX = e.clientX / window.innerWidth;
+        const mouseY = e.clientY / window.innerHeight;
+
+        orbs.forEach((orb, index) => {
+            const speed = (index + 1) * 30;
+            const x = (mouseX - 0.5) * speed;
+            const y = (mouseY - 0.5) * speed;
+            orb.style.transform = `translate(${x}px, ${y}px)`;
+        });
+    });
+
+    // Smooth Scroll for Scroll Indicator
+    document.querySelector('.scroll-indicator')?.addEventListener('click', () => {
+        window.scrollTo({
+            top: window.innerHeight,
+            behavior: 'smooth'
+        });
+    });
+
+    // Add 3D Tilt Effect to Glass Cards
+    const cards = document.querySelectorAll('.glass-card');
+    cards.forEach(card => {
+        card.addEventListener('mousemove', (e) => {
+            const rect = card.getBoundingClientRect();
+            const x = e.clientX - rect.left;
+            const y = e.clientY - rect.top;
+
+            const centerX = rect.width / 2;
+            const centerY = rect.height / 2;
+
+            const rotateX = (y - centerY) / 10;
+            const rotateY = (centerX - x) / 10;
+
+            card.style.transform = `translateY(-15px) perspective(1000px) rotateX(${rotateX}deg) rotateY(${rotateY}deg)`;
+        });
+
+        card.addEventListener('mouseleave', () => {
+            card.style.transform = 'translateY(0) perspective(1000px) rotateX(0) rotateY(0)';
+        });
+    });
+    // Add ripple animation
+    const style = document.createElement('style');
+    style.textContent = `
+        @keyframes ripple {
+            to {
+                transform: scale(4);
+                opacity: 0;
+            }
+        }
+    `;
+    document.head.appendChild(style);
+
+    // Button Ripple Effect
+    document.querySelectorAll('.modern-btn').forEach(btn => {
+        btn.addEventListener('click', function(e) {
+            const ripple = document.createElement('span');
+            const rect = this.getBoundingClientRect();
+            const size = Math.max(rect.width, rect.height);
+            const x = e.clientX - rect.left - size / 2;
+            const y = e.clientY - rect.top - size / 2;
+
+            ripple.style.cssText = `
+                position: absolute;
+                width: ${size}px;
+                height: ${size}px;
+                left: ${x}px;
+                top: ${y}px;
+                background: rgba(255, 255, 255, 0.5);
+                border-radius: 50%;
+                transform: scale(0);
+                animation: ripple 0.6s ease-out;
+                pointer-events: none;
+            `;
+
+            this.appendChild(ripple);
+            setTimeout(() => ripple.remove(), 600);
+        });
+    });
+    const reviewsSlider = document.getElementById('reviewsSliderWelcome');
+    const prevBtn = document.getElementById('prevReviewWelcome');
+    const nextBtn = document.getElementById('nextReviewWelcome');
+
+    let autoSlideInterval;
+    let currentScrollPosition = 0;
+
+    // Fetch and display reviews
+    async function loadReviews() {
+        console.log('Loading reviews (Welcome page)...');
+
+        try {
+            const response = await fetch('/api/reviews');
+            console.log('Response status:', response.status);
+
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+
+            const reviews = await response.json();
+            console.log('Loaded reviews:', reviews.length);
+
+            // Clear loading state
+            reviewsSlider.innerHTML = '';
+
+            if (reviews.length === 0) {
+                reviewsSlider.innerHTML = `
+                    <div class="review-card no-reviews">
+                        <i class="fas fa-star" style="font-size: 3rem; color: #ffd700; margin-bottom: 1rem;"></i>
+                        <p>No reviews yet. Be the first to share your experience!</p>
+                    </div>
+                `;
+                return;
+            }
+
+            reviewsSlider.innerHTML = reviews.map(review => `
+                <div class="review-card">
+                    <div class="review-stars">
+                        ${'<i class="fas fa-star"></i>'.repeat(review.rating)}
+                        ${'<i class="far fa-star"></i>'.repeat(5 - review.rating)}
+                    </div>
+                    <p class="review-text">"${review.review_text}"</p>
+                    <div class="review-footer">
+                        <div class="review-author">
+                            <div class="author-icon">${review.customer_name.charAt(0).toUpperCase()}</div>
+                            <div>
+                                <div class="author-name">${review.customer_name}</div>
+                                <div class="event-badge">${review.event_type}</div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `).join('');
+
+            startAutoSlide();
+        } catch (error) {
+            console.error('Error loading reviews:', error);
+            reviewsSlider.innerHTML = `
+                <div class="review-card error-card">
+                    <i class="fas fa-exclamation-circle" style="font-size: 3rem; color: #ff6b6b; margin-bottom: 1rem;"></i>
+                    <p>Failed to load reviews. Please try again later.</p>
+                    <p style="font-size: 0.9rem; color: #666; margin-top: 10px;">Error: ${error.message}</p>
+                </div>
+            `;
+        }
+    }
+
+    // Slider navigation
+    function slideNext() {
+        const cardWidth = reviewsSlider.querySelector('.review-card')?.offsetWidth || 0;
+        const gap = 20;
+        const scrollAmount = cardWidth + gap;
+        const maxScroll = reviewsSlider.scrollWidth - reviewsSlider.clientWidth;
+
+        currentScrollPosition += scrollAmount;
+        if (currentScrollPosition > maxScroll) {
+            currentScrollPosition = 0;
+        }
+
+        reviewsSlider.scrollTo({
+            left: currentScrollPosition,
+            behavior: 'smooth'
+        });
+    }
+
+    function slidePrev() {
+        const cardWidth = reviewsSlider.querySelector('.review-card')?.offsetWidth || 0;
+        const gap = 20;
+        const scrollAmount = cardWidth + gap;
+
+        currentScrollPosition -= scrollAmount;
+        if (currentScrollPosition < 0) {
+            currentScrollPosition = reviewsSlider.scrollWidth - reviewsSlider.clientWidth;
+        }
+
+        reviewsSlider.scrollTo({
+            left: currentScrollPosition,
+            behavior: 'smooth'
+        });
+    }
+
+    // Auto-slide functionality
+    function startAutoSlide() {
+        autoSlideInterval = setInterval(slideNext, 5000);
+    }
+
+    function stopAutoSlide() {
+        clearInterval(autoSlideInterval);
+    }
+
+    // Event listeners for navigation
+    nextBtn?.addEventListener('click', () => {
+        stopAutoSlide();
+        slideNext();
+        startAutoSlide();
+    });
+
+    prevBtn?.addEventListener('click', () => {
+        stopAutoSlide();
+        slidePrev();
+        startAutoSlide();
+    });
+
+    // Pause auto-slide on hover
+    reviewsSlider?.addEventListener('mouseenter', stopAutoSlide);
+    reviewsSlider?.addEventListener('mouseleave', startAutoSlide);
+
+    // Load reviews on page load
+    loadReviews();
+});
+
+// Chef Profile Modal Functions
+async function viewChefProfile(chefId) {
+    try {
+        const response = await fetch(`/api/chef/${chefId}/profile`);
+        if (!response.ok) {
+            throw new Error('Failed to fetch chef profile');
+        }
+        const chef = await response.json();
+        showChefProfileModal(chef);
+    } catch (error) {
+        console.error('Error fetching chef profile:', error);
+        alert('Unable to load chef profile. Please try again.');
+    }
+}
+
+function showChefProfileModal(chef) {
+    // Populate modal with chef data
+    let photoUrl = chef.photo_url || defaultChefPhoto;
+    // Ensure photo URL starts with /
+    if (photoUrl && !photoUrl.startsWith('/') && !photoUrl.startsWith('http')) {
+        photoUrl = '/' + photoUrl;
+    }
+    document.getElementById('modalChefPhoto').src = photoUrl;
+    document.getElementById('modalChefName').textContent = chef.name;
+    document.getElementById('modalChefEmail').textContent = chef.email;
+    document.getElementById('modalChefPhone').textContent = chef.phone;
+    document.getElementById('modalChefLocation').textContent = chef.location;
+    document.getElementById('modalChefBio').textContent = chef.bio || 'No bio available';
+
+    // Build carousel
+    const carouselIndicators = document.getElementById('carouselIndicators');
+    const carouselInner = document.getElementById('carouselInner');
+    const carouselSection = document.getElementById('carouselSection');
+    const noImagesMessage = document.getElementById('noImagesMessage');
+    const imageCounter = document.getElementById('imageCounter');
+
+    // Clear previous content
+    carouselIndicators.innerHTML = '';
+    carouselInner.innerHTML = '';
+
+    if (chef.images && chef.images.length > 0) {
+        carouselSection.style.display = 'block';
+        noImagesMessage.style.display = 'none';
+        imageCounter.textContent = `${chef.images.length} Photo${chef.images.length > 1 ? 's' : ''}`;
+
+        // Add indicators and slides
+        chef.images.forEach((image, index) => {
+            // Add indicator
+            const indicator = document.createElement('button');
+            indicator.type = 'button';
+            indicator.setAttribute('data-bs-target', '#chefCarousel');
+            indicator.setAttribute('data-bs-slide-to', index);
+            if (index === 0) indicator.classList.add('active');
+            carouselIndicators.appendChild(indicator);
+
+            // Add slide
+            const slide = document.createElement('div');
+            slide.className = index === 0 ? 'carousel-item active' : 'carousel-item';
+            slide.innerHTML = `<img src="/static/images/chefs/${image}" class="d-block w-100" alt="Chef Portfolio" style="height: 300px; object-fit: cover; border-radius: 8px;">`;
+            carouselInner.appendChild(slide);
+        });
+    } else {
+        carouselSection.style.display = 'none';
+        noImagesMessage.style.display = 'block';
+    }
+
+    // Show modal
+    const modal = new bootstrap.Modal(document.getElementById('chefProfileModal'));
+    modal.show();
+}
@@ -0,0 +1,89 @@
+"""
+Compressed size and CPU cost of the on-the-fly compression levels (compression.py)
+on real responses: the welcome page HTML and a 100-review /api/reviews page.
+
+Bodies are rendered once from seeded in-memory databases with compression off,
+then compressed repeatedly at each gzip level / brotli quality; CPU time is
+process time per response. Pick COMPRESSION_GZIP_LEVEL / COMPRESSION_BROTLI_QUALITY
+from the knee of the curve: beyond it, CPU grows much faster than bytes shrink.
+
+Usage: python benchmarks/compression.py [--runs=50]
+"""
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app_factory import create_app
+from compression import BrotliStream, GzipStream, brotli
+from models import db, Chef, Review, User
+
+GZIP_LEVELS = (1, 6, 9)
+BROTLI_QUALITIES = (1, 4, 6, 11)
+
+
+def seed():
+    now = datetime.utcnow()
+    for i in range(12):
+        user = User(email=f'chef{i}@example.com', role='chef')
+        user.password_hash = 'x'
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(Chef(user_id=user.id, name=f'Chef {i}', phone=f'2547000{i:05d}', county='Mombasa',
+                            sub_county='Mvita', town='Old Town', about='Coastal and Swahili cuisine. ' * 4,
+                            meals_offered='Pilau, Biryani', is_verified=True, is_approved=True))
+    for i in range(100):
+        db.session.add(Review(customer_name=f'Customer {i}', event_type=('Wedding', 'Birthday', 'Corporate')[i % 3],
+                              rating=1 + i % 5, review_text=f'The food at our event was great, review number {i}.',
+                              is_approved=True, created_at=now - timedelta(hours=i)))
+    db.session.commit()
+
+
+def render_bodies():
+    app = create_app({'DATABASE_URL': 'sqlite://', 'DISH_DATABASE_URL': 'sqlite://', 'TESTING': True,
+                      'COMPRESSION_ENABLED': False})
+    with app.app_context():
+        db.create_all()
+        seed()
+        client = app.test_client()
+        return {
+            'welcome page (HTML)': client.get('/').data,
+            '/api/reviews?limit=100 (JSON)': client.get('/api/reviews?limit=100').data,
+        }
+
+
+def measure(make_stream, body, runs):
+    started = time.process_time()
+    for _ in range(runs):
+        stream = make_stream()
+        size = len(stream.compress(body) + stream.finish())
+    return size, (time.process_time() - started) / runs * 1000
+
+
+def main(argv):
+    runs = 50
+    for arg in argv:
+        if arg.startswith('--runs='):
+            runs = int(arg.split('=', 1)[1])
+
+    candidates = [(f'gzip -{level}', lambda level=level: GzipStream(level)) for level in GZIP_LEVELS]
+    if brotli is not None:
+        candidates += [(f'brotli q{quality}', lambda quality=quality: BrotliStream(quality))
+                       for quality in BROTLI_QUALITIES]
+    else:
+        print("brotli not installed: gzip only (pip install brotli)\n")
+
+    for name, body in render_bodies().items():
+        print(f"{name}: {len(body)} bytes")
+        print(f"  {'encoding':<12}{'bytes':>10}{'ratio':>8}{'cpu ms':>10}")
+        for label, make_stream in candidates:
+            size, cpu_ms = measure(make_stream, body, runs)
+            print(f"  {label:<12}{size:>10}{size / len(body):>8.1%}{cpu_ms:>10.3f}")
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
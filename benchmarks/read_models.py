@@ -0,0 +1,95 @@
+"""
+Chef list loading: full Chef entities vs slotted ChefSummary rows (read_models.py).
+
+Seeds a throwaway SQLite database with --chefs chefs (default 10000, each with
+a ~1 KB 'about'), then loads the admin manage-chefs list both ways and reports
+median latency and peak Python memory (tracemalloc). 'entities + email' also
+touches chef.user.email per row, as the list templates used to.
+
+Usage: python benchmarks/read_models.py [--chefs=10000] [--runs=5]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app_factory import create_app
+from models import db, User, Chef
+from read_models import chef_summaries
+
+ABOUT = 'Swahili and coastal cuisine, pilau, biryani and nyama choma for weddings and parties. ' * 12
+
+
+def seed(count):
+    db.session.execute(User.__table__.insert(), [
+        {'id': i, 'email': f'chef{i}@example.com', 'password_hash': 'x', 'role': 'chef'} for i in range(1, count + 1)
+    ])
+    db.session.execute(Chef.__table__.insert(), [
+        {'user_id': i, 'name': f'Chef {i}', 'phone': '254700000000', 'county': 'Nairobi', 'sub_county': 'Westlands',
+         'town': 'Parklands', 'about': ABOUT, 'meals_offered': 'Pilau,Biryani', 'is_verified': True,
+         'is_approved': i % 3 != 0, 'rating_total': i % 50, 'rating_count': i % 10}
+        for i in range(1, count + 1)
+    ])
+    db.session.commit()
+
+
+def load_entities():
+    return Chef.query.order_by(Chef.created_at.desc()).all()
+
+
+def load_entities_with_email():
+    chefs = load_entities()
+    for chef in chefs:
+        chef.user.email
+    return chefs
+
+
+def load_summaries():
+    return chef_summaries(Chef.query.order_by(Chef.created_at.desc()), about_chars=100)
+
+
+def measure(loader, runs):
+    timings = []
+    for _ in range(runs):
+        db.session.expunge_all()
+        started = time.perf_counter()
+        loader()
+        timings.append(time.perf_counter() - started)
+    db.session.expunge_all()
+    tracemalloc.start()
+    result = loader()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    db.session.expunge_all()
+    return statistics.median(timings), peak
+
+
+def main(argv):
+    options = dict(arg[2:].split('=', 1) for arg in argv if arg.startswith('--') and '=' in arg)
+    count = int(options.get('chefs', 10000))
+    runs = int(options.get('runs', 5))
+
+    with tempfile.TemporaryDirectory() as workdir:
+        url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+        app = create_app({'DATABASE_URL': url, 'DISH_DATABASE_URL': 'sqlite://', 'TEMPLATE_WARMUP': False})
+        with app.app_context():
+            db.create_all()
+            seed(count)
+            print(f"{count} chefs, median of {runs} runs")
+            print(f"  {'loader':<20}{'ms':>10}{'peak MiB':>12}")
+            for label, loader in (('entities', load_entities), ('entities + email', load_entities_with_email),
+                                  ('summaries', load_summaries)):
+                seconds, peak = measure(loader, runs)
+                print(f"  {label:<20}{seconds * 1000:>10.1f}{peak / 2 ** 20:>12.1f}")
+            db.session.remove()
+            db.engine.dispose()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
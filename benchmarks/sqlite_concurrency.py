@@ -0,0 +1,130 @@
+"""
+Concurrent read/write throughput of SQLite with default settings vs the
+db_engine.py pragmas (WAL, synchronous=NORMAL, mmap, cache, busy_timeout).
+
+Reader threads run the homepage chef query while writer threads commit
+payment-style inserts, against a throwaway database file.
+
+Usage: python benchmarks/sqlite_concurrency.py [--seconds=5] [--readers=8] [--writers=2]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from db_engine import DEFAULT_PRAGMAS, tune_engine
+
+CHEFS = 2000
+READ_SQL = text(
+    'SELECT id, name, ranking_score FROM chef WHERE is_verified = 1 AND is_approved = 1 '
+    'ORDER BY is_featured DESC, featured_priority DESC, ranking_score DESC LIMIT 12'
+)
+WRITE_SQL = text(
+    "INSERT INTO payment (booking_id, phone_number, amount, status, created_at) "
+    "VALUES (:booking_id, '254700000000', 300, 'completed', CURRENT_TIMESTAMP)"
+)
+
+
+def create_database(path):
+    engine = create_engine(f'sqlite:///{path}')
+    with engine.begin() as conn:
+        conn.execute(text(
+            'CREATE TABLE chef (id INTEGER PRIMARY KEY, name VARCHAR(100), is_verified BOOLEAN, '
+            'is_approved BOOLEAN, is_featured BOOLEAN, featured_priority INTEGER, ranking_score FLOAT)'
+        ))
+        conn.execute(text('CREATE INDEX ix_chef_ranking ON chef (is_featured, featured_priority, ranking_score)'))
+        conn.execute(text(
+            'CREATE TABLE payment (id INTEGER PRIMARY KEY, booking_id INTEGER, phone_number VARCHAR(20), '
+            'amount FLOAT, status VARCHAR(20), created_at DATETIME)'
+        ))
+        conn.execute(text(
+            'INSERT INTO chef (name, is_verified, is_approved, is_featured, featured_priority, ranking_score) '
+            'VALUES (:name, 1, 1, :featured, 0, :score)'
+        ), [{'name': f'Chef {i}', 'featured': i % 50 == 0, 'score': (i * 7919) % 500 / 100} for i in range(CHEFS)])
+    engine.dispose()
+
+
+# SQLite's defaults, plus the same lock wait as the tuned run so only journaling differs
+BASELINE_PRAGMAS = {'busy_timeout': DEFAULT_PRAGMAS['busy_timeout'], 'journal_mode': 'DELETE', 'synchronous': 'FULL'}
+
+
+def run(path, pragmas, seconds, readers, writers):
+    engine = create_engine(f'sqlite:///{path}', pool_size=readers + writers)
+    tune_engine(engine, pragmas)
+
+    counts = {'reads': 0, 'writes': 0, 'errors': 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def bump(key):
+        with lock:
+            counts[key] += 1
+
+    def reader():
+        with engine.connect() as conn:
+            while time.perf_counter() < deadline:
+                try:
+                    conn.execute(READ_SQL).fetchall()
+                    conn.commit()
+                    bump('reads')
+                except OperationalError:
+                    conn.rollback()
+                    bump('errors')
+
+    def writer(worker):
+        with engine.connect() as conn:
+            i = 0
+            while time.perf_counter() < deadline:
+                try:
+                    conn.execute(WRITE_SQL, {'booking_id': worker * 1_000_000 + i})
+                    conn.commit()
+                    bump('writes')
+                except OperationalError:
+                    conn.rollback()
+                    bump('errors')
+                i += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(w,)) for w in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    return {key: value / seconds for key, value in counts.items()}
+
+
+def main(argv):
+    options = dict(arg[2:].split('=', 1) for arg in argv if arg.startswith('--') and '=' in arg)
+    seconds = float(options.get('seconds', 5))
+    readers = int(options.get('readers', 8))
+    writers = int(options.get('writers', 2))
+
+    workdir = tempfile.mkdtemp(prefix='sqlite-bench-')
+    try:
+        results = {}
+        for label, pragmas in (('default', BASELINE_PRAGMAS), ('tuned', DEFAULT_PRAGMAS)):
+            path = os.path.join(workdir, f'{label}.db')
+            create_database(path)
+            results[label] = run(path, pragmas, seconds, readers, writers)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"{readers} readers, {writers} writers, {seconds:g}s per run")
+    print(f"{'':10}{'reads/s':>12}{'writes/s':>12}{'errors/s':>12}")
+    for label, result in results.items():
+        print(f"{label:10}{result['reads']:12.0f}{result['writes']:12.0f}{result['errors']:12.1f}")
+    if results['default']['writes']:
+        print(f"\nwrites x{results['tuned']['writes'] / results['default']['writes']:.1f}, "
+              f"reads x{results['tuned']['reads'] / max(results['default']['reads'], 1):.1f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
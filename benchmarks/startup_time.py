@@ -0,0 +1,83 @@
+"""
+Cold-start time of a worker: a fresh interpreter importing main (create_app()
+with every blueprint registered), as each pre-forked gunicorn worker does.
+
+Also lists which heavy optional dependencies were imported at start-up; these
+should only load when the routes that use them run, and times the first and
+second render of a few template-heavy pages: a first request that is much
+slower than the second is paying for template compilation.
+
+Usage: python benchmarks/startup_time.py [path/to/tree] [--runs=15]
+
+Pass another checkout (e.g. a 'git worktree add' of an older commit) to compare.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('reportlab', 'requests', 'smtplib', 'email.mime.multipart')
+PAGES = ('/', '/login', '/chef/register')
+
+PROBE = f"""
+import json, sys, time
+started = time.perf_counter()
+import main
+elapsed = time.perf_counter() - started
+loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+
+from models import db
+with main.app.app_context():
+    db.create_all()
+client = main.app.test_client()
+requests = []
+for _ in range(2):
+    started = time.perf_counter()
+    for page in {PAGES!r}:
+        client.get(page)
+    requests.append(time.perf_counter() - started)
+print(json.dumps({{'import_seconds': elapsed, 'loaded': loaded, 'requests': requests}}))
+"""
+
+
+def measure(tree):
+    # In-memory databases: creating the app must not touch instance/
+    env = dict(os.environ, DATABASE_URL='sqlite://', DISH_DATABASE_URL='sqlite://', LOG_LEVEL='WARNING')
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', PROBE], cwd=tree, env=env, capture_output=True, text=True, check=True)
+    total = time.perf_counter() - started
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    return total, probe['import_seconds'], probe['loaded'], probe['requests']
+
+
+def main(argv):
+    options = dict(arg[2:].split('=', 1) for arg in argv if arg.startswith('--') and '=' in arg)
+    runs = int(options.get('runs', 15))
+    paths = [arg for arg in argv if not arg.startswith('--')]
+    tree = os.path.abspath(paths[0] if paths else ROOT)
+
+    measure(tree)  # warm the filesystem cache and __pycache__
+    samples = [measure(tree) for _ in range(runs)]
+    totals = [total for total, _, _, _ in samples]
+    imports = [seconds for _, seconds, _, _ in samples]
+    first = [requests[0] for _, _, _, requests in samples]
+    second = [requests[1] for _, _, _, requests in samples]
+
+    print(f"{tree}: {runs} cold starts")
+    print(f"  process (interpreter + import main)  median {statistics.median(totals) * 1000:7.1f} ms  "
+          f"min {min(totals) * 1000:7.1f} ms")
+    print(f"  import main                          median {statistics.median(imports) * 1000:7.1f} ms  "
+          f"min {min(imports) * 1000:7.1f} ms")
+    print(f"  first request to {', '.join(PAGES)}")
+    print(f"                                       median {statistics.median(first) * 1000:7.1f} ms  "
+          f"min {min(first) * 1000:7.1f} ms")
+    print(f"  same requests again                  median {statistics.median(second) * 1000:7.1f} ms  "
+          f"min {min(second) * 1000:7.1f} ms")
+    print(f"  heavy modules loaded at start-up: {', '.join(samples[-1][2]) or 'none'}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,33 @@
+"""
+Route blueprints, registered on the app by create_app() (see app_factory.py).
+
+Endpoints are namespaced by blueprint, e.g. url_for('customer.create_event');
+URLs are unchanged. Heavy dependencies (reportlab, smtplib) are imported inside
+the routes that need them so worker start-up stays cheap.
+"""
+from functools import wraps
+
+from flask import flash, redirect, url_for
+from flask_login import login_required, current_user
+
+BLUEPRINTS = ('public', 'auth', 'customer', 'payments', 'chef', 'verification', 'admin', 'reports')
+
+
+def role_required(role):
+    def decorator(f):
+        @wraps(f)
+        @login_required
+        def decorated_function(*args, **kwargs):
+            if current_user.role != role:
+                flash('Access denied. Insufficient permissions.', 'danger')
+                return redirect(url_for('public.index'))
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+
+def register_blueprints(app):
+    import importlib
+
+    for name in BLUEPRINTS:
+        app.register_blueprint(importlib.import_module(f'blueprints.{name}').bp)
@@ -0,0 +1,893 @@
+"""
+Admin dashboard: chef approval, menu and dishes, settings, reviews and featured chefs.
+"""
+from flask import Blueprint, flash, jsonify, redirect, render_template, request, url_for
+from datetime import datetime
+from models import db, Booking, Chef, Dish, DishIngredient, Ingredient, MenuItem, MpesaConfig, Review, SystemConfig, User
+from custom_dish_models import CustomDish, CustomDishIngredient, CustomIngredient
+from reviews_feed import InvalidCursor, invalidate_reviews_cache
+from chef_ratings import add_chef_rating, reset_chef_rating
+from chef_ranking import ranked_order, refresh_chef_ranking, refresh_chef_rankings
+from review_stats import invalidate_summary_cache, record_review_approved, record_review_removed
+from read_models import chef_summaries
+from chef_search import DEFAULT_PAGE_SIZE, chef_counties, chef_counts, parse_filters, search_chefs, serialize_chef
+from verification import SMS_VERIFICATION_KEY
+from fragment_cache import invalidate_fragments
+from identity import invalidate_identity
+from mail_outbox import enqueue_emails, flush_outbox
+from chef_deletion import delete_chefs, schedule_purge, soft_delete_chef
+from dish_search import invalidate_dish_vocabulary
+from blueprints import role_required
+
+bp = Blueprint('admin', __name__)
+
+
+@bp.route('/admin/dashboard')
+@role_required('admin')
+def admin_dashboard():
+    pending_chefs = chef_summaries(Chef.query.filter_by(is_verified=True, is_approved=False, deleted_at=None))
+    approved_chefs = chef_summaries(Chef.query.filter_by(is_approved=True))
+    total_bookings = Booking.query.count()
+    confirmed_bookings = Booking.query.filter_by(status='confirmed').count()
+    
+    return render_template('admin_dashboard.html',
+                         pending_chefs=pending_chefs,
+                         approved_chefs=approved_chefs,
+                         total_bookings=total_bookings,
+                         confirmed_bookings=confirmed_bookings)
+
+
+def chef_approval_email(name, email):
+    """Approval email with login details for a chef, as an outbox message (see mail_outbox)"""
+    # Plain text version
+    text_body = f"""
+Dear {name},
+
+Congratulations! We are thrilled to inform you that your chef application has been approved!
+
+Your Login Credentials:
+Email: {email}
+Password: [The password you created during registration]
+
+You can now log in to your chef dashboard and start:
+- Managing your profile
+- Accepting booking requests
+- Showcasing your culinary expertise
+- Connecting with food lovers
+
+Login here: {request.url_root}login
+
+Welcome to the e-Rugah family! We're excited to have you on board.
+
+Best regards,
+The e-Rugah Team
+
+---
+This is an automated message from e-Rugah
+Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+    """
+    
+    # HTML version
+    html_body = f"""
+    <html>
+        <body style="font-family: Arial, sans-serif; padding: 20px; background-color: #f5f5f5;">
+            <div style="max-width: 600px; margin: 0 auto; background-color: white; padding: 40px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                <div style="text-align: center; margin-bottom: 30px;">
+                    <h1 style="color: #ff6b35; margin: 0; font-size: 28px;">🎉 Congratulations!</h1>
+                </div>
+                
+                <p style="font-size: 16px; color: #333; line-height: 1.6;">Dear <strong>{name}</strong>,</p>
+                
+                <p style="font-size: 16px; color: #333; line-height: 1.6;">
+                    We are thrilled to inform you that your chef application has been <strong style="color: #10b981;">approved</strong>!
+                </p>
+                
+                <div style="background: linear-gradient(135deg, #fff8f5 0%, #ffe8dc 100%); padding: 25px; border-radius: 10px; margin: 25px 0; border-left: 4px solid #ff6b35;">
+                    <h3 style="color: #ff6b35; margin-top: 0; margin-bottom: 15px;">Your Login Credentials</h3>
+                    <p style="margin: 10px 0; color: #333;"><strong>Email:</strong> <span style="color: #ff6b35;">{email}</span></p>
+                    <p style="margin: 10px 0; color: #333;"><strong>Password:</strong> [The password you created during registration]</p>
+                </div>
+                
+                <div style="margin: 25px 0;">
+                    <h3 style="color: #333; margin-bottom: 15px;">You can now:</h3>
+                    <ul style="color: #666; line-height: 1.8;">
+                        <li>✅ Manage your profile</li>
+                        <li>✅ Accept booking requests</li>
+                        <li>✅ Showcase your culinary expertise</li>
+                        <li>✅ Connect with food lovers</li>
+                    </ul>
+                </div>
+                
+                <div style="text-align: center; margin: 30px 0;">
+                    <a href="{request.url_root}login" style="display: inline-block; background: linear-gradient(135deg, #ff6b35, #ff8c42); color: white; padding: 15px 40px; text-decoration: none; border-radius: 25px; font-weight: bold; font-size: 16px; box-shadow: 0 4px 15px rgba(255, 107, 53, 0.3);">
+                        Login to Dashboard
+                    </a>
+                </div>
+                
+                <p style="font-size: 16px; color: #333; line-height: 1.6; margin-top: 30px;">
+                    Welcome to the e-Rugah family! We're excited to have you on board.
+                </p>
+                
+                <p style="font-size: 16px; color: #333; line-height: 1.6;">
+                    Best regards,<br>
+                    <strong style="color: #ff6b35;">The e-Rugah Team</strong>
+                </p>
+                
+                <hr style="border: none; border-top: 1px solid #ddd; margin: 30px 0;">
+                
+                <p style="color: #999; font-size: 12px; text-align: center; margin: 10px 0;">
+                    This is an automated message from e-Rugah<br>
+                    Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+                </p>
+            </div>
+        </body>
+    </html>
+    """
+
+    return {
+        'to_address': email,
+        'subject': '🎉 Congratulations! Your e-Rugah Chef Account is Approved',
+        'text_body': text_body,
+        'html_body': html_body,
+    }
+
+
+@bp.route('/admin/chef/<int:chef_id>/approve')
+@role_required('admin')
+def approve_chef(chef_id):
+    chef = Chef.query.filter_by(id=chef_id, deleted_at=None).first_or_404()
+    chef.is_approved = True
+    refresh_chef_ranking(chef.id)
+    enqueue_emails([chef_approval_email(chef.name, chef.user.email)])
+    db.session.commit()
+    invalidate_fragments('featured_chefs')
+    flush_outbox()
+
+    flash(f'Chef {chef.name} approved successfully! Approval email queued.', 'success')
+    return redirect(url_for('admin.admin_dashboard'))
+
+
+@bp.route('/admin/chef/<int:chef_id>/reject')
+@role_required('admin')
+def reject_chef(chef_id):
+    chef = Chef.query.get_or_404(chef_id)
+    chef.is_approved = False
+    db.session.commit()
+    invalidate_fragments('featured_chefs')
+    flash(f'Chef {chef.name} rejected.', 'warning')
+    return redirect(url_for('admin.admin_dashboard'))
+
+
+# Bulk action -> (past tense for the flash message, column values set)
+BULK_CHEF_ACTIONS = {
+    'approve': ('approved', {Chef.is_approved: True}),
+    'reject': ('rejected', {Chef.is_approved: False}),
+    'feature': ('featured', {Chef.is_featured: True}),
+    'unfeature': ('unfeatured', {Chef.is_featured: False, Chef.featured_priority: 0}),
+}
+
+
+@bp.route('/admin/chefs/bulk', methods=['POST'])
+@role_required('admin')
+def admin_bulk_chefs():
+    """Approve, reject, feature or unfeature the selected chefs with one UPDATE (plus one to rank approved chefs)"""
+    action = request.form.get('action')
+    try:
+        chef_ids = sorted({int(chef_id) for chef_id in request.form.getlist('chef_ids')})
+    except ValueError:
+        chef_ids = []
+    if action not in BULK_CHEF_ACTIONS or not chef_ids:
+        flash('Select at least one chef and an action.', 'warning')
+        return redirect(url_for('admin.admin_manage_chefs'))
+
+    done, values = BULK_CHEF_ACTIONS[action]
+    selected = Chef.query.filter(Chef.id.in_(chef_ids), Chef.deleted_at.is_(None))
+    newly_approved = []
+    if action == 'approve':
+        newly_approved = selected.filter(db.or_(Chef.is_approved.is_(False), Chef.is_approved.is_(None))).join(
+            User, User.id == Chef.user_id).with_entities(Chef.id, Chef.name, User.email).all()
+
+    updated = selected.update(values, synchronize_session=False)
+    # Newly listed chefs get a real ranking_score instead of waiting for the nightly refresh
+    refresh_chef_rankings([chef_id for chef_id, _, _ in newly_approved])
+    queued = enqueue_emails([chef_approval_email(name, email) for _, name, email in newly_approved])
+    db.session.commit()
+    invalidate_fragments('featured_chefs')
+    if queued:
+        flush_outbox()
+
+    message = f'{updated} chef(s) {done}.'
+    if queued:
+        message += f' {queued} approval email(s) queued.'
+    flash(message, 'success')
+    return redirect(url_for('admin.admin_manage_chefs'))
+
+
+@bp.route('/admin/menu', methods=['GET', 'POST'])
+@role_required('admin')
+def manage_menu():
+    if request.method == 'POST':
+        name = request.form.get('name')
+        category = request.form.get('category')
+        price = float(request.form.get('price'))
+        ingredients = request.form.get('ingredients')
+        
+        menu_item = MenuItem(
+            name=name,
+            category=category,
+            price_per_person=price,
+            ingredients=ingredients
+        )
+        db.session.add(menu_item)
+        db.session.commit()
+        flash('Menu item added successfully!', 'success')
+        return redirect(url_for('admin.manage_menu'))
+    
+    menu_items = MenuItem.query.all()
+    return render_template('manage_menu.html', menu_items=menu_items)
+
+
+@bp.route('/admin/menu/<int:item_id>/delete')
+@role_required('admin')
+def delete_menu_item(item_id):
+    item = MenuItem.query.get_or_404(item_id)
+    db.session.delete(item)
+    db.session.commit()
+    flash('Menu item deleted successfully!', 'success')
+    return redirect(url_for('admin.manage_menu'))
+
+
+@bp.route('/admin/create-dish', methods=['GET', 'POST'])
+@role_required('admin')
+def admin_create_dish():
+    if request.method == 'POST':
+        name = request.form.get('name')
+        base_servings = int(request.form.get('base_servings'))
+        markup = float(request.form.get('markup'))
+        description = request.form.get('description')
+
+        dish = Dish(name=name, base_servings=base_servings, markup=markup, description=description)
+        db.session.add(dish)
+        db.session.commit()
+
+        # Handle ingredients
+        ingredient_names = request.form.getlist('ingredient_name[]')
+        units = request.form.getlist('unit[]')
+        unit_prices = request.form.getlist('unit_price[]')
+        quantities = request.form.getlist('quantity[]')
+
+        for i in range(len(ingredient_names)):
+            if ingredient_names[i].strip():
+                # Check if ingredient exists, else create
+                ingredient = Ingredient.query.filter_by(name=ingredient_names[i].strip()).first()
+                if not ingredient:
+                    ingredient = Ingredient(name=ingredient_names[i].strip(), unit=units[i], unit_price=float(unit_prices[i]))
+                    db.session.add(ingredient)
+                    db.session.commit()
+
+                dish_ingredient = DishIngredient(dish_id=dish.id, ingredient_id=ingredient.id, quantity_for_base_servings=float(quantities[i]))
+                db.session.add(dish_ingredient)
+
+        db.session.commit()
+        flash('Dish created successfully!', 'success')
+        return redirect(url_for('admin.admin_create_dish'))
+
+    dishes = Dish.query.all()
+    ingredients = Ingredient.query.all()
+    return render_template('admin_create_dish.html', dishes=dishes, ingredients=ingredients)
+
+
+@bp.route('/admin/delete-dish/<int:dish_id>', methods=['POST'])
+@role_required('admin')
+def admin_delete_dish(dish_id):
+    dish = Dish.query.get_or_404(dish_id)
+    
+    # Delete associated dish ingredients first
+    DishIngredient.query.filter_by(dish_id=dish_id).delete()
+    
+    # Delete the dish
+    db.session.delete(dish)
+    db.session.commit()
+    
+    flash(f'Dish "{dish.name}" deleted successfully!', 'success')
+    return redirect(url_for('admin.admin_create_dish'))
+
+
+@bp.route('/admin/custom-dish-database', methods=['GET', 'POST'])
+@role_required('admin')
+def admin_custom_dish_database():
+    """Manage custom dish database for customer searches"""
+    if request.method == 'POST':
+        name = request.form.get('name')
+        base_servings = int(request.form.get('base_servings'))
+        markup = float(request.form.get('markup'))
+        description = request.form.get('description')
+
+        dish = CustomDish(name=name, base_servings=base_servings, markup=markup, description=description)
+        db.session.add(dish)
+        db.session.commit()
+
+        # Handle ingredients
+        ingredient_names = request.form.getlist('ingredient_name[]')
+        units = request.form.getlist('unit[]')
+        unit_prices = request.form.getlist('unit_price[]')
+        quantities = request.form.getlist('quantity[]')
+
+        for i in range(len(ingredient_names)):
+            if ingredient_names[i].strip():
+                # Check if ingredient exists in custom database, else create
+                ingredient = CustomIngredient.query.filter_by(name=ingredient_names[i].strip()).first()
+                if not ingredient:
+                    ingredient = CustomIngredient(name=ingredient_names[i].strip(), unit=units[i], unit_price=float(unit_prices[i]))
+                    db.session.add(ingredient)
+                    db.session.commit()
+
+                dish_ingredient = CustomDishIngredient(dish_id=dish.id, ingredient_id=ingredient.id, quantity_for_base_servings=float(quantities[i]))
+                db.session.add(dish_ingredient)
+
+        db.session.commit()
+        # The search index is kept in sync by triggers; only the typo vocabulary is cached
+        invalidate_dish_vocabulary()
+        flash('Custom dish added to database successfully!', 'success')
+        return redirect(url_for('admin.admin_custom_dish_database'))
+
+    dishes = CustomDish.query.all()
+    ingredients = CustomIngredient.query.all()
+    return render_template('admin_custom_dish_database.html', dishes=dishes, ingredients=ingredients)
+
+
+@bp.route('/admin/delete-custom-dish/<int:dish_id>', methods=['POST'])
+@role_required('admin')
+def admin_delete_custom_dish(dish_id):
+    """Delete a custom dish from the database"""
+    dish = CustomDish.query.get_or_404(dish_id)
+    
+    # Delete associated dish ingredients first
+    CustomDishIngredient.query.filter_by(dish_id=dish_id).delete()
+    
+    # Delete the dish
+    db.session.delete(dish)
+    db.session.commit()
+    invalidate_dish_vocabulary()
+    
+    flash(f'Custom dish "{dish.name}" deleted successfully!', 'success')
+    return redirect(url_for('admin.admin_custom_dish_database'))
+
+
+@bp.route('/admin/config', methods=['GET', 'POST'])
+@role_required('admin')
+def config():
+    if request.method == 'POST':
+        deposit_percentage = request.form.get('deposit_percentage')
+        
+        config = SystemConfig.query.filter_by(key='deposit_percentage').first()
+        if config:
+            config.value = deposit_percentage
+        else:
+            config = SystemConfig(key='deposit_percentage', value=deposit_percentage)
+            db.session.add(config)
+        
+        db.session.commit()
+        flash('Configuration updated successfully!', 'success')
+        return redirect(url_for('admin.config'))
+    
+    deposit_config = SystemConfig.query.filter_by(key='deposit_percentage').first()
+    deposit_percentage = deposit_config.value if deposit_config else '30'
+    
+    return render_template('config.html', deposit_percentage=deposit_percentage)
+
+
+@bp.route('/admin/settings', methods=['GET', 'POST'])
+@role_required('admin')
+def admin_settings():
+    if request.method == 'POST':
+        # Save settings
+        settings_keys = [
+            'gmail_user', 'gmail_password',
+            'sms_provider', 'sms_api_key', 'sms_api_secret', 'sms_sender_id',
+            'deposit_percentage'
+        ]
+
+        for key in settings_keys:
+            value = request.form.get(key)
+            if value is not None:
+                config = SystemConfig.query.filter_by(key=key).first()
+                if config:
+                    config.value = value
+                else:
+                    config = SystemConfig(key=key, value=value)
+                    db.session.add(config)
+        
+        # Handle SMS verification toggle (checkbox)
+        # Checkbox sends 'true' when checked, nothing when unchecked
+        sms_enabled = request.form.get(SMS_VERIFICATION_KEY)
+        sms_config = SystemConfig.query.filter_by(key=SMS_VERIFICATION_KEY).first()
+        if sms_config:
+            sms_config.value = 'true' if sms_enabled else 'false'
+        else:
+            sms_config = SystemConfig(key=SMS_VERIFICATION_KEY, value='true' if sms_enabled else 'false')
+            db.session.add(sms_config)
+
+        db.session.commit()
+        flash('Settings updated successfully!', 'success')
+        return redirect(url_for('admin.admin_dashboard'))
+
+    # Get current settings
+    settings = {}
+    configs = SystemConfig.query.filter(SystemConfig.key.in_([
+        'gmail_user', 'gmail_password',
+        'sms_provider', 'sms_api_key', 'sms_api_secret', 'sms_sender_id',
+        'deposit_percentage', SMS_VERIFICATION_KEY
+    ])).all()
+
+    for config in configs:
+        settings[config.key] = config.value
+
+    return render_template('admin_settings.html', settings=settings, SMS_VERIFICATION_KEY=SMS_VERIFICATION_KEY)
+
+
+@bp.route('/admin/email-settings', methods=['GET', 'POST'])
+@role_required('admin')
+def admin_email_settings():
+    if request.method == 'POST':
+        # Save email settings
+        email_settings_keys = [
+            'gmail_user', 'gmail_password',
+            'smtp_host', 'smtp_port', 'smtp_encryption',
+            'admin_email', 'sender_name', 'email_timeout'
+        ]
+
+        for key in email_settings_keys:
+            value = request.form.get(key)
+            if value is not None:
+                config = SystemConfig.query.filter_by(key=key).first()
+                if config:
+                    config.value = value
+                else:
+                    config = SystemConfig(key=key, value=value)
+                    db.session.add(config)
+
+        db.session.commit()
+        flash('Email settings updated successfully!', 'success')
+        return redirect(url_for('admin.admin_email_settings'))
+
+    # Get current settings
+    settings = {}
+    configs = SystemConfig.query.filter(SystemConfig.key.in_([
+        'gmail_user', 'gmail_password',
+        'smtp_host', 'smtp_port', 'smtp_encryption',
+        'admin_email', 'sender_name', 'email_timeout'
+    ])).all()
+
+    for config in configs:
+        settings[config.key] = config.value
+
+    # Set defaults if not configured
+    if 'smtp_host' not in settings:
+        settings['smtp_host'] = 'smtp.gmail.com'
+    if 'smtp_port' not in settings:
+        settings['smtp_port'] = '587'
+    if 'smtp_encryption' not in settings:
+        settings['smtp_encryption'] = 'tls'
+    if 'sender_name' not in settings:
+        settings['sender_name'] = 'e-Rugah Contact Form'
+    if 'email_timeout' not in settings:
+        settings['email_timeout'] = '30'
+
+    return render_template('admin_email_settings.html', settings=settings)
+
+
+@bp.route('/admin/test-email-connection', methods=['POST'])
+@role_required('admin')
+def test_email_connection():
+    """Test SMTP connection with provided settings"""
+    import smtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+    
+    try:
+        # Get settings from form
+        gmail_user = request.form.get('gmail_user')
+        gmail_password = request.form.get('gmail_password')
+        smtp_host = request.form.get('smtp_host', 'smtp.gmail.com')
+        smtp_port = int(request.form.get('smtp_port', 587))
+        smtp_encryption = request.form.get('smtp_encryption', 'tls')
+        timeout = int(request.form.get('email_timeout', 30))
+        
+        if not gmail_user or not gmail_password:
+            return jsonify({
+                'success': False,
+                'message': 'Gmail email and password are required'
+            })
+        
+        # Test connection
+        if smtp_encryption == 'ssl':
+            server = smtplib.SMTP_SSL(smtp_host, smtp_port, timeout=timeout)
+        else:
+            server = smtplib.SMTP(smtp_host, smtp_port, timeout=timeout)
+            if smtp_encryption == 'tls':
+                server.starttls()
+        
+        # Login
+        server.login(gmail_user, gmail_password)
+        
+        # Send test email to self
+        msg = MIMEMultipart()
+        msg['From'] = gmail_user
+        msg['To'] = gmail_user
+        msg['Subject'] = 'e-Rugah SMTP Test - Connection Successful'
+        
+        body = """
+        <html>
+            <body style="font-family: Arial, sans-serif; padding: 20px;">
+                <h2 style="color: #ff6b35;">SMTP Connection Test Successful!</h2>
+                <p>Your email settings are configured correctly.</p>
+                <p><strong>Configuration Details:</strong></p>
+                <ul>
+                    <li>SMTP Host: {}</li>
+                    <li>SMTP Port: {}</li>
+                    <li>Encryption: {}</li>
+                    <li>Email: {}</li>
+                </ul>
+                <p>You can now receive messages from your contact form.</p>
+                <hr>
+                <p style="color: #666; font-size: 12px;">This is an automated test message from e-Rugah</p>
+            </body>
+        </html>
+        """.format(smtp_host, smtp_port, smtp_encryption.upper(), gmail_user)
+        
+        msg.attach(MIMEText(body, 'html'))
+        
+        server.send_message(msg)
+        server.quit()
+        
+        return jsonify({
+            'success': True,
+            'message': f'Connection successful! A test email has been sent to {gmail_user}'
+        })
+        
+    except smtplib.SMTPAuthenticationError:
+        return jsonify({
+            'success': False,
+            'message': 'Authentication failed. Please check your email and app password.'
+        })
+    except smtplib.SMTPConnectError:
+        return jsonify({
+            'success': False,
+            'message': 'Could not connect to SMTP server. Please check host and port.'
+        })
+    except smtplib.SMTPException as e:
+        return jsonify({
+            'success': False,
+            'message': f'SMTP error: {str(e)}'
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Error: {str(e)}'
+        })
+
+
+@bp.route('/admin/mpesa-settings', methods=['GET', 'POST'])
+@role_required('admin')
+def admin_mpesa_settings():
+    # Get or create M-Pesa config
+    mpesa_config = MpesaConfig.query.first()
+    if not mpesa_config:
+        mpesa_config = MpesaConfig()
+        db.session.add(mpesa_config)
+        db.session.commit()
+    
+    if request.method == 'POST':
+        # Update M-Pesa configuration
+        mpesa_config.environment = request.form.get('environment', 'sandbox')
+        mpesa_config.consumer_key = request.form.get('consumer_key', 'test_key')
+        mpesa_config.consumer_secret = request.form.get('consumer_secret', 'test_secret')
+        mpesa_config.shortcode = request.form.get('shortcode', '174379')
+        mpesa_config.passkey = request.form.get('passkey', 'test_passkey')
+        mpesa_config.callback_url = request.form.get('callback_url', 'https://yourapp.repl.co/mpesa/callback')
+        mpesa_config.api_url = request.form.get('api_url', 'https://sandbox.safaricom.co.ke/oauth/v1/generate?grant_type=client_credentials')
+        mpesa_config.stk_url = request.form.get('stk_url', 'https://sandbox.safaricom.co.ke/mpesa/stkpush/v1/processrequest')
+        mpesa_config.updated_at = datetime.utcnow()
+        
+        db.session.commit()
+        flash('M-Pesa settings updated successfully!', 'success')
+        return redirect(url_for('admin.admin_mpesa_settings'))
+    
+    return render_template('admin_mpesa_settings.html', mpesa_config=mpesa_config)
+
+
+@bp.route('/admin/test-mpesa-connection', methods=['POST'])
+@role_required('admin')
+def test_mpesa_connection():
+    """Test M-Pesa API connection"""
+    import requests
+    import base64
+    
+    try:
+        data = request.get_json()
+        consumer_key = data.get('consumer_key')
+        consumer_secret = data.get('consumer_secret')
+        api_url = data.get('api_url')
+        
+        credentials = base64.b64encode(f'{consumer_key}:{consumer_secret}'.encode()).decode()
+        headers = {'Authorization': f'Basic {credentials}'}
+        
+        response = requests.get(api_url, headers=headers, timeout=10)
+        
+        if response.status_code == 200:
+            return jsonify({'success': True, 'message': 'Connection successful'})
+        else:
+            return jsonify({'success': False, 'message': f'API returned status {response.status_code}'})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+
+@bp.route('/admin/manage-chefs')
+@role_required('admin')
+def admin_manage_chefs():
+    """Admin page to manage chefs - search, filter and page through them, delete, and manage ratings"""
+    wants_json = request.args.get('format') == 'json' or request.accept_mimetypes.best == 'application/json'
+    try:
+        filters = parse_filters(request.args)
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+        chefs, next_cursor = search_chefs(filters, request.args.get('cursor'), limit)
+    except (ValueError, InvalidCursor):
+        if wants_json:
+            return jsonify({'success': False, 'message': 'Invalid filter, limit or cursor'}), 400
+        flash('Invalid chef search filters.', 'danger')
+        return redirect(url_for('admin.admin_manage_chefs'))
+
+    if wants_json:
+        return jsonify({'chefs': [serialize_chef(chef) for chef in chefs], 'next_cursor': next_cursor})
+    return render_template('admin_manage_chefs.html', chefs=chefs, filters=filters, next_cursor=next_cursor,
+                           counts=chef_counts(), counties=chef_counties())
+
+
+@bp.route('/admin/chef/<int:chef_id>/delete', methods=['POST'])
+@role_required('admin')
+def admin_delete_chef(chef_id):
+    """Delete a chef with their bookings, payments and user account (mode=soft: hide now, purge in the background)"""
+    chef = Chef.query.get_or_404(chef_id)
+    name = chef.name
+    user_id = chef.user_id
+    soft = request.form.get('mode') == 'soft'
+    
+    try:
+        if soft:
+            soft_delete_chef(chef_id)
+        else:
+            delete_chefs([chef_id])
+        db.session.commit()
+        invalidate_identity(user_id)  # the deleted user's sessions must not stay logged in
+        invalidate_fragments('featured_chefs')
+        if soft:
+            schedule_purge()
+            flash(f'Chef {name} hidden; their account and bookings will be removed shortly.', 'success')
+        else:
+            flash(f'Chef {name} and associated account deleted successfully!', 'success')
+    except Exception as e:
+        db.session.rollback()
+        flash(f'Error deleting chef: {str(e)}', 'danger')
+    
+    return redirect(url_for('admin.admin_manage_chefs'))
+
+
+@bp.route('/admin/chef/<int:chef_id>/add-rating', methods=['POST'])
+@role_required('admin')
+def admin_add_chef_rating(chef_id):
+    """Add or update a chef's rating"""
+    chef = Chef.query.get_or_404(chef_id)
+    
+    try:
+        rating_value = int(request.form.get('rating_value'))
+        
+        if rating_value < 1 or rating_value > 5:
+            flash('Rating must be between 1 and 5 stars', 'danger')
+            return redirect(url_for('admin.admin_manage_chefs'))
+        
+        # Add the rating to the chef's total
+        add_chef_rating(chef.id, rating_value)
+        
+        db.session.commit()
+        invalidate_fragments('featured_chefs')
+        flash(f'Rating added successfully! {chef.name} now has an average rating of {chef.average_rating} stars', 'success')
+    except ValueError:
+        flash('Invalid rating value', 'danger')
+    except Exception as e:
+        db.session.rollback()
+        flash(f'Error adding rating: {str(e)}', 'danger')
+    
+    return redirect(url_for('admin.admin_manage_chefs'))
+
+
+@bp.route('/admin/chef/<int:chef_id>/reset-rating', methods=['POST'])
+@role_required('admin')
+def admin_reset_chef_rating(chef_id):
+    """Reset a chef's rating to zero"""
+    chef = Chef.query.get_or_404(chef_id)
+    
+    try:
+        reset_chef_rating(chef.id)
+        
+        db.session.commit()
+        invalidate_fragments('featured_chefs')
+        flash(f'Rating reset successfully for {chef.name}', 'success')
+    except Exception as e:
+        db.session.rollback()
+        flash(f'Error resetting rating: {str(e)}', 'danger')
+    
+    return redirect(url_for('admin.admin_manage_chefs'))
+
+
+@bp.route('/admin/images', methods=['GET', 'POST'])
+@role_required('admin')
+def admin_images():
+    import os
+    from werkzeug.utils import secure_filename
+
+    sections = {
+        'hero': {'folder': 'static/images/', 'url_prefix': 'images/'},
+        'triangle': {'folder': 'static/hero-triangle/', 'url_prefix': 'hero-triangle/'},
+        'chefs': {'folder': 'static/images/', 'url_prefix': 'images/'},  # expert chefs images
+        'gallery': {'folder': 'static/images/', 'url_prefix': 'images/'},  # gallery images
+        'products': {'folder': 'static/images/', 'url_prefix': 'images/'}  # if any
+    }
+
+    if request.method == 'POST':
+        section = request.form.get('section')
+        action = request.form.get('action')
+
+        if section not in sections:
+            flash('Invalid section', 'danger')
+            return redirect(url_for('admin.admin_images'))
+
+        upload_folder = sections[section]['folder']
+
+        if action == 'upload':
+            files = request.files.getlist('files')
+            for file in files:
+                if file and file.filename:
+                    filename = secure_filename(file.filename)
+                    file_path = os.path.join(upload_folder, filename)
+                    file.save(file_path)
+            flash('Images uploaded successfully!', 'success')
+
+        elif action == 'delete':
+            filename = request.form.get('filename')
+            if filename:
+                file_path = os.path.join(upload_folder, secure_filename(filename))
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                    flash('Image deleted successfully!', 'success')
+                else:
+                    flash('File not found', 'danger')
+
+        elif action == 'replace':
+            old_filename = request.form.get('old_filename')
+            new_file = request.files.get('new_file')
+            if old_filename and new_file:
+                old_path = os.path.join(upload_folder, secure_filename(old_filename))
+                if os.path.exists(old_path):
+                    os.remove(old_path)
+                filename = secure_filename(new_file.filename)
+                new_path = os.path.join(upload_folder, filename)
+                new_file.save(new_path)
+                flash('Image replaced successfully!', 'success')
+
+        return redirect(url_for('admin.admin_images'))
+
+    # GET: list images per section
+    images = {}
+    for sec, data in sections.items():
+        folder = data['folder']
+        url_prefix = data['url_prefix']
+        if os.path.exists(folder):
+            files = [f for f in os.listdir(folder) if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp'))]
+            images[sec] = {'files': files, 'url_prefix': url_prefix}
+        else:
+            images[sec] = {'files': [], 'url_prefix': url_prefix}
+
+    return render_template('admin_images.html', images=images)
+
+
+@bp.route('/admin/reviews')
+@role_required('admin')
+def admin_reviews():
+    """Admin page to manage reviews"""
+    pending_reviews = Review.query.filter_by(is_approved=False).order_by(Review.created_at.desc()).all()
+    approved_reviews = Review.query.filter_by(is_approved=True).order_by(Review.created_at.desc()).all()
+    return render_template('admin_reviews.html', 
+                         pending_reviews=pending_reviews,
+                         approved_reviews=approved_reviews)
+
+
+@bp.route('/admin/reviews/<int:review_id>/approve', methods=['POST'])
+@role_required('admin')
+def approve_review(review_id):
+    """Approve a review"""
+    review = Review.query.get_or_404(review_id)
+    # Conditional UPDATE: of two concurrent approvals only the one that flips the row counts the review
+    approved = Review.query.filter(
+        Review.id == review_id, db.or_(Review.is_approved.is_(False), Review.is_approved.is_(None))
+    ).update({Review.is_approved: True}, synchronize_session=False)
+    if approved == 1:
+        record_review_approved(review)
+        db.session.commit()
+        invalidate_reviews_cache()
+        invalidate_summary_cache()
+    flash('Review approved successfully!', 'success')
+    return redirect(url_for('admin.admin_reviews'))
+
+
+def _remove_review(review_id, success_message):
+    """Shared helper for removing reviews."""
+    review = Review.query.get_or_404(review_id)
+    # Unapprove conditionally first, so concurrent removals take the review out of the aggregates once
+    unapproved = Review.query.filter(Review.id == review_id, Review.is_approved.is_(True)).update(
+        {Review.is_approved: False}, synchronize_session=False)
+    if unapproved == 1:
+        record_review_removed(review)
+    Review.query.filter(Review.id == review_id).delete(synchronize_session=False)
+    db.session.commit()
+    invalidate_reviews_cache()
+    invalidate_summary_cache()
+    flash(success_message, 'success')
+    return redirect(url_for('admin.admin_reviews'))
+
+
+@bp.route('/admin/reviews/<int:review_id>/reject', methods=['POST'])
+@role_required('admin')
+def reject_review(review_id):
+    """Reject a review and remove it from the system."""
+    return _remove_review(review_id, 'Review rejected and removed.')
+
+
+@bp.route('/admin/reviews/<int:review_id>/delete', methods=['POST'])
+@role_required('admin')
+def delete_review(review_id):
+    """Delete an approved review."""
+    return _remove_review(review_id, 'Review deleted successfully!')
+
+
+# Admin Featured Chefs Routes
+@bp.route('/admin/featured-chefs')
+@role_required('admin')
+def admin_featured_chefs():
+    """Admin page to manage featured chefs"""
+    all_chefs = chef_summaries(Chef.query.filter(
+        Chef.is_verified.is_(True),
+        Chef.is_approved.is_(True)
+    ).order_by(*ranked_order(), Chef.name))
+    return render_template('admin_featured_chefs.html', chefs=all_chefs)
+
+
+@bp.route('/admin/chefs/<int:chef_id>/toggle-featured', methods=['POST'])
+@role_required('admin')
+def toggle_chef_featured(chef_id):
+    """Toggle chef featured status"""
+    chef = Chef.query.get_or_404(chef_id)
+    chef.is_featured = not chef.is_featured
+    if not chef.is_featured:
+        chef.featured_priority = 0
+    db.session.commit()
+    invalidate_fragments('featured_chefs')
+    
+    status = "featured" if chef.is_featured else "unfeatured"
+    flash(f'Chef {chef.name} has been {status}!', 'success')
+    return redirect(url_for('admin.admin_featured_chefs'))
+
+
+@bp.route('/admin/chefs/<int:chef_id>/set-priority', methods=['POST'])
+@role_required('admin')
+def set_chef_priority(chef_id):
+    """Set chef featured priority"""
+    chef = Chef.query.get_or_404(chef_id)
+    priority = int(request.form.get('priority', 0))
+    chef.featured_priority = priority
+    if priority > 0 and not chef.is_featured:
+        chef.is_featured = True
+    db.session.commit()
+    invalidate_fragments('featured_chefs')
+    flash(f'Priority for {chef.name} set to {priority}!', 'success')
+    return redirect(url_for('admin.admin_featured_chefs'))
@@ -0,0 +1,151 @@
+"""
+Registration, login/logout and password reset.
+"""
+from flask import Blueprint, flash, redirect, render_template, request, session, url_for
+from flask_login import login_required, login_user, logout_user
+from models import db, User
+from code_store import CodeRateLimitError
+from rate_limit import Limit, rate_limited
+from verification import send_password_reset_email, verify_password_reset_code
+
+bp = Blueprint('auth', __name__)
+
+
+@bp.route('/register', methods=['GET', 'POST'])
+def register():
+    if request.method == 'POST':
+        email = request.form.get('email')
+        password = request.form.get('password')
+        role = request.form.get('role', 'customer')
+        
+        if User.query.filter_by(email=email).first():
+            flash('Email already registered', 'danger')
+            return redirect(url_for('auth.register'))
+        
+        user = User(email=email, role=role)
+        user.set_password(password)
+        db.session.add(user)
+        db.session.commit()
+        
+        # Automatically log in the user after registration
+        login_user(user)
+        flash('Registration successful! Welcome to e-Rugah.', 'success')
+        
+        # Redirect to appropriate dashboard based on role
+        if user.role == 'admin':
+            return redirect(url_for('admin.admin_dashboard'))
+        elif user.role == 'chef':
+            return redirect(url_for('chef.chef_dashboard'))
+        else:
+            return redirect(url_for('customer.customer_dashboard'))
+    
+    return render_template('register.html')
+
+
+@bp.route('/login', methods=['GET', 'POST'])
+@rate_limited('login', ip=Limit(30, 300), email=Limit(10, 300))
+def login():
+    if request.method == 'POST':
+        email = request.form.get('email')
+        password = request.form.get('password')
+        remember_me = request.form.get('remember_me') == 'on'
+        
+        user = User.query.filter_by(email=email).first()
+        if user and user.check_password(password):
+            # Login user with remember me option
+            # If remember_me is True, session will last for 30 days
+            # If False, session expires when browser closes
+            login_user(user, remember=remember_me)
+            flash('Login successful!', 'success')
+            
+            if user.role == 'admin':
+                return redirect(url_for('admin.admin_dashboard'))
+            elif user.role == 'chef':
+                return redirect(url_for('chef.chef_dashboard'))
+            else:
+                return redirect(url_for('customer.customer_dashboard'))
+        
+        flash('Invalid email or password', 'danger')
+    
+    return render_template('login.html')
+
+
+@bp.route('/logout')
+@login_required
+def logout():
+    logout_user()
+    flash('Logged out successfully', 'success')
+    return redirect(url_for('public.index'))
+
+
+@bp.route('/forgot-password', methods=['GET', 'POST'])
+@rate_limited('forgot_password', ip=Limit(10, 3600), email=Limit(3, 900))
+def forgot_password():
+    if request.method == 'POST':
+        email = request.form.get('email')
+        
+        # Check if user exists
+        user = User.query.filter_by(email=email).first()
+        if not user:
+            flash('If an account exists with this email, a reset code will be sent.', 'info')
+            return redirect(url_for('auth.forgot_password'))
+        
+        # Send reset code
+        try:
+            success, code = send_password_reset_email(email)
+        except CodeRateLimitError as e:
+            flash(str(e), 'warning')
+            return redirect(url_for('auth.forgot_password'))
+        
+        if success:
+            # Store email in session for verification
+            session['reset_email'] = email
+            flash('A password reset code has been sent to your email.', 'success')
+            return redirect(url_for('auth.reset_password'))
+        else:
+            flash('Failed to send reset code. Please try again later.', 'danger')
+    
+    return render_template('forgot_password.html')
+
+
+@bp.route('/reset-password', methods=['GET', 'POST'])
+def reset_password():
+    # Check if email is in session
+    if 'reset_email' not in session:
+        flash('Please request a password reset first.', 'warning')
+        return redirect(url_for('auth.forgot_password'))
+    
+    email = session['reset_email']
+    
+    if request.method == 'POST':
+        code = request.form.get('code')
+        new_password = request.form.get('new_password')
+        confirm_password = request.form.get('confirm_password')
+        
+        # Validate passwords match
+        if new_password != confirm_password:
+            flash('Passwords do not match.', 'danger')
+            return render_template('reset_password.html', email=email)
+        
+        # Verify and consume reset code
+        is_valid, message = verify_password_reset_code(email, code)
+        
+        if not is_valid:
+            flash(message, 'danger')
+            return render_template('reset_password.html', email=email)
+        
+        # Update password
+        user = User.query.filter_by(email=email).first()
+        if user:
+            user.set_password(new_password)
+            db.session.commit()
+            
+            # Clear session
+            session.pop('reset_email', None)
+            
+            flash('Password reset successful! You can now login with your new password.', 'success')
+            return redirect(url_for('auth.login'))
+        else:
+            flash('User not found.', 'danger')
+    
+    return render_template('reset_password.html', email=email)
@@ -0,0 +1,306 @@
+"""
+Chef registration, dashboard and profile.
+"""
+from flask import Blueprint, flash, jsonify, redirect, render_template, request, session, url_for
+from flask_login import current_user, login_required, login_user
+from werkzeug.utils import secure_filename
+import os
+from models import db, Chef, User
+from otp import verify_otp
+from dashboards import get_chef_bookings
+from verification import is_sms_verification_enabled
+from fragment_cache import invalidate_fragments
+from blueprints import role_required
+
+bp = Blueprint('chef', __name__)
+
+
+def current_chef():
+    """The logged-in chef's profile, by primary key from the cached identity."""
+    if current_user.chef_id is None:
+        return None
+    return db.session.get(Chef, current_user.chef_id)
+
+
+@bp.route('/chef/register', methods=['GET', 'POST'])
+def chef_register():
+    if request.method == 'POST':
+        email = request.form.get('email')
+        password = request.form.get('password')
+        name = request.form.get('name')
+        phone = request.form.get('phone')
+        county = request.form.get('county')
+        sub_county = request.form.get('sub_county')
+        town = request.form.get('town')
+        about = request.form.get('about')
+        meals = request.form.getlist('meals')
+
+        if len(meals) > 5:
+            return jsonify({
+                'success': False,
+                'message': 'Maximum 5 meals allowed'
+            })
+
+        if User.query.filter_by(email=email).first():
+            return jsonify({
+                'success': False,
+                'message': 'Email already registered'
+            })
+
+        try:
+            # Handle photo upload
+            photo_url = None
+            if 'photo' in request.files:
+                photo = request.files['photo']
+                if photo and photo.filename:
+                    # Save photo with secure filename
+                    filename = secure_filename(f"chef_{email}_{photo.filename}")
+                    photo_path = os.path.join('static', 'images', 'chefs', filename)
+                    os.makedirs(os.path.dirname(photo_path), exist_ok=True)
+                    photo.save(photo_path)
+                    # Store with /static/ prefix for consistency
+                    photo_url = f"/static/images/chefs/{filename}"
+
+            # Create user account immediately
+            user = User(email=email, role='chef')
+            user.set_password(password)
+            db.session.add(user)
+            db.session.flush()  # Get user.id without committing
+
+            # Create chef profile
+            chef = Chef(
+                user_id=user.id,
+                name=name,
+                phone=phone,
+                county=county,
+                sub_county=sub_county,
+                town=town,
+                about=about,
+                meals_offered=','.join(meals),
+                photo_url=photo_url,
+                is_verified=False,
+                is_approved=False
+            )
+            db.session.add(chef)
+            db.session.commit()
+
+            # Log in the user
+            login_user(user)
+
+            # Store data in session for verification flow
+            session['pending_verification'] = {
+                'user_id': user.id,
+                'email': email,
+                'phone': phone,
+                'sms_enabled': is_sms_verification_enabled()
+            }
+
+            # Return success response to trigger modal
+            return jsonify({
+                'success': True,
+                'message': 'Account created! Please verify your email.',
+                'sms_enabled': is_sms_verification_enabled()
+            })
+        except Exception as e:
+            db.session.rollback()
+            print(f"[ERROR] Registration failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return jsonify({
+                'success': False,
+                'message': f'Registration failed: {str(e)}'
+            })
+
+    return render_template('chef_register.html', sms_verification_enabled=is_sms_verification_enabled())
+
+
+@bp.route('/chef/verify-otp', methods=['GET', 'POST'])
+def verify_otp_page():
+    email = request.args.get('email') or request.form.get('email')
+    
+    if request.method == 'POST':
+        code = request.form.get('code')
+        
+        success, message = verify_otp(email, code)
+        
+        if success:
+            user = User.query.filter_by(email=email).first()
+            if user and user.chef:
+                user.chef.is_verified = True
+                db.session.commit()
+                # Automatically log in the chef after verification
+                login_user(user)
+                flash('Email verified successfully! Admin approval pending.', 'success')
+                return redirect(url_for('chef.chef_dashboard'))
+        
+        flash(message, 'danger')
+    
+    return render_template('verify_otp.html', email=email)
+
+
+@bp.route('/chef/pending')
+@role_required('chef')
+def chef_pending():
+    chef = current_chef()
+    if not chef:
+        flash('Chef profile not found', 'danger')
+        return redirect(url_for('public.index'))
+    
+    # If chef is already approved, redirect to dashboard
+    if chef.is_approved:
+        return redirect(url_for('chef.chef_dashboard'))
+    
+    return render_template('chef_pending.html', chef=chef)
+
+
+@bp.route('/chef/dashboard')
+@role_required('chef')
+def chef_dashboard():
+    chef = current_chef()
+    if not chef:
+        flash('Chef profile not found', 'danger')
+        return redirect(url_for('public.index'))
+
+    # If chef is not approved yet, redirect to pending page
+    if not chef.is_approved:
+        return redirect(url_for('chef.chef_pending'))
+
+    # Get chef's uploaded gallery images
+    images = []
+    chefs_dir = os.path.join('static', 'images', 'chefs')
+    if os.path.exists(chefs_dir):
+        for file in os.listdir(chefs_dir):
+            if file.startswith(f"chef_{chef.id}_") and file.lower().endswith(('.png', '.jpg', '.jpeg')):
+                images.append(file)
+
+    bookings = get_chef_bookings(
+        chef.id,
+        upcoming_page=request.args.get('upcoming_page', 1, type=int),
+        past_page=request.args.get('past_page', 1, type=int)
+    )
+    return render_template('chef_dashboard.html', chef=chef, images=images, **bookings)
+
+
+@bp.route('/chef/profile/<int:chef_id>')
+@login_required
+def chef_profile(chef_id):
+    chef = Chef.query.get_or_404(chef_id)
+
+    # Allow customers to view approved chefs
+    if current_user.role == 'customer' and not chef.is_approved:
+        flash('Chef profile not available', 'danger')
+        return redirect(url_for('customer.customer_dashboard'))
+
+    # Get chef's uploaded images
+    images = []
+    chefs_dir = os.path.join('static', 'images', 'chefs')
+    if os.path.exists(chefs_dir):
+        for file in os.listdir(chefs_dir):
+            if file.startswith(f"chef_{chef.id}_") and file.lower().endswith(('.png', '.jpg', '.jpeg')):
+                images.append(file)
+
+    return render_template('chef_profile.html', chef=chef, images=images)
+
+
+@bp.route('/chef/upload-image', methods=['POST'])
+@role_required('chef')
+def chef_upload_image():
+    if 'image' not in request.files:
+        flash('No file selected', 'danger')
+        return redirect(url_for('chef.chef_dashboard'))
+
+    file = request.files['image']
+    if file.filename == '':
+        flash('No file selected', 'danger')
+        return redirect(url_for('chef.chef_dashboard'))
+
+    if file:
+        from werkzeug.utils import secure_filename
+        # Get the chef profile to use chef.id instead of user.id
+        chef = current_chef()
+        if not chef:
+            flash('Chef profile not found', 'danger')
+            return redirect(url_for('chef.chef_dashboard'))
+        
+        filename = secure_filename(f"chef_{chef.id}_{file.filename}")
+        file_path = os.path.join('static', 'images', 'chefs', filename)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        file.save(file_path)
+        flash('Image uploaded successfully!', 'success')
+
+    return redirect(url_for('chef.chef_dashboard'))
+
+
+@bp.route('/chef/update-profile-photo', methods=['POST'])
+@role_required('chef')
+def chef_update_profile_photo():
+    if 'profile_photo' not in request.files:
+        flash('No file selected', 'danger')
+        return redirect(url_for('chef.chef_dashboard'))
+
+    file = request.files['profile_photo']
+    if file.filename == '':
+        flash('No file selected', 'danger')
+        return redirect(url_for('chef.chef_dashboard'))
+
+    if file:
+        from werkzeug.utils import secure_filename
+        chef = current_chef()
+        if not chef:
+            flash('Chef profile not found', 'danger')
+            return redirect(url_for('chef.chef_dashboard'))
+        
+        # Remove old profile photo if it exists
+        if chef.photo_url:
+            existing_path = chef.photo_url.lstrip('/')
+            if os.path.exists(existing_path):
+                try:
+                    os.remove(existing_path)
+                except OSError:
+                    pass
+        
+        # Create a unique filename for the profile photo using chef.id to prevent special character issues
+        original_name = os.path.splitext(secure_filename(file.filename))[0]
+        extension = os.path.splitext(file.filename)[1]
+        filename = secure_filename(f"chef_{chef.id}_{original_name}{extension}")
+        file_path = os.path.join('static', 'images', 'chefs', filename)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        file.save(file_path)
+        
+        # Update the chef's photo_url in the database
+        chef.photo_url = f"/static/images/chefs/{filename}"
+        db.session.commit()
+        invalidate_fragments('featured_chefs')  # the old photo file is gone
+        
+        flash('Profile photo updated successfully!', 'success')
+
+    return redirect(url_for('chef.chef_dashboard'))
+
+
+@bp.route('/api/chef/<int:chef_id>/profile')
+def get_chef_profile_api(chef_id):
+    """API endpoint to get chef profile data with images"""
+    chef = Chef.query.get_or_404(chef_id)
+    
+    # Only show approved chefs
+    if not chef.is_approved:
+        return jsonify({'error': 'Chef profile not available'}), 404
+    
+    # Get chef's uploaded images
+    images = []
+    chefs_dir = os.path.join('static', 'images', 'chefs')
+    if os.path.exists(chefs_dir):
+        for file in os.listdir(chefs_dir):
+            if file.startswith(f"chef_{chef.id}_") and file.lower().endswith(('.png', '.jpg', '.jpeg')):
+                images.append(file)
+    
+    return jsonify({
+        'id': chef.id,
+        'name': chef.name,
+        'email': chef.user.email,
+        'phone': chef.phone,
+        'location': chef.location,
+        'bio': chef.about,
+        'photo_url': chef.photo_url,
+        'images': images
+    })
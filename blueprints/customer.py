@@ -0,0 +1,579 @@
+"""
+Customer dashboard, events, chef matching/booking, ratings and dish pricing APIs.
+"""
+from flask import Blueprint, flash, jsonify, redirect, render_template, request, url_for
+from flask_login import current_user, login_required
+from datetime import datetime
+import json
+from models import db, Booking, Chef, Dish, DishIngredient, Event, Ingredient, SystemConfig
+from custom_dish_models import CustomDish, CustomDishIngredient, CustomIngredient
+from chef_ratings import add_chef_rating, claim_booking_rating
+from dashboards import get_customer_dashboard
+from read_models import chef_summaries
+from dish_search import search_custom_dishes
+from fragment_cache import invalidate_fragments
+from blueprints import role_required
+
+bp = Blueprint('customer', __name__)
+
+CUSTOM_DISH_MATCHES = 5  # best match plus alternatives returned by check_custom_dish
+
+
+@bp.route('/customer/dashboard')
+@role_required('customer')
+def customer_dashboard():
+    return render_template('customer_dashboard.html', **get_customer_dashboard(current_user.id))
+
+
+@bp.route('/customer/event/<int:event_id>/details')
+@role_required('customer')
+def event_details(event_id):
+    event = Event.query.get_or_404(event_id)
+    if event.customer_id != current_user.id:
+        flash('Access denied', 'danger')
+        return redirect(url_for('customer.customer_dashboard'))
+    
+    # Get dishes for the event
+    dish_ids = event.menu_items.split(',') if event.menu_items else []
+    dishes = []
+    total_guests = event.adult_guests + event.child_guests
+    
+    for dish_id in dish_ids:
+        dish = Dish.query.get(int(dish_id))
+        if dish:
+            # Calculate cost for this dish
+            dish_ingredients = DishIngredient.query.filter_by(dish_id=dish.id).all()
+            dish_cost = 0.0
+            ingredients_list = []
+            
+            for di in dish_ingredients:
+                ingredient = Ingredient.query.get(di.ingredient_id)
+                scaled_quantity = (di.quantity_for_base_servings / dish.base_servings) * total_guests
+                cost = scaled_quantity * ingredient.unit_price
+                dish_cost += cost
+                ingredients_list.append(ingredient.name)
+            
+            markup_amount = dish_cost * (dish.markup / 100)
+            selling_price = dish_cost + markup_amount
+            
+            dishes.append({
+                'name': dish.name,
+                'ingredients': ', '.join(ingredients_list) if ingredients_list else dish.description or 'No ingredients listed',
+                'total_price': selling_price,
+                'description': dish.description
+            })
+    
+    # Get booking if exists
+    booking = Booking.query.filter_by(event_id=event.id).first()
+    
+    return render_template('event_details.html', event=event, menu_items=dishes, booking=booking)
+
+
+@bp.route('/customer/event/<int:event_id>/edit', methods=['GET', 'POST'])
+@role_required('customer')
+def edit_event(event_id):
+    event = Event.query.get_or_404(event_id)
+    if event.customer_id != current_user.id:
+        flash('Access denied', 'danger')
+        return redirect(url_for('customer.customer_dashboard'))
+    
+    # Get existing booking if any
+    booking = Booking.query.filter_by(event_id=event.id).first()
+    
+    if request.method == 'POST':
+        # Store old values for comparison
+        old_total_cost = event.total_cost
+        old_chef_id = booking.chef_id if booking else None
+        
+        # Get form data
+        county = request.form.get('county')
+        sub_county = request.form.get('sub_county')
+        town = request.form.get('town')
+        adult_guests = int(request.form.get('adult_guests', 0))
+        child_guests = int(request.form.get('child_guests', 0))
+        event_date_str = request.form.get('event_date')
+        dishes = request.form.getlist('dishes')
+        custom_dishes_json = request.form.get('custom_dishes', '[]')
+        
+        event_date = datetime.strptime(event_date_str, '%Y-%m-%d')
+        total_guests = adult_guests + child_guests
+        
+        # Calculate new cost for regular menu dishes
+        total_cost = 0.0
+        for dish_id in dishes:
+            dish = Dish.query.get(int(dish_id))
+            dish_ingredients = DishIngredient.query.filter_by(dish_id=dish.id).all()
+
+            dish_cost = 0.0
+            for di in dish_ingredients:
+                ingredient = Ingredient.query.get(di.ingredient_id)
+                scaled_quantity = (di.quantity_for_base_servings / dish.base_servings) * total_guests
+                cost = scaled_quantity * ingredient.unit_price
+                dish_cost += cost
+
+            markup_amount = dish_cost * (dish.markup / 100)
+            selling_price = dish_cost + markup_amount
+            total_cost += selling_price
+        
+        # Calculate cost for custom dishes
+        try:
+            custom_dishes = json.loads(custom_dishes_json)
+            for custom_dish_id in custom_dishes:
+                dish = Dish.query.get(int(custom_dish_id))
+                if dish:
+                    dish_ingredients = DishIngredient.query.filter_by(dish_id=dish.id).all()
+                    dish_cost = 0.0
+                    for di in dish_ingredients:
+                        ingredient = Ingredient.query.get(di.ingredient_id)
+                        scaled_quantity = (di.quantity_for_base_servings / dish.base_servings) * total_guests
+                        cost = scaled_quantity * ingredient.unit_price
+                        dish_cost += cost
+                    markup_amount = dish_cost * (dish.markup / 100)
+                    selling_price = dish_cost + markup_amount
+                    total_cost += selling_price
+                    dishes.append(str(custom_dish_id))
+        except:
+            pass
+        
+        # Update event details
+        event.county = county
+        event.sub_county = sub_county
+        event.town = town
+        event.adult_guests = adult_guests
+        event.child_guests = child_guests
+        event.event_date = event_date
+        event.menu_items = ','.join(dishes)
+        event.total_cost = total_cost
+        
+        # Handle booking and payment adjustments
+        if booking:
+            # Get deposit percentage
+            deposit_config = SystemConfig.query.filter_by(key='deposit_percentage').first()
+            deposit_percentage = float(deposit_config.value) if deposit_config else 30.0
+            
+            # Calculate new deposit amount
+            new_deposit_amount = (total_cost * deposit_percentage) / 100
+            old_deposit_amount = booking.deposit_amount
+            
+            # Check if price increased
+            if total_cost > old_total_cost:
+                # Calculate additional deposit needed
+                additional_deposit = new_deposit_amount - old_deposit_amount
+                
+                # Update booking deposit amount
+                booking.deposit_amount = new_deposit_amount
+                booking.status = 'pending'  # Reset to pending for additional payment
+                
+                db.session.commit()
+                
+                flash(f'Event updated! The total cost increased by KES {total_cost - old_total_cost:,.0f}. You need to pay an additional deposit of KES {additional_deposit:,.0f}.', 'warning')
+                return redirect(url_for('payments.pay_additional_deposit', booking_id=booking.id, additional_amount=additional_deposit))
+            else:
+                # Price stayed same or decreased - just update the event
+                booking.deposit_amount = new_deposit_amount
+                db.session.commit()
+                
+                flash('Event updated successfully! No additional payment required.', 'success')
+                return redirect(url_for('customer.match_chefs', event_id=event.id))
+        else:
+            # No booking yet, just update event
+            db.session.commit()
+            flash('Event updated successfully!', 'success')
+            return redirect(url_for('customer.match_chefs', event_id=event.id))
+    
+    # GET request - show edit form
+    dishes = Dish.query.all()
+    selected_dish_ids = event.menu_items.split(',') if event.menu_items else []
+    
+    return render_template('edit_event.html', event=event, dishes=dishes, selected_dish_ids=selected_dish_ids, booking=booking)
+
+
+@bp.route('/customer/create-event', methods=['GET', 'POST'])
+@role_required('customer')
+def create_event():
+    if request.method == 'POST':
+        county = request.form.get('county')
+        sub_county = request.form.get('sub_county')
+        town = request.form.get('town')
+        adult_guests = int(request.form.get('adult_guests', 0))
+        child_guests = int(request.form.get('child_guests', 0))
+        event_date_str = request.form.get('event_date')
+        dishes = request.form.getlist('dishes')
+        custom_dishes_json = request.form.get('custom_dishes', '[]')
+        
+        event_date = datetime.strptime(event_date_str, '%Y-%m-%d')
+        total_guests = adult_guests + child_guests
+        
+        # Calculate cost for regular menu dishes
+        total_cost = 0.0
+        for dish_id in dishes:
+            dish = Dish.query.get(int(dish_id))
+            dish_ingredients = DishIngredient.query.filter_by(dish_id=dish.id).all()
+
+            dish_cost = 0.0
+            for di in dish_ingredients:
+                ingredient = Ingredient.query.get(di.ingredient_id)
+                scaled_quantity = (di.quantity_for_base_servings / dish.base_servings) * total_guests
+                cost = scaled_quantity * ingredient.unit_price
+                dish_cost += cost
+
+            markup_amount = dish_cost * (dish.markup / 100)
+            selling_price = dish_cost + markup_amount
+            total_cost += selling_price
+        
+        # Calculate cost for custom dishes
+        try:
+            custom_dishes = json.loads(custom_dishes_json)
+            for custom_dish_id in custom_dishes:
+                dish = Dish.query.get(int(custom_dish_id))
+                if dish:
+                    dish_ingredients = DishIngredient.query.filter_by(dish_id=dish.id).all()
+                    dish_cost = 0.0
+                    for di in dish_ingredients:
+                        ingredient = Ingredient.query.get(di.ingredient_id)
+                        scaled_quantity = (di.quantity_for_base_servings / dish.base_servings) * total_guests
+                        cost = scaled_quantity * ingredient.unit_price
+                        dish_cost += cost
+                    markup_amount = dish_cost * (dish.markup / 100)
+                    selling_price = dish_cost + markup_amount
+                    total_cost += selling_price
+                    # Add custom dish to dishes list
+                    dishes.append(str(custom_dish_id))
+        except:
+            pass  # If custom dishes parsing fails, continue with regular dishes only
+        
+        event = Event(
+            customer_id=current_user.id,
+            county=county,
+            sub_county=sub_county,
+            town=town,
+            adult_guests=adult_guests,
+            child_guests=child_guests,
+            event_date=event_date,
+            menu_items=','.join(dishes),
+            total_cost=total_cost
+        )
+        db.session.add(event)
+        db.session.commit()
+        
+        flash('Event created successfully!', 'success')
+        return redirect(url_for('customer.match_chefs', event_id=event.id))
+    
+    dishes = Dish.query.all()
+    return render_template('create_event.html', dishes=dishes)
+
+
+@bp.route('/customer/event/<int:event_id>/match-chefs')
+@role_required('customer')
+def match_chefs(event_id):
+    event = Event.query.get_or_404(event_id)
+    if event.customer_id != current_user.id:
+        flash('Access denied', 'danger')
+        return redirect(url_for('customer.customer_dashboard'))
+    
+    chefs = chef_summaries(Chef.query.filter_by(
+        is_verified=True,
+        is_approved=True,
+        county=event.county,
+        sub_county=event.sub_county,
+        town=event.town
+    ).order_by(Chef.ranking_score.desc()))
+    
+    if not chefs:
+        chefs = chef_summaries(Chef.query.filter_by(
+            is_verified=True,
+            is_approved=True,
+            county=event.county,
+            sub_county=event.sub_county
+        ).order_by(Chef.ranking_score.desc()))
+    
+    if not chefs:
+        chefs = chef_summaries(Chef.query.filter_by(
+            is_verified=True,
+            is_approved=True,
+            county=event.county
+        ).order_by(Chef.ranking_score.desc()))
+    
+    return render_template('match_chefs.html', event=event, chefs=chefs)
+
+
+@bp.route('/customer/event/<int:event_id>/book/<int:chef_id>')
+@role_required('customer')
+def book_chef(event_id, chef_id):
+    event = Event.query.get_or_404(event_id)
+    chef = Chef.query.get_or_404(chef_id)
+    
+    if event.customer_id != current_user.id:
+        flash('Access denied', 'danger')
+        return redirect(url_for('customer.customer_dashboard'))
+    
+    deposit_config = SystemConfig.query.filter_by(key='deposit_percentage').first()
+    deposit_percentage = float(deposit_config.value) if deposit_config else 30.0
+    
+    deposit_amount = (event.total_cost * deposit_percentage) / 100
+    
+    booking = Booking(
+        event_id=event.id,
+        chef_id=chef.id,
+        deposit_amount=deposit_amount,
+        status='pending'
+    )
+    db.session.add(booking)
+    db.session.commit()
+    
+    flash('Chef selected! Please proceed to payment.', 'success')
+    return redirect(url_for('payments.pay_booking', booking_id=booking.id))
+
+
+@bp.route('/api/calculate-dish-price', methods=['POST'])
+@login_required
+def calculate_dish_price():
+    dish_id_str = request.form.get('dish_id')
+    guests = int(request.form.get('guests'))
+
+    # Check if this is a custom dish (prefixed with 'custom_')
+    is_custom = str(dish_id_str).startswith('custom_')
+    
+    if is_custom:
+        # Extract the actual ID from 'custom_123' format
+        actual_id = int(dish_id_str.replace('custom_', ''))
+        dish = CustomDish.query.get_or_404(actual_id)
+        dish_ingredients = CustomDishIngredient.query.filter_by(dish_id=dish.id).all()
+        
+        total_cost = 0.0
+        ingredient_breakdown = []
+
+        for di in dish_ingredients:
+            ingredient = CustomIngredient.query.get(di.ingredient_id)
+            scaled_quantity = (di.quantity_for_base_servings / dish.base_servings) * guests
+            cost = scaled_quantity * ingredient.unit_price
+            total_cost += cost
+            ingredient_breakdown.append({
+                'name': ingredient.name,
+                'scaled_quantity': round(scaled_quantity, 2),
+                'unit': ingredient.unit,
+                'cost': round(cost, 2)
+            })
+    else:
+        # Regular dish from main database
+        dish_id = int(dish_id_str)
+        dish = Dish.query.get_or_404(dish_id)
+        dish_ingredients = DishIngredient.query.filter_by(dish_id=dish.id).all()
+
+        total_cost = 0.0
+        ingredient_breakdown = []
+
+        for di in dish_ingredients:
+            ingredient = Ingredient.query.get(di.ingredient_id)
+            scaled_quantity = (di.quantity_for_base_servings / dish.base_servings) * guests
+            cost = scaled_quantity * ingredient.unit_price
+            total_cost += cost
+            ingredient_breakdown.append({
+                'name': ingredient.name,
+                'scaled_quantity': round(scaled_quantity, 2),
+                'unit': ingredient.unit,
+                'cost': round(cost, 2)
+            })
+
+    markup_amount = total_cost * (dish.markup / 100)
+    selling_price = total_cost + markup_amount
+
+    return jsonify({
+        'dish_name': dish.name,
+        'guests': guests,
+        'ingredient_breakdown': ingredient_breakdown,
+        'total_cost': round(total_cost, 2),
+        'markup_percentage': dish.markup,
+        'markup_amount': round(markup_amount, 2),
+        'selling_price': round(selling_price, 2)
+    })
+
+
+@bp.route('/api/check-custom-dish', methods=['POST'])
+@login_required
+def check_custom_dish():
+    """Check if a custom dish exists in the custom dish database and return its details"""
+    dish_name = request.form.get('dish_name', '').strip()
+    
+    if not dish_name:
+        return jsonify({'success': False, 'message': 'Please enter a dish name'})
+    
+    # Ranked full-text search; tolerates typos. Only a dish whose name matches counts as found
+    named = search_custom_dishes(dish_name, limit=1, names_only=True)
+    # Dishes that mention the words elsewhere, or share only some of them, are suggestions
+    suggestions = search_custom_dishes(dish_name, limit=CUSTOM_DISH_MATCHES + 1) \
+        or search_custom_dishes(dish_name, limit=CUSTOM_DISH_MATCHES, match_all=False)
+    
+    if not named:
+        return jsonify({
+            'success': False, 
+            'found': False,
+            'message': f'"{dish_name}" is not in our custom menu database',
+            'suggestions': [{'id': f'custom_{m.id}', 'name': m.name} for m in suggestions[:CUSTOM_DISH_MATCHES]]
+        })
+    dish = named[0]
+    suggestions = [m for m in suggestions if m.id != dish.id][:CUSTOM_DISH_MATCHES - 1]
+    
+    # Get dish ingredients from custom dish database
+    dish_ingredients = db.session.query(CustomDishIngredient, CustomIngredient).join(
+        CustomIngredient, CustomIngredient.id == CustomDishIngredient.ingredient_id
+    ).filter(CustomDishIngredient.dish_id == dish.id).all()
+    
+    ingredients_list = []
+    total_base_cost = 0.0
+    
+    for di, ingredient in dish_ingredients:
+        ingredient_cost = di.quantity_for_base_servings * ingredient.unit_price
+        total_base_cost += ingredient_cost
+        
+        ingredients_list.append({
+            'name': ingredient.name,
+            'quantity': di.quantity_for_base_servings,
+            'unit': ingredient.unit,
+            'unit_price': ingredient.unit_price,
+            'total_cost': round(ingredient_cost, 2)
+        })
+    
+    markup_amount = total_base_cost * (dish.markup / 100)
+    base_selling_price = total_base_cost + markup_amount
+    
+    return jsonify({
+        'success': True,
+        'found': True,
+        'dish': {
+            'id': f'custom_{dish.id}',  # Prefix with 'custom_' to distinguish from regular dishes
+            'name': dish.name,
+            'description': dish.description,
+            'base_servings': dish.base_servings,
+            'markup': dish.markup,
+            'ingredients': ingredients_list,
+            'total_base_cost': round(total_base_cost, 2),
+            'markup_amount': round(markup_amount, 2),
+            'base_selling_price': round(base_selling_price, 2)
+        },
+        # Other dishes matching the search, best first, so the customer can pick a different one
+        'suggestions': [{'id': f'custom_{m.id}', 'name': m.name} for m in suggestions]
+    })
+
+
+@bp.route('/api/request-custom-dish', methods=['POST'])
+@login_required
+def request_custom_dish():
+    """Send email request for a custom dish not in the database"""
+    dish_name = request.form.get('dish_name', '').strip()
+    additional_notes = request.form.get('notes', '').strip()
+    
+    if not dish_name:
+        return jsonify({'success': False, 'message': 'Please enter a dish name'})
+    
+    # Get admin email from system config
+    gmail_user = SystemConfig.query.filter_by(key='gmail_user').first()
+    gmail_password = SystemConfig.query.filter_by(key='gmail_password').first()
+    
+    if not gmail_user or not gmail_password:
+        return jsonify({
+            'success': False, 
+            'message': 'Email system not configured. Please contact administrator.'
+        })
+    
+    # Send email to admin
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+    import smtplib
+    
+    msg = MIMEMultipart()
+    msg['From'] = gmail_user.value
+    msg['To'] = gmail_user.value  # Send to admin email
+    msg['Subject'] = f'Custom Dish Request - {dish_name}'
+    
+    body = f"""
+    Custom Dish Request from e-Rugah Customer
+    
+    Customer: {current_user.email}
+    Requested Dish: {dish_name}
+    Additional Notes: {additional_notes if additional_notes else 'None'}
+    
+    Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+    
+    Please review this request and add the dish to the menu if appropriate.
+    
+    Best regards,
+    e-Rugah System
+    """
+    
+    msg.attach(MIMEText(body, 'plain'))
+    
+    try:
+        server = smtplib.SMTP('smtp.gmail.com', 587)
+        server.starttls()
+        server.login(gmail_user.value, gmail_password.value)
+        text = msg.as_string()
+        server.sendmail(gmail_user.value, gmail_user.value, text)
+        server.quit()
+        
+        return jsonify({
+            'success': True, 
+            'message': 'Your request has been sent to the administrator. We will review and add it to our menu soon!'
+        })
+    except Exception as e:
+        print(f"[ERROR] Failed to send custom dish request email: {e}")
+        return jsonify({
+            'success': False, 
+            'message': 'Failed to send request. Please try again later.'
+        })
+
+
+# Chef Rating Routes
+@bp.route('/booking/<int:booking_id>/rate', methods=['POST'])
+@role_required('customer')
+def rate_chef(booking_id):
+    """Submit a rating for a completed booking"""
+    try:
+        booking = Booking.query.get_or_404(booking_id)
+        
+        # Verify booking belongs to current user
+        if booking.event.customer_id != current_user.id:
+            return jsonify({'success': False, 'message': 'Access denied'}), 403
+        
+        # Verify booking is confirmed
+        if booking.status != 'confirmed':
+            return jsonify({'success': False, 'message': 'Can only rate confirmed bookings'}), 400
+        
+        # Verify event has passed
+        if booking.event.event_date > datetime.utcnow():
+            return jsonify({'success': False, 'message': 'Can only rate after event completion'}), 400
+        
+        # Verify not already rated
+        if booking.rating_value is not None:
+            return jsonify({'success': False, 'message': 'You have already rated this chef'}), 400
+        
+        data = request.get_json()
+        rating_value = int(data.get('rating', 0))
+        rating_comment = data.get('comment', '').strip()
+        
+        # Validate rating
+        if rating_value < 1 or rating_value > 5:
+            return jsonify({'success': False, 'message': 'Rating must be between 1 and 5'}), 400
+        
+        # Update booking with rating (only if no concurrent request rated it first)
+        if not claim_booking_rating(booking.id, rating_value, rating_comment if rating_comment else None):
+            db.session.rollback()
+            return jsonify({'success': False, 'message': 'You have already rated this chef'}), 400
+        
+        # Update chef's rating aggregates
+        chef = booking.chef
+        add_chef_rating(chef.id, rating_value)
+        
+        db.session.commit()
+        invalidate_fragments('featured_chefs')  # the home page carousel shows chef ratings
+        
+        return jsonify({
+            'success': True,
+            'message': 'Thank you for rating your chef!',
+            'new_average': chef.average_rating
+        })
+        
+    except Exception as e:
+        db.session.rollback()
+        print(f"[ERROR] Failed to submit rating: {e}")
+        return jsonify({'success': False, 'message': 'Failed to submit rating. Please try again.'}), 500
@@ -0,0 +1,95 @@
+"""
+M-Pesa deposit payments and the STK push callback.
+"""
+from flask import Blueprint, flash, jsonify, redirect, render_template, request, url_for
+from flask_login import current_user, login_required
+from models import db, Booking, Event, Payment
+from payments import handle_mpesa_callback, initiate_mpesa_stk
+
+bp = Blueprint('payments', __name__)
+
+
+@bp.route('/booking/<int:booking_id>/pay', methods=['GET', 'POST'])
+@login_required
+def pay_booking(booking_id):
+    booking = Booking.query.get_or_404(booking_id)
+    event = Event.query.get(booking.event_id)
+    
+    if event.customer_id != current_user.id:
+        flash('Access denied', 'danger')
+        return redirect(url_for('customer.customer_dashboard'))
+    
+    if request.method == 'POST':
+        phone = request.form.get('phone')
+        
+        payment = Payment(
+            booking_id=booking.id,
+            phone_number=phone,
+            amount=booking.deposit_amount,
+            status='pending'
+        )
+        db.session.add(payment)
+        db.session.commit()
+        
+        result = initiate_mpesa_stk(phone, booking.deposit_amount, booking.id)
+        
+        if result.get('success'):
+            flash('Payment initiated successfully! Please check your phone.', 'success')
+            return redirect(url_for('payments.payment_status', booking_id=booking.id))
+        else:
+            flash('Payment initiation failed. Please try again.', 'danger')
+    
+    return render_template('pay_booking.html', booking=booking, event=event)
+
+
+@bp.route('/booking/<int:booking_id>/payment-status')
+@login_required
+def payment_status(booking_id):
+    booking = Booking.query.get_or_404(booking_id)
+    event = Event.query.get(booking.event_id)
+    payment = Payment.query.filter_by(booking_id=booking.id).order_by(Payment.created_at.desc()).first()
+    
+    return render_template('payment_status.html', booking=booking, event=event, payment=payment)
+
+
+@bp.route('/booking/<int:booking_id>/pay-additional', methods=['GET', 'POST'])
+@login_required
+def pay_additional_deposit(booking_id):
+    booking = Booking.query.get_or_404(booking_id)
+    event = Event.query.get(booking.event_id)
+    
+    if event.customer_id != current_user.id:
+        flash('Access denied', 'danger')
+        return redirect(url_for('customer.customer_dashboard'))
+    
+    # Get additional amount from query parameter
+    additional_amount = float(request.args.get('additional_amount', 0))
+    
+    if request.method == 'POST':
+        phone = request.form.get('phone')
+        
+        payment = Payment(
+            booking_id=booking.id,
+            phone_number=phone,
+            amount=additional_amount,
+            status='pending'
+        )
+        db.session.add(payment)
+        db.session.commit()
+        
+        result = initiate_mpesa_stk(phone, additional_amount, booking.id)
+        
+        if result.get('success'):
+            flash('Additional payment initiated successfully! Please check your phone.', 'success')
+            return redirect(url_for('payments.payment_status', booking_id=booking.id))
+        else:
+            flash('Payment initiation failed. Please try again.', 'danger')
+    
+    return render_template('pay_additional_deposit.html', booking=booking, event=event, additional_amount=additional_amount)
+
+
+@bp.route('/mpesa/callback', methods=['POST'])
+def mpesa_callback():
+    callback_data = request.get_json()
+    result = handle_mpesa_callback(callback_data)
+    return jsonify(result)
@@ -0,0 +1,234 @@
+"""
+Public pages: home page, customer reviews API and the contact form.
+"""
+from flask import Blueprint, current_app, jsonify, render_template, request, send_from_directory, url_for
+from flask_login import current_user, login_required
+from datetime import datetime
+from models import db, Chef, Review, SystemConfig
+from reviews_feed import DEFAULT_PAGE_SIZE, InvalidCursor, get_reviews_page
+from chef_ranking import ranked_order
+from review_stats import get_review_summary
+
+bp = Blueprint('public', __name__)
+
+
+def load_featured_chefs():
+    return Chef.query.filter(
+        Chef.is_verified.is_(True),
+        Chef.is_approved.is_(True)
+    ).order_by(*ranked_order()).limit(12).all()
+
+
+@bp.route('/')
+def index():
+    # Show welcome page for non-logged-in users
+    # Show full content (hero + all sections) for logged-in users
+    # The chef carousel is a cached fragment: the query only runs when it is re-rendered
+    if current_user.is_authenticated:
+        return render_template('index.html', load_featured_chefs=load_featured_chefs)
+    else:
+        return render_template('welcome.html', load_featured_chefs=load_featured_chefs)
+
+
+@bp.route('/reviews/<path:filename>')
+def reviews_files(filename):
+    return send_from_directory('reviews', filename)
+
+
+# Review Routes
+@bp.route('/api/reviews', methods=['GET'])
+def get_reviews():
+    """Get a page of approved reviews, newest first.
+
+    Query params: limit (default 20, max 100) and cursor (from the X-Next-Cursor
+    header of the previous page). Responses carry an ETag so browsers get 304s.
+    """
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+        body, etag, next_cursor = get_reviews_page(request.args.get('cursor'), limit)
+    except (ValueError, InvalidCursor):
+        return jsonify({'success': False, 'message': 'Invalid limit or cursor'}), 400
+
+    response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+        response.headers['Link'] = f'<{url_for("public.get_reviews", limit=limit, cursor=next_cursor)}>; rel="next"'
+    return response.make_conditional(request)
+
+
+@bp.route('/api/reviews/summary', methods=['GET'])
+def get_reviews_summary():
+    """Rating count, average and 1-5 star histogram overall and per event type"""
+    body, etag = get_review_summary()
+    response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+@bp.route('/api/reviews', methods=['POST'])
+def submit_review():
+    """Submit a new review"""
+    try:
+        data = request.get_json()
+        
+        # Validate required fields
+        if not all(k in data for k in ['customer_name', 'event_type', 'rating', 'review_text']):
+            return jsonify({'success': False, 'message': 'All fields are required'}), 400
+        
+        # Validate rating
+        rating = int(data['rating'])
+        if rating < 1 or rating > 5:
+            return jsonify({'success': False, 'message': 'Rating must be between 1 and 5'}), 400
+        
+        # Create new review
+        review = Review(
+            customer_name=data['customer_name'],
+            event_type=data['event_type'],
+            rating=rating,
+            review_text=data['review_text'],
+            is_approved=False  # Requires admin approval
+        )
+        
+        db.session.add(review)
+        db.session.commit()
+        
+        return jsonify({
+            'success': True,
+            'message': 'Thank you for your review! It will be published after admin approval.'
+        })
+    except Exception as e:
+        db.session.rollback()
+        print(f"[ERROR] Failed to submit review: {e}")
+        return jsonify({'success': False, 'message': 'Failed to submit review. Please try again.'}), 500
+
+
+@bp.route('/test-reviews')
+def test_reviews():
+    """Test page for reviews API"""
+    return render_template('test_reviews.html')
+
+
+@bp.route('/send-message', methods=['POST'])
+@login_required
+def send_message():
+    """Send a message from logged-in user to admin email"""
+    try:
+        data = request.get_json()
+        name = data.get('name', '').strip()
+        email = data.get('email', '').strip()
+        subject = data.get('subject', '').strip()
+        message = data.get('message', '').strip()
+        
+        # Validate inputs
+        if not all([name, email, subject, message]):
+            return jsonify({'success': False, 'message': 'All fields are required'}), 400
+        
+        # Get email configuration from database
+        email_configs = SystemConfig.query.filter(SystemConfig.key.in_([
+            'gmail_user', 'gmail_password', 'smtp_host', 'smtp_port', 
+            'smtp_encryption', 'admin_email', 'sender_name', 'email_timeout'
+        ])).all()
+        
+        config_dict = {config.key: config.value for config in email_configs}
+        
+        gmail_user = config_dict.get('gmail_user')
+        gmail_password = config_dict.get('gmail_password')
+        smtp_host = config_dict.get('smtp_host', 'smtp.gmail.com')
+        smtp_port = int(config_dict.get('smtp_port', 587))
+        smtp_encryption = config_dict.get('smtp_encryption', 'tls')
+        admin_email = config_dict.get('admin_email', gmail_user)
+        sender_name = config_dict.get('sender_name', 'e-Rugah Contact Form')
+        email_timeout = int(config_dict.get('email_timeout', 30))
+        
+        if not gmail_user or not gmail_password:
+            return jsonify({
+                'success': False, 
+                'message': 'Email system not configured. Please contact administrator.'
+            }), 500
+        
+        # Send email using SMTP
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        import smtplib
+        
+        msg = MIMEMultipart('alternative')
+        msg['From'] = f'{sender_name} <{gmail_user}>'
+        msg['To'] = admin_email
+        msg['Subject'] = f'e-Rugah Contact: {subject}'
+        msg['Reply-To'] = email
+        
+        # Plain text version
+        text_body = f"""
+New Message from e-Rugah Contact Form
+
+From: {name}
+Email: {email}
+Subject: {subject}
+
+Message:
+{message}
+
+---
+Sent via e-Rugah Contact Form
+Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        """
+        
+        # HTML version
+        html_body = f"""
+        <html>
+            <body style="font-family: Arial, sans-serif; padding: 20px; background-color: #f5f5f5;">
+                <div style="max-width: 600px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                    <h2 style="color: #ff6b35; border-bottom: 3px solid #ff6b35; padding-bottom: 10px;">New Contact Form Message</h2>
+                    
+                    <div style="margin: 20px 0;">
+                        <p style="margin: 10px 0;"><strong style="color: #333;">From:</strong> {name}</p>
+                        <p style="margin: 10px 0;"><strong style="color: #333;">Email:</strong> <a href="mailto:{email}" style="color: #ff6b35;">{email}</a></p>
+                        <p style="margin: 10px 0;"><strong style="color: #333;">Subject:</strong> {subject}</p>
+                    </div>
+                    
+                    <div style="background-color: #fff8f5; padding: 20px; border-left: 4px solid #ff6b35; margin: 20px 0;">
+                        <p style="margin: 0; color: #333; line-height: 1.6;">{message.replace(chr(10), '<br>')}</p>
+                    </div>
+                    
+                    <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
+                    
+                    <p style="color: #666; font-size: 12px; margin: 10px 0;">
+                        Sent via e-Rugah Contact Form<br>
+                        Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+                    </p>
+                </div>
+            </body>
+        </html>
+        """
+        
+        msg.attach(MIMEText(text_body, 'plain'))
+        msg.attach(MIMEText(html_body, 'html'))
+        
+        # Send email with configured settings
+        if smtp_encryption == 'ssl':
+            server = smtplib.SMTP_SSL(smtp_host, smtp_port, timeout=email_timeout)
+        else:
+            server = smtplib.SMTP(smtp_host, smtp_port, timeout=email_timeout)
+            if smtp_encryption == 'tls':
+                server.starttls()
+        
+        server.login(gmail_user, gmail_password)
+        server.send_message(msg)
+        server.quit()
+        
+        return jsonify({
+            'success': True, 
+            'message': 'Your message has been sent successfully! We will get back to you soon.'
+        })
+        
+    except Exception as e:
+        print(f"[ERROR] Failed to send message: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({
+            'success': False, 
+            'message': 'Failed to send message. Please try again later.'
+        }), 500
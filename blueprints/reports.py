@@ -0,0 +1,167 @@
+"""
+Admin reports and CSV/PDF exports (reportlab is imported only when a PDF is exported).
+"""
+from flask import Blueprint, render_template, request, send_file
+from datetime import datetime
+import csv
+import io
+from models import db, Booking, Chef, Event, Payment
+from blueprints import role_required
+
+bp = Blueprint('reports', __name__)
+
+
+@bp.route('/admin/reports')
+@role_required('admin')
+def reports():
+    start_date = request.args.get('start_date')
+    end_date = request.args.get('end_date')
+    chef_id = request.args.get('chef_id')
+    county = request.args.get('county')
+    
+    query = db.session.query(Booking, Event, Chef, Payment).join(
+        Event, Booking.event_id == Event.id
+    ).join(
+        Chef, Booking.chef_id == Chef.id
+    ).outerjoin(
+        Payment, Booking.id == Payment.booking_id
+    )
+    
+    if start_date:
+        query = query.filter(Booking.created_at >= datetime.strptime(start_date, '%Y-%m-%d'))
+    if end_date:
+        query = query.filter(Booking.created_at <= datetime.strptime(end_date, '%Y-%m-%d'))
+    if chef_id:
+        query = query.filter(Booking.chef_id == int(chef_id))
+    if county:
+        query = query.filter(Event.county == county)
+    
+    results = query.all()
+    chefs = Chef.query.filter_by(is_approved=True).all()
+    
+    total_deposits = sum(r.Payment.amount for r in results if r.Payment and r.Payment.status == 'success')
+    
+    return render_template('reports.html',
+                         results=results,
+                         chefs=chefs,
+                         total_deposits=total_deposits,
+                         start_date=start_date,
+                         end_date=end_date,
+                         chef_id=chef_id,
+                         county=county)
+
+
+@bp.route('/admin/reports/export-csv')
+@role_required('admin')
+def export_csv():
+    start_date = request.args.get('start_date')
+    end_date = request.args.get('end_date')
+    
+    query = db.session.query(Booking, Event, Chef, Payment).join(
+        Event, Booking.event_id == Event.id
+    ).join(
+        Chef, Booking.chef_id == Chef.id
+    ).outerjoin(
+        Payment, Booking.id == Payment.booking_id
+    )
+    
+    if start_date:
+        query = query.filter(Booking.created_at >= datetime.strptime(start_date, '%Y-%m-%d'))
+    if end_date:
+        query = query.filter(Booking.created_at <= datetime.strptime(end_date, '%Y-%m-%d'))
+    
+    results = query.all()
+    
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(['Booking ID', 'Event Date', 'Chef Name', 'Location', 'Guests', 'Total Cost', 'Deposit', 'Status', 'Payment Status'])
+    
+    for booking, event, chef, payment in results:
+        writer.writerow([
+            booking.id,
+            event.event_date.strftime('%Y-%m-%d'),
+            chef.name,
+            f"{event.county}, {event.sub_county}, {event.town}",
+            event.adult_guests + event.child_guests,
+            event.total_cost,
+            booking.deposit_amount,
+            booking.status,
+            payment.status if payment else 'N/A'
+        ])
+    
+    output.seek(0)
+    return send_file(
+        io.BytesIO(output.getvalue().encode()),
+        mimetype='text/csv',
+        as_attachment=True,
+        download_name='bookings_report.csv'
+    )
+
+
+@bp.route('/admin/reports/export-pdf')
+@role_required('admin')
+def export_pdf():
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib import colors
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet
+
+    start_date = request.args.get('start_date')
+    end_date = request.args.get('end_date')
+    
+    query = db.session.query(Booking, Event, Chef, Payment).join(
+        Event, Booking.event_id == Event.id
+    ).join(
+        Chef, Booking.chef_id == Chef.id
+    ).outerjoin(
+        Payment, Booking.id == Payment.booking_id
+    )
+    
+    if start_date:
+        query = query.filter(Booking.created_at >= datetime.strptime(start_date, '%Y-%m-%d'))
+    if end_date:
+        query = query.filter(Booking.created_at <= datetime.strptime(end_date, '%Y-%m-%d'))
+    
+    results = query.all()
+    
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    elements = []
+    styles = getSampleStyleSheet()
+    
+    elements.append(Paragraph("e-Rugah Bookings Report", styles['Title']))
+    elements.append(Spacer(1, 12))
+    
+    data = [['Booking ID', 'Event Date', 'Chef', 'Guests', 'Cost', 'Status']]
+    for booking, event, chef, payment in results:
+        data.append([
+            str(booking.id),
+            event.event_date.strftime('%Y-%m-%d'),
+            chef.name,
+            str(event.adult_guests + event.child_guests),
+            f"KES {event.total_cost:.2f}",
+            booking.status
+        ])
+    
+    table = Table(data)
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    
+    elements.append(table)
+    doc.build(elements)
+    
+    buffer.seek(0)
+    return send_file(
+        buffer,
+        mimetype='application/pdf',
+        as_attachment=True,
+        download_name='bookings_report.pdf'
+    )
@@ -0,0 +1,234 @@
+"""
+Email/SMS verification code endpoints.
+"""
+from flask import Blueprint, jsonify, request, session
+from flask_login import current_user, login_user
+from datetime import datetime
+from models import db, Chef, User
+from code_store import get_code_store
+from rate_limit import Limit, rate_limited
+from verification import is_sms_verification_enabled, send_email_code, send_sms_code, verify_code
+from app_logging import get_logger
+from identity import invalidate_identity
+from blueprints import role_required
+
+log = get_logger(__name__)
+
+bp = Blueprint('verification', __name__)
+
+
+def complete_chef_registration_from_session():
+    """Create the chef account from session data and return a JSON response."""
+    reg_data = session.get('chef_registration')
+    if not reg_data:
+        return jsonify({'success': False, 'message': 'Registration data not found'})
+
+    try:
+        user = User(email=reg_data['email'], role='chef')
+        user.set_password(reg_data['password'])
+        db.session.add(user)
+        db.session.flush()
+
+        chef = Chef(
+            user_id=user.id,
+            name=reg_data['name'],
+            phone=reg_data['phone'],
+            county=reg_data['county'],
+            sub_county=reg_data['sub_county'],
+            town=reg_data['town'],
+            about=reg_data['about'],
+            meals_offered=','.join(reg_data['meals']),
+            photo_url=reg_data['photo_url'],
+            is_verified=True,
+            is_approved=False
+        )
+        db.session.add(chef)
+        db.session.commit()
+
+        session.pop('chef_registration', None)
+        login_user(user)
+
+        return jsonify({'success': True, 'message': 'Registration completed successfully! Awaiting admin approval.', 'redirect': '/chef/pending'})
+    except Exception:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': 'Registration failed. Please try again.'})
+
+
+@bp.route('/send_email_code', methods=['POST'])
+@rate_limited('send_email_code', ip=Limit(20, 3600), email=Limit(3, 300))
+def send_email_code_endpoint():
+    email = request.json.get('email')
+    if not email:
+        return jsonify({'success': False, 'message': 'Email is required'})
+
+    try:
+        # Send email and get the code
+        success, code = send_email_code(email)
+        
+        # Return appropriate message based on whether email was sent
+        if success:
+            message = 'Verification code sent to your email'
+            return jsonify({'success': True, 'message': message})
+        else:
+            # Email sending failed (likely missing credentials)
+            return jsonify({
+                'success': False, 
+                'message': 'Failed to send email. Please check email configuration.'
+            })
+    except ValueError as e:
+        log.warning("email code not sent", email=email, reason=e)
+        return jsonify({'success': False, 'message': str(e)})
+    except Exception:
+        log.exception("exception sending email code", email=email)
+        return jsonify({'success': False, 'message': 'An error occurred while sending the code'})
+
+
+@bp.route('/verify_email_code', methods=['POST'])
+def verify_email_code_endpoint():
+    email = request.json.get('email')
+    code = request.json.get('code')
+
+    if not email or not code:
+        return jsonify({'success': False, 'message': 'Email and code are required'})
+
+    success, message = verify_code(email, code, 'email')
+    log.debug("email code verification", email=email, success=success, result=message)
+    
+    if not success:
+        return jsonify({'success': False, 'message': message})
+
+    # Mark email as verified in database
+    user = User.query.filter_by(email=email).first()
+    if user:
+        user.email_verified = True
+        db.session.commit()
+        invalidate_identity(user.id)
+        log.info("email verified", email=email)
+
+    # Check if SMS verification is required
+    sms_enabled = is_sms_verification_enabled()
+    chef_verified = False
+    
+    if sms_enabled:
+        response_payload = {
+            'success': True,
+            'message': 'Email verified! Please verify your phone number.',
+            'require_sms': True,
+            'chef_verified': False
+        }
+        return jsonify(response_payload)
+    else:
+        # SMS disabled, mark chef as verified and build response
+        if user and user.chef:
+            user.chef.is_verified = True
+            db.session.commit()
+            chef_verified = True
+        
+        return jsonify({
+            'success': True,
+            'message': 'Email verified successfully!',
+            'require_sms': False,
+            'redirect': '/chef/dashboard',
+            'chef_verified': chef_verified
+        })
+
+
+@bp.route('/send_sms_code', methods=['POST'])
+@rate_limited('send_sms_code', ip=Limit(20, 3600), phone=Limit(3, 300))
+def send_sms_code_endpoint():
+    if not is_sms_verification_enabled():
+        return jsonify({'success': False, 'message': 'SMS verification is currently disabled.'})
+
+    phone = request.json.get('phone')
+    if not phone:
+        return jsonify({'success': False, 'message': 'Phone number is required'})
+
+    try:
+        # Send SMS and get the code
+        success, code = send_sms_code(phone)
+        
+        # Return appropriate message based on whether SMS was sent
+        if success:
+            message = 'Verification code sent to your phone'
+            return jsonify({'success': True, 'message': message})
+        else:
+            # SMS sending failed (likely missing credentials)
+            return jsonify({
+                'success': False,
+                'message': 'Failed to send SMS. Please check SMS configuration.'
+            })
+    except ValueError as e:
+        log.warning("sms code not sent", phone=phone, reason=e)
+        return jsonify({'success': False, 'message': str(e)})
+    except Exception:
+        log.exception("exception sending sms code", phone=phone)
+        return jsonify({'success': False, 'message': 'An error occurred while sending the code'})
+
+
+@bp.route('/verify_sms_code', methods=['POST'])
+def verify_sms_code_endpoint():
+    if not is_sms_verification_enabled():
+        return jsonify({'success': False, 'message': 'SMS verification is currently disabled.'})
+
+    phone = request.json.get('phone')
+    code = request.json.get('code')
+
+    if not phone or not code:
+        return jsonify({'success': False, 'message': 'Phone and code are required'})
+
+    success, message = verify_code(phone, code, 'sms')
+    
+    if success:
+        # Mark SMS as verified
+        user = User.query.filter_by(id=current_user.id).first()
+        if user:
+            user.sms_verified = True
+            
+            # Check if email is also verified
+            if user.email_verified:
+                # Both verified - mark chef as fully verified
+                if user.chef:
+                    user.chef.is_verified = True
+                db.session.commit()
+                invalidate_identity(user.id)
+                log.info("sms verified, all verifications complete", email=user.email)
+                return jsonify({
+                    'success': True,
+                    'message': 'SMS verified successfully!',
+                    'redirect': '/chef/dashboard'
+                })
+            else:
+                # SMS verified but email not yet verified
+                db.session.commit()
+                invalidate_identity(user.id)
+                log.info("sms verified, email verification pending", email=user.email)
+                return jsonify({
+                    'success': True,
+                    'message': 'SMS verified! Please verify your email to complete registration.',
+                    'require_email': True
+                })
+        
+        return jsonify({
+            'success': True,
+            'message': 'SMS verified successfully!',
+            'redirect': '/chef/dashboard'
+        })
+
+    return jsonify({'success': False, 'message': message})
+
+
+@bp.route('/debug/verification-codes')
+@role_required('admin')
+def debug_verification_codes():
+    """Debug endpoint to view verification codes"""
+    result = []
+    for code in get_code_store().recent(limit=10):
+        result.append({
+            'identifier': code['identifier'],
+            'code': code['code'],
+            'type': code['purpose'],
+            'is_used': code.get('is_used', False),
+            'expires_at': datetime.fromisoformat(code['expires_at']).strftime('%Y-%m-%d %H:%M:%S'),
+            'created_at': datetime.fromisoformat(code['created_at']).strftime('%Y-%m-%d %H:%M:%S')
+        })
+    return jsonify(result)
@@ -0,0 +1,238 @@
+"""
+Build the CSS/JS bundles served by assets.py.
+
+Every .css/.js file under assets/ is minified, written to static/dist/ under a
+content-hashed name (css/index.3f9a1c2b.css) with precompressed .gz and .br
+(pip install brotli; skipped without it) siblings, and listed in
+static/dist/manifest.json. Bundles from earlier builds are removed.
+
+The minifiers are deliberately conservative: strings, template literals and
+regular expressions are copied verbatim, and JS keeps its line breaks so
+automatic semicolon insertion behaves exactly as before.
+
+Usage: python build_assets.py [--check]   (--check: exit 1 if the build is stale)
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(ROOT, 'assets')
+DIST_DIR = os.path.join(ROOT, 'static', 'dist')
+MANIFEST_NAME = 'manifest.json'
+HASH_LENGTH = 8
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+CSS_PUNCTUATION = set('{};,>')
+
+
+def _scan_string(text, i):
+    """Index just past the quoted string (or template literal) starting at text[i]."""
+    quote = text[i]
+    i += 1
+    while i < len(text):
+        if text[i] == '\\':
+            i += 2
+            continue
+        if text[i] == quote:
+            return i + 1
+        i += 1
+    return i
+
+
+def minify_css(text):
+    out = []
+    i = 0
+    while i < len(text):
+        c = text[i]
+        if c in '"\'':
+            end = _scan_string(text, i)
+            out.append(text[i:end])
+            i = end
+        elif text.startswith('/*', i):
+            end = text.find('*/', i + 2)
+            i = len(text) if end == -1 else end + 2
+        elif c.isspace():
+            while i < len(text) and text[i].isspace():
+                i += 1
+            # A space after ':' never matters, one before it can ('a :hover' is a descendant selector)
+            if out and out[-1] not in CSS_PUNCTUATION and out[-1] != ':':
+                out.append(' ')
+        elif c in CSS_PUNCTUATION:
+            # Spaces around these are meaningless (unlike around ':' in selectors or +/- in calc())
+            if out and out[-1] == ' ':
+                out.pop()
+            if c == '}' and out and out[-1] == ';':
+                out.pop()
+            out.append(c)
+            i += 1
+        else:
+            out.append(c)
+            i += 1
+    return ''.join(out).strip() + '\n'
+
+
+# After these characters (or keywords) a '/' starts a regular expression, not a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = ('return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'void', 'delete', 'throw')
+
+
+def _regex_allowed(out):
+    code = ''.join(out[-40:]).rstrip()
+    if not code:
+        return True
+    if code[-1] in REGEX_PRECEDERS:
+        return True
+    return re.search(r'(?:^|[^\w$])(?:%s)$' % '|'.join(REGEX_KEYWORDS), code) is not None
+
+
+def _scan_regex(text, i):
+    i += 1
+    in_class = False
+    while i < len(text) and text[i] != '\n':
+        c = text[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '[':
+            in_class = True
+        elif c == ']':
+            in_class = False
+        elif c == '/' and not in_class:
+            i += 1
+            while i < len(text) and (text[i].isalnum() or text[i] == '_'):
+                i += 1  # flags
+            return i
+        i += 1
+    return i
+
+
+def minify_js(text):
+    out = []
+    i = 0
+    while i < len(text):
+        c = text[i]
+        if c in '"\'`':
+            end = _scan_string(text, i)
+            out.append(text[i:end])
+            i = end
+        elif text.startswith('//', i):
+            end = text.find('\n', i)
+            i = len(text) if end == -1 else end
+        elif text.startswith('/*', i):
+            end = text.find('*/', i + 2)
+            end = len(text) if end == -1 else end + 2
+            out.append('\n' if '\n' in text[i:end] else ' ')
+            i = end
+        elif c == '/' and _regex_allowed(out):
+            end = _scan_regex(text, i)
+            out.append(text[i:end])
+            i = end
+        elif c == '\n':
+            # Keep line breaks (ASI) but drop indentation, trailing blanks and empty lines
+            while out and out[-1] in (' ', '\t', '\r'):
+                out.pop()
+            if out and out[-1] != '\n':
+                out.append('\n')
+            i += 1
+            while i < len(text) and text[i] in ' \t\r\n':
+                i += 1
+        else:
+            out.append(c)
+            i += 1
+    return ''.join(out).strip() + '\n'
+
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+
+def hashed_name(name, content):
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    base, ext = os.path.splitext(name)
+    return f'{base}.{digest}{ext}'
+
+
+def source_files(source_dir):
+    for dirpath, _, filenames in os.walk(source_dir):
+        for filename in sorted(filenames):
+            if os.path.splitext(filename)[1] in MINIFIERS:
+                path = os.path.join(dirpath, filename)
+                yield os.path.relpath(path, source_dir).replace(os.sep, '/'), path
+
+
+def build(source_dir=SOURCE_DIR, dist_dir=DIST_DIR):
+    """Build every bundle; returns [(name, source bytes, minified bytes, gzip bytes, brotli bytes or None)]."""
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+    manifest = {}
+    report = []
+    for name, path in source_files(source_dir):
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+        content = MINIFIERS[os.path.splitext(name)[1]](text).encode('utf-8')
+        target = hashed_name(name, content)
+        out_path = os.path.join(dist_dir, target)
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+
+        with open(out_path, 'wb') as f:
+            f.write(content)
+        gzipped = gzip.compress(content, compresslevel=9, mtime=0)
+        with open(out_path + '.gz', 'wb') as f:
+            f.write(gzipped)
+        brotlied = None
+        if brotli is not None:
+            brotlied = brotli.compress(content, quality=11)
+            with open(out_path + '.br', 'wb') as f:
+                f.write(brotlied)
+
+        manifest[name] = target
+        report.append((name, len(text.encode('utf-8')), len(content), len(gzipped),
+                       len(brotlied) if brotlied is not None else None))
+
+    os.makedirs(dist_dir, exist_ok=True)
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return report
+
+
+def is_stale(source_dir=SOURCE_DIR, dist_dir=DIST_DIR):
+    try:
+        with open(os.path.join(dist_dir, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return True
+    for name, path in source_files(source_dir):
+        with open(path, encoding='utf-8') as f:
+            content = MINIFIERS[os.path.splitext(name)[1]](f.read()).encode('utf-8')
+        if manifest.get(name) != hashed_name(name, content):
+            return True
+    return False
+
+
+def main(argv):
+    if '--check' in argv:
+        stale = is_stale()
+        print("Asset bundles are stale, run python build_assets.py" if stale else "Asset bundles are up to date")
+        return 1 if stale else 0
+
+    report = build()
+    if brotli is None:
+        print("brotli not installed: .br files skipped (pip install brotli)")
+    print(f"{'bundle':<28}{'source':>10}{'minified':>10}{'gzip':>10}{'brotli':>10}")
+    for name, source, minified, gzipped, brotlied in report:
+        print(f"{name:<28}{source:>10}{minified:>10}{gzipped:>10}{brotlied if brotlied is not None else '-':>10}")
+    print(f"\n{len(report)} bundle(s) written to {os.path.relpath(DIST_DIR, ROOT)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,184 @@
+"""
+Check the query plans behind every page.
+
+Requests each read-only GET route as an admin, a chef and a customer against a
+throwaway copy of the database, captures the SQL each request runs and prints
+EXPLAIN QUERY PLAN for it. Pending migrations are applied to the copy first,
+so a database that 'flask migrate' has not upgraded yet can still be checked. Filtered queries that still do a full table scan
+(SCAN <table> without an index) are flagged and make the script exit with 1.
+Tables under --min-rows rows are ignored: SQLite rightly scans tiny tables once
+ANALYZE has run.
+
+Usage: python check_query_plans.py [path/to/erugah.db] [--verbose] [--min-rows=100]
+"""
+import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+# Routes that change data, send mail/SMS or serve files are never requested
+SKIP_ENDPOINTS = {
+    'static', 'public.reviews_files', 'auth.logout', 'admin.approve_chef', 'admin.reject_chef',
+    'admin.delete_menu_item', 'customer.book_chef', 'reports.export_pdf',
+}
+
+FULL_SCAN = re.compile(r'^SCAN (\w+)$')
+FILTERED = re.compile(r'\bWHERE\b', re.IGNORECASE)
+
+
+def prepare_database(path):
+    """Point the app at temporary copies of the databases before main is imported."""
+    workdir = tempfile.mkdtemp(prefix='query-plans-')
+    for env, source in (('DATABASE_URL', path), ('DISH_DATABASE_URL', os.path.join(os.path.dirname(path), 'dish.db'))):
+        target = os.path.join(workdir, os.path.basename(source))
+        if os.path.exists(source):
+            shutil.copy(source, target)
+        os.environ[env] = f'sqlite:///{target}'
+    return workdir
+
+
+def sample_values(Booking, Event, Chef, User):
+    """URL arguments and users to request parametrised routes with."""
+    booking = Booking.query.first()
+    event = booking.event if booking else Event.query.first()
+    chef = booking.chef if booking else Chef.query.first()
+    admin = User.query.filter_by(role='admin').first()
+    values = {
+        'event_id': event.id if event else None,
+        'chef_id': chef.id if chef else None,
+        'booking_id': booking.id if booking else None,
+    }
+    users = {
+        'admin': admin.id if admin else None,
+        'chef': chef.user_id if chef else None,
+        'customer': event.customer_id if event else None,
+    }
+    return values, users
+
+
+def capture_route_queries(app, values, users):
+    """Return {endpoint: [(engine, statement, parameters)]} for SELECTs run by each GET route."""
+    from query_counter import count_queries
+
+    captured = {}
+    for rule in sorted(app.url_map.iter_rules(), key=lambda r: r.rule):
+        if 'GET' not in rule.methods or rule.endpoint in SKIP_ENDPOINTS:
+            continue
+        if any(values.get(arg) is None for arg in rule.arguments):
+            print(f"  - skipped {rule.endpoint}: no sample row for {sorted(rule.arguments)}")
+            continue
+        with app.test_request_context():
+            from flask import url_for
+            url = url_for(rule.endpoint, **{arg: values[arg] for arg in rule.arguments})
+
+        for role, user_id in users.items():
+            if user_id is None:
+                continue
+            client = app.test_client()
+            with client.session_transaction() as sess:
+                sess['_user_id'] = str(user_id)
+                sess['_fresh'] = True
+            with count_queries() as counter:
+                response = client.get(url)
+            if response.status_code >= 500:
+                print(f"  ! {rule.endpoint} returned {response.status_code} as {role}")
+            for engine, statement, parameters, executemany in counter.executed:
+                if not executemany and statement.lstrip().upper().startswith('SELECT'):
+                    captured.setdefault(rule.endpoint, []).append((engine, statement, parameters))
+    return captured
+
+
+def explain(engine, statement, parameters):
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).fetchall()
+    return [row[-1] for row in rows]
+
+
+def table_rows(engine, table, cache):
+    if (engine.url, table) not in cache:
+        with engine.connect() as conn:
+            cache[(engine.url, table)] = conn.exec_driver_sql(f'SELECT COUNT(*) FROM "{table}"').scalar()
+    return cache[(engine.url, table)]
+
+
+def check(captured, verbose=False, min_rows=0):
+    """Print plans and return the number of flagged full scans."""
+    flagged = 0
+    seen = set()
+    row_counts = {}
+    for endpoint, queries in captured.items():
+        for engine, statement, parameters in queries:
+            if (engine.url, statement) in seen:
+                continue
+            seen.add((engine.url, statement))
+            plan = explain(engine, statement, parameters)
+            scans = [FULL_SCAN.match(step).group(1) for step in plan if FULL_SCAN.match(step)]
+            # Unfiltered listings (no WHERE) are expected to read the whole table
+            bad = [table for table in scans if table_rows(engine, table, row_counts) >= min_rows] \
+                if FILTERED.search(statement) else []
+            if bad or verbose:
+                marker = '✗' if bad else '✓'
+                print(f"{marker} {endpoint}: {' '.join(statement.split())[:160]}")
+                for step in plan:
+                    print(f"      {step}")
+            flagged += len(bad)
+    return flagged
+
+
+def migrate_copy(app):
+    """Bring the copied databases up to the schema the code expects."""
+    from migrations import MigrationRunner
+    from models import db
+
+    with app.app_context():
+        report = MigrationRunner(db).run()
+    if report:
+        print(f"Applied {len(report)} pending migration(s) to the copy")
+
+
+def check_app(app, verbose=False, min_rows=0):
+    """Request every route of app and check its queries. Returns (captured, flagged)."""
+    from models import Booking, Event, Chef, User
+
+    app.config['RATE_LIMIT_ENABLED'] = False
+    app.config['PROPAGATE_EXCEPTIONS'] = False  # a failing route is reported, not fatal
+    logging.getLogger(app.logger.name).setLevel(logging.CRITICAL)  # failing routes are summarised instead
+    with app.app_context():
+        values, users = sample_values(Booking, Event, Chef, User)
+    captured = capture_route_queries(app, values, users)
+    with app.app_context():
+        flagged = check(captured, verbose, min_rows)
+    return captured, flagged
+
+
+def main(argv):
+    verbose = '--verbose' in argv
+    min_rows = next((int(arg.split('=', 1)[1]) for arg in argv if arg.startswith('--min-rows=')), 100)
+    paths = [arg for arg in argv if not arg.startswith('--')]
+    path = os.path.abspath(paths[0] if paths else os.path.join('instance', 'erugah.db'))
+    if not os.path.exists(path):
+        print(f"Database not found: {path}")
+        return 2
+
+    workdir = prepare_database(path)
+    try:
+        from main import app
+        from models import db
+
+        migrate_copy(app)
+        captured, flagged = check_app(app, verbose, min_rows)
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n{sum(len(q) for q in captured.values())} queries from {len(captured)} routes checked, "
+          f"{flagged} full table scan(s) flagged")
+    return 1 if flagged else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
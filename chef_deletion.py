@@ -0,0 +1,104 @@
+"""
+Chef deletion: immediate (set-based) or soft with a background purge.
+
+Deleting a chef used to load every booking and delete its payments and then
+the booking one statement at a time. delete_chefs() issues one DELETE per
+table instead, in the caller's transaction:
+
+    DELETE FROM payment WHERE booking_id IN (SELECT id FROM booking WHERE chef_id IN (...))
+    DELETE FROM booking WHERE chef_id IN (...)
+    DELETE FROM chef WHERE id IN (...)
+    DELETE FROM user WHERE id IN (...)
+
+The foreign keys also declare ON DELETE CASCADE (PostgreSQL; SQLite does not
+enforce them here), so the explicit statements keep SQLite consistent too.
+
+soft_delete_chef() only stamps chef.deleted_at and takes the chef off every
+list (unapproved, unfeatured) and logs their user out, so it returns at once.
+purge_deleted_chefs() then removes soft-deleted chefs in batches, after the
+request according to CHEF_PURGE_MODE ('thread', 'inline' or 'cron' for
+'flask purge-deleted-chefs' only).
+"""
+import threading
+from datetime import datetime
+
+from flask import current_app
+
+from app_logging import get_logger
+from models import db, Booking, Chef, Payment, User
+
+log = get_logger(__name__)
+
+PURGE_BATCH_SIZE = 100
+
+_purge_lock = threading.Lock()
+
+
+def delete_chefs(chef_ids):
+    """Delete chefs with their bookings, payments and user accounts (caller commits). Returns the user ids."""
+    chef_ids = list(chef_ids)
+    if not chef_ids:
+        return []
+    user_ids = [user_id for (user_id,) in db.session.query(Chef.user_id).filter(Chef.id.in_(chef_ids))]
+    booking_ids = db.select(Booking.id).where(Booking.chef_id.in_(chef_ids))
+
+    for statement in (
+        db.delete(Payment).where(Payment.booking_id.in_(booking_ids)),
+        db.delete(Booking).where(Booking.chef_id.in_(chef_ids)),
+        db.delete(Chef).where(Chef.id.in_(chef_ids)),
+        db.delete(User).where(User.id.in_(user_ids)),
+    ):
+        db.session.execute(statement, execution_options={'synchronize_session': False})
+    db.session.expire_all()
+    return user_ids
+
+
+def soft_delete_chef(chef_id):
+    """Hide a chef at once; the rows are removed by purge_deleted_chefs() (caller commits)."""
+    return Chef.query.filter(Chef.id == chef_id, Chef.deleted_at.is_(None)).update({
+        Chef.deleted_at: datetime.utcnow(),
+        Chef.is_approved: False,
+        Chef.is_featured: False,
+        Chef.featured_priority: 0,
+    }, synchronize_session=False)
+
+
+def purge_deleted_chefs(batch_size=PURGE_BATCH_SIZE):
+    """Hard-delete soft-deleted chefs, batch_size per transaction. Returns the number purged."""
+    purged = 0
+    while True:
+        chef_ids = [chef_id for (chef_id,) in db.session.query(Chef.id).filter(
+            Chef.deleted_at.isnot(None)).order_by(Chef.id).limit(batch_size)]
+        if not chef_ids:
+            break
+        delete_chefs(chef_ids)
+        db.session.commit()
+        purged += len(chef_ids)
+    if purged:
+        log.info("deleted chefs purged", chefs=purged)
+    return purged
+
+
+def _purge(app):
+    if not _purge_lock.acquire(blocking=False):
+        return
+    try:
+        with app.app_context():
+            purge_deleted_chefs()
+    except Exception:
+        log.exception("chef purge failed")
+    finally:
+        _purge_lock.release()
+
+
+def schedule_purge(app=None):
+    """Purge soft-deleted chefs according to CHEF_PURGE_MODE (call after committing)."""
+    if app is None:
+        app = current_app._get_current_object()
+    mode = app.config.get('CHEF_PURGE_MODE', 'thread')
+    if mode == 'thread':
+        threading.Thread(target=_purge, args=(app,), name='chef-purge', daemon=True).start()
+    elif mode == 'inline':
+        purge_deleted_chefs()
+    elif mode != 'cron':
+        raise ValueError(f"Unknown CHEF_PURGE_MODE: {mode}")
@@ -0,0 +1,135 @@
+"""
+Precomputed chef ranking score used to order chefs on the homepage, in
+matching and in the featured-chefs admin list.
+
+ranking_score is a Bayesian average of a chef's ratings pulled towards the
+site-wide mean, where each booking rating is weighted by its age
+(half-life RANKING_HALF_LIFE_DAYS). Chefs with few or old ratings therefore
+sit near the mean instead of jumping ahead on a single 5-star rating.
+
+The score is refreshed for one chef whenever their ratings change and for
+everyone by the nightly 'flask refresh-chef-rankings' job (decay moves with time).
+"""
+from collections import defaultdict
+from datetime import datetime
+
+from models import db, Chef, Booking, SystemConfig
+
+PRIOR_WEIGHT = 5.0            # ratings' worth of confidence given to the site-wide mean
+RANKING_HALF_LIFE_DAYS = 180.0
+DEFAULT_PRIOR_MEAN = 3.5
+PRIOR_MEAN_KEY = 'ranking_prior_mean'
+
+
+def decay_weight(rated_at, now):
+    if rated_at is None:
+        return 1.0
+    age_days = max(0.0, (now - rated_at).total_seconds() / 86400.0)
+    return 0.5 ** (age_days / RANKING_HALF_LIFE_DAYS)
+
+
+def compute_ranking_score(booking_ratings, rating_total, rating_count, prior_mean, now=None):
+    """Bayesian average of a chef's ratings with recency decay.
+
+    booking_ratings is a list of (rating_value, rating_submitted_at) submitted since the
+    chef's last reset (see counted_booking_ratings). The chef's aggregates stay
+    authoritative: ratings added by an admin (no booking) make up the rest of rating_count
+    with weight 1, and booking ratings beyond rating_count are never counted.
+    """
+    now = now or datetime.utcnow()
+    rating_count = rating_count or 0
+    booking_ratings = sorted(booking_ratings, key=lambda r: r[1] or datetime.min, reverse=True)[:rating_count]
+    weighted_sum = 0.0
+    weight_total = 0.0
+    for value, rated_at in booking_ratings:
+        weight = decay_weight(rated_at, now)
+        weighted_sum += weight * value
+        weight_total += weight
+
+    manual_count = rating_count - len(booking_ratings)
+    if manual_count:
+        manual_total = max(0, (rating_total or 0) - sum(value for value, _ in booking_ratings))
+        weighted_sum += manual_total
+        weight_total += manual_count
+
+    return round((PRIOR_WEIGHT * prior_mean + weighted_sum) / (PRIOR_WEIGHT + weight_total), 4)
+
+
+def counted_booking_ratings():
+    """Filters for the booking ratings behind a chef's aggregates (the query must join Chef)."""
+    return (
+        Booking.rating_value.isnot(None),
+        # An admin reset wipes every rating submitted before it
+        db.or_(Chef.ratings_reset_at.is_(None), Booking.rating_submitted_at > Chef.ratings_reset_at),
+    )
+
+
+def get_prior_mean():
+    config = SystemConfig.query.filter_by(key=PRIOR_MEAN_KEY).first()
+    return float(config.value) if config else DEFAULT_PRIOR_MEAN
+
+
+def refresh_chef_ranking(chef_id, prior_mean=None):
+    """Recompute one chef's ranking_score after a rating event (caller commits)."""
+    db.session.flush()
+    chef_totals = db.session.query(Chef.rating_total, Chef.rating_count).filter(Chef.id == chef_id).first()
+    if chef_totals is None:
+        return None
+
+    ratings = db.session.query(Booking.rating_value, Booking.rating_submitted_at).join(
+        Chef, Chef.id == Booking.chef_id
+    ).filter(Booking.chef_id == chef_id, *counted_booking_ratings()).all()
+    score = compute_ranking_score(ratings, chef_totals.rating_total, chef_totals.rating_count,
+                                  get_prior_mean() if prior_mean is None else prior_mean)
+    Chef.query.filter(Chef.id == chef_id).update({Chef.ranking_score: score}, synchronize_session=False)
+    return score
+
+
+def _update_rankings(chef_filter, prior_mean, now):
+    """Recompute ranking_score for the chefs matching chef_filter in one batched UPDATE."""
+    ratings = defaultdict(list)
+    for chef_id, value, rated_at in db.session.query(
+            Booking.chef_id, Booking.rating_value, Booking.rating_submitted_at
+    ).join(Chef, Chef.id == Booking.chef_id).filter(*chef_filter, *counted_booking_ratings()).yield_per(1000):
+        ratings[chef_id].append((value, rated_at))
+
+    updates = [
+        {'id': chef_id,
+         'ranking_score': compute_ranking_score(ratings.get(chef_id, []), rating_total, rating_count, prior_mean, now)}
+        for chef_id, rating_total, rating_count in db.session.query(
+            Chef.id, Chef.rating_total, Chef.rating_count).filter(*chef_filter)
+    ]
+    if updates:
+        db.session.execute(db.update(Chef), updates)
+    return len(updates)
+
+
+def refresh_chef_rankings(chef_ids, prior_mean=None):
+    """Recompute ranking_score for a set of chefs (e.g. approved in bulk); caller commits."""
+    if not chef_ids:
+        return 0
+    db.session.flush()
+    return _update_rankings((Chef.id.in_(chef_ids),), get_prior_mean() if prior_mean is None else prior_mean,
+                            datetime.utcnow())
+
+
+def refresh_all_rankings():
+    """Nightly batch: refresh the site-wide mean and every chef's ranking_score. Returns chefs updated."""
+    now = datetime.utcnow()
+    totals = db.session.query(db.func.sum(Chef.rating_total), db.func.sum(Chef.rating_count)).one()
+    prior_mean = (float(totals[0]) / float(totals[1])) if totals[1] else DEFAULT_PRIOR_MEAN
+
+    config = SystemConfig.query.filter_by(key=PRIOR_MEAN_KEY).first()
+    if config:
+        config.value = f"{prior_mean:.4f}"
+    else:
+        db.session.add(SystemConfig(key=PRIOR_MEAN_KEY, value=f"{prior_mean:.4f}"))
+
+    updated = _update_rankings((), prior_mean, now)
+    db.session.commit()
+    return updated
+
+
+def ranked_order():
+    """ORDER BY clauses for featured-first, then ranking_score (matches ix_chef_ranking)."""
+    return (Chef.is_featured.desc(), Chef.featured_priority.desc(), Chef.ranking_score.desc())
@@ -0,0 +1,69 @@
+"""
+Chef rating aggregation done in SQL.
+
+Chef.rating_total / rating_count are only ever changed with atomic
+UPDATE ... SET x = x + n statements, so concurrent ratings from several
+workers cannot overwrite each other. rebuild_chef_ratings() recomputes the
+aggregates from Booking.rating_value with one grouped query. Every change
+also refreshes the chef's precomputed ranking_score (see chef_ranking).
+"""
+from datetime import datetime
+
+from models import db, Chef, Booking
+from chef_ranking import counted_booking_ratings, refresh_chef_ranking, refresh_all_rankings
+
+
+def claim_booking_rating(booking_id, rating_value, rating_comment=None):
+    """Store a rating on a booking unless it already has one. Returns True if this call set it."""
+    updated = Booking.query.filter(
+        Booking.id == booking_id,
+        Booking.rating_value.is_(None)
+    ).update({
+        Booking.rating_value: rating_value,
+        Booking.rating_comment: rating_comment,
+        Booking.rating_submitted_at: datetime.utcnow()
+    }, synchronize_session=False)
+    return updated == 1
+
+
+def add_chef_rating(chef_id, rating_value):
+    """Atomically add one rating to a chef's aggregates (caller commits)."""
+    updated = Chef.query.filter(Chef.id == chef_id).update({
+        Chef.rating_total: db.func.coalesce(Chef.rating_total, 0) + rating_value,
+        Chef.rating_count: db.func.coalesce(Chef.rating_count, 0) + 1
+    }, synchronize_session=False)
+    refresh_chef_ranking(chef_id)
+    return updated
+
+
+def reset_chef_rating(chef_id):
+    """Zero a chef's aggregates; booking ratings submitted so far stop counting (caller commits)."""
+    updated = Chef.query.filter(Chef.id == chef_id).update({
+        Chef.rating_total: 0,
+        Chef.rating_count: 0,
+        Chef.ratings_reset_at: datetime.utcnow()
+    }, synchronize_session=False)
+    refresh_chef_ranking(chef_id)
+    return updated
+
+
+def rebuild_chef_ratings():
+    """Recompute every chef's aggregates from booking ratings. Returns the number of rated chefs.
+
+    Ratings added by hand from the admin panel are not backed by a booking and are dropped,
+    and so are booking ratings from before the chef's last reset.
+    """
+    rows = db.session.query(
+        Booking.chef_id,
+        db.func.sum(Booking.rating_value),
+        db.func.count(Booking.rating_value)
+    ).join(Chef, Chef.id == Booking.chef_id).filter(*counted_booking_ratings()).group_by(Booking.chef_id).all()
+
+    Chef.query.update({Chef.rating_total: 0, Chef.rating_count: 0}, synchronize_session=False)
+    if rows:
+        db.session.execute(db.update(Chef), [
+            {'id': chef_id, 'rating_total': total, 'rating_count': count}
+            for chef_id, total, count in rows
+        ])
+    refresh_all_rankings()
+    return len(rows)
@@ -0,0 +1,205 @@
+"""
+Search, filters and keyset pagination for the admin chef list.
+
+GET /admin/manage-chefs used to load every chef and filter in the browser.
+search_chefs() instead returns one page of ChefSummary rows, newest first,
+paginated on (created_at, id) with the reviews_feed cursor format:
+
+    filters = parse_filters(request.args)   # ValueError on bad input
+    chefs, next_cursor = search_chefs(filters, cursor, limit)
+
+Filters: q (words matched as prefixes against name and about), status
+('approved' | 'pending'), county, featured ('yes' | 'no'), min_rating and
+max_rating (average rating, rated chefs only) and unrated ('1').
+
+Each filter has an index that also serves the ORDER BY (see Chef.__table_args__).
+Text search uses the chef_fts FTS5 table on SQLite and a GIN index on
+PostgreSQL; both are created with the chef table (create_all) or by migration
+0012, and SQLite triggers keep chef_fts in sync. Without either, q falls back
+to a LIKE scan.
+"""
+import re
+
+from flask import current_app
+from sqlalchemy import DDL, event, func, inspect, literal_column, select, text
+
+from models import db, Chef
+from read_models import chef_summaries
+from reviews_feed import decode_cursor, encode_cursor
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+STATUSES = ('approved', 'pending')
+FILTER_ARGS = ('q', 'status', 'county', 'featured', 'min_rating', 'max_rating', 'unrated')
+
+# External-content FTS5 table over chef(name, about); rows are indexed by chef.id
+SQLITE_SEARCH_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS chef_fts USING fts5("
+    "name, about, content='chef', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS chef_fts_insert AFTER INSERT ON chef BEGIN "
+    "INSERT INTO chef_fts(rowid, name, about) VALUES (new.id, new.name, new.about); END",
+    "CREATE TRIGGER IF NOT EXISTS chef_fts_delete AFTER DELETE ON chef BEGIN "
+    "INSERT INTO chef_fts(chef_fts, rowid, name, about) VALUES ('delete', old.id, old.name, old.about); END",
+    "CREATE TRIGGER IF NOT EXISTS chef_fts_update AFTER UPDATE OF name, about ON chef BEGIN "
+    "INSERT INTO chef_fts(chef_fts, rowid, name, about) VALUES ('delete', old.id, old.name, old.about); "
+    "INSERT INTO chef_fts(rowid, name, about) VALUES (new.id, new.name, new.about); END",
+)
+SEARCH_DOCUMENT = "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(about, ''))"
+POSTGRES_SEARCH_INDEX = f"CREATE INDEX IF NOT EXISTS ix_chef_search ON chef USING gin ({SEARCH_DOCUMENT})"
+
+
+def fts5_available(conn):
+    """True if conn is SQLite built with FTS5."""
+    if conn is None or conn.dialect.name != 'sqlite':
+        return False
+    return bool(conn.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar())
+
+
+def _sqlite_fts(ddl, target, bind, **kw):
+    return fts5_available(bind)
+
+
+# Create the search index together with the chef table (create_all, reset_database)
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(Chef.__table__, 'after_create', DDL(_statement).execute_if(callable_=_sqlite_fts))
+event.listen(Chef.__table__, 'after_create', DDL(POSTGRES_SEARCH_INDEX).execute_if(dialect='postgresql'))
+# The triggers go with the chef table, the FTS table would outlive it
+event.listen(Chef.__table__, 'before_drop', DDL('DROP TABLE IF EXISTS chef_fts').execute_if(dialect='sqlite'))
+
+
+def search_backend(app=None):
+    """'fts5', 'postgresql' or 'like'; looked up once per app."""
+    if app is None:
+        app = current_app._get_current_object()
+    if 'chef_search_backend' not in app.extensions:
+        engine = db.engine
+        if engine.dialect.name == 'postgresql':
+            backend = 'postgresql'
+        elif engine.dialect.name == 'sqlite' and inspect(engine).has_table('chef_fts'):
+            backend = 'fts5'
+        else:
+            backend = 'like'
+        app.extensions['chef_search_backend'] = backend
+    return app.extensions['chef_search_backend']
+
+
+def search_terms(q):
+    """Lower-cased words of q; punctuation and search syntax are dropped."""
+    return re.findall(r'\w+', (q or '').lower())
+
+
+def search_clause(q):
+    """WHERE clause matching chefs whose name/about contain every word of q as a prefix."""
+    terms = search_terms(q)
+    if not terms:
+        return None
+    backend = search_backend()
+    if backend == 'fts5':
+        match = ' '.join(f'"{term}"*' for term in terms)
+        rowids = select(literal_column('rowid')).select_from(text('chef_fts')).where(
+            text('chef_fts MATCH :chef_query').bindparams(chef_query=match))
+        return Chef.id.in_(rowids)
+    if backend == 'postgresql':
+        query = ' & '.join(f'{term}:*' for term in terms)
+        return text(f"{SEARCH_DOCUMENT} @@ to_tsquery('simple', :chef_query)").bindparams(chef_query=query)
+    return db.and_(*[
+        db.or_(Chef.name.ilike(f'%{term}%'), Chef.about.ilike(f'%{term}%')) for term in terms
+    ])
+
+
+def _rating(value):
+    rating = float(value)
+    if not 0 <= rating <= 5:
+        raise ValueError(f'Rating out of range: {value}')
+    return rating
+
+
+def parse_filters(args):
+    """Normalize filter query args into a dict of the ones that are set. Raises ValueError."""
+    filters = {}
+    for name in FILTER_ARGS:
+        value = (args.get(name) or '').strip()
+        if value and value != 'all':
+            filters[name] = value
+    if filters.get('status', 'approved') not in STATUSES:
+        raise ValueError(f"Unknown status: {filters['status']}")
+    if filters.get('featured', 'yes') not in ('yes', 'no'):
+        raise ValueError(f"Unknown featured filter: {filters['featured']}")
+    for name in ('min_rating', 'max_rating'):
+        if name in filters:
+            _rating(filters[name])
+    return filters
+
+
+def filtered_query(filters):
+    query = Chef.query.filter(Chef.deleted_at.is_(None))
+    clause = search_clause(filters.get('q'))
+    if clause is not None:
+        query = query.filter(clause)
+    if 'status' in filters:
+        query = query.filter(Chef.is_approved.is_(filters['status'] == 'approved'))
+    if 'county' in filters:
+        query = query.filter(Chef.county == filters['county'])
+    if 'featured' in filters:
+        query = query.filter(Chef.is_featured.is_(filters['featured'] == 'yes'))
+    if 'min_rating' in filters:
+        query = query.filter(Chef.rating_count > 0,
+                             Chef.rating_total >= _rating(filters['min_rating']) * Chef.rating_count)
+    if 'max_rating' in filters:
+        query = query.filter(Chef.rating_count > 0,
+                             Chef.rating_total <= _rating(filters['max_rating']) * Chef.rating_count)
+    if filters.get('unrated') == '1':
+        query = query.filter(db.or_(Chef.rating_count == 0, Chef.rating_count.is_(None)))
+    return query
+
+
+def search_chefs(filters, cursor=None, limit=DEFAULT_PAGE_SIZE, about_chars=100):
+    """Return (summaries, next_cursor) for one page of chefs matching filters, newest first."""
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    query = filtered_query(filters)
+    if cursor:
+        created_at, chef_id = decode_cursor(cursor)
+        query = query.filter(db.or_(
+            Chef.created_at < created_at,
+            db.and_(Chef.created_at == created_at, Chef.id < chef_id)
+        ))
+
+    # Fetch one extra row to know whether there is a next page
+    chefs = chef_summaries(query.order_by(Chef.created_at.desc(), Chef.id.desc()),
+                           about_chars=about_chars, limit=limit + 1)
+    next_cursor = encode_cursor(chefs[limit - 1]) if len(chefs) > limit else None
+    return chefs[:limit], next_cursor
+
+
+def chef_counts():
+    """Totals for the stats cards, over all chefs, in one query."""
+    total, approved, rated = db.session.query(
+        func.count(Chef.id),
+        func.count(Chef.id).filter(Chef.is_approved.is_(True)),
+        func.count(Chef.id).filter(Chef.rating_count > 0),
+    ).filter(Chef.deleted_at.is_(None)).one()
+    return {'total': total, 'approved': approved, 'rated': rated, 'pending': total - approved}
+
+
+def chef_counties():
+    """Counties for the county filter: those of the chefs search_chefs() can return."""
+    return [county for (county,) in db.session.query(Chef.county).filter(
+        Chef.deleted_at.is_(None)).distinct().order_by(Chef.county)]
+
+
+def serialize_chef(chef):
+    return {
+        'id': chef.id,
+        'name': chef.name,
+        'email': chef.email,
+        'phone': chef.phone,
+        'location': chef.location,
+        'county': chef.county,
+        'is_verified': bool(chef.is_verified),
+        'is_approved': bool(chef.is_approved),
+        'is_featured': bool(chef.is_featured),
+        'average_rating': chef.average_rating,
+        'rating_count': chef.rating_count or 0,
+        'created_at': chef.created_at.isoformat() if chef.created_at else None,
+    }
+
@@ -0,0 +1,296 @@
+"""
+Ephemeral code store for email/SMS verification, OTP and password reset codes.
+
+Backends (CODE_STORE_BACKEND):
+- 'database' : the verification code tables (default); attempt and issue
+               counters use the shared store from SHARED_STORE_URL
+- 'shared'   : shared key-value store from SHARED_STORE_URL (Redis, or the
+               local stand-in used in tests); default when SHARED_STORE_URL is set
+- 'memory'   : in-process TTL map, for development and single-process setups
+               only: a code sent by one worker fails verification on another
+All backends expire codes automatically, count wrong attempts per code and
+rate limit how often a new code can be issued for the same identifier.
+"""
+import hmac
+from abc import ABC, abstractmethod
+import json
+import logging
+import random
+import string
+from datetime import datetime, timedelta
+
+from models import db, VerificationCode, OTP, PasswordResetCode
+from kv_store import LocalKVClient, get_shared_client
+from app_logging import get_logger
+
+log = get_logger(__name__)
+
+VERIFIED = 'verified'
+INVALID = 'invalid'
+EXPIRED = 'expired'
+LOCKED = 'locked'
+
+# Expired codes are kept this long so users get "expired" instead of "invalid"
+EXPIRED_GRACE = timedelta(minutes=30)
+
+# Expired/used database codes are purged opportunistically at most this often per process
+CODE_PURGE_INTERVAL = timedelta(minutes=15)
+_last_code_purge = None
+
+
+class CodeRateLimitError(ValueError):
+    """Raised when too many codes are requested for the same identifier."""
+
+    def __init__(self, retry_after):
+        self.retry_after = retry_after
+        minutes = max(1, int(retry_after // 60) + (1 if retry_after % 60 else 0))
+        super().__init__(f"Too many codes requested. Please try again in {minutes} minute{'s' if minutes != 1 else ''}.")
+
+
+def _generate_code(length):
+    return ''.join(random.choices(string.digits, k=length))
+
+
+class CodeStore(ABC):
+    """Base store: issue rate limiting and attempt counting on a key-value client.
+
+    Subclasses implement _save(), _check() and _discard() for the codes themselves.
+    """
+
+    def __init__(self, counters, max_attempts=5, max_issues=5, issue_window=900):
+        self.counters = counters
+        self.max_attempts = max_attempts
+        self.max_issues = max_issues
+        self.issue_window = issue_window
+
+    def _counter_key(self, kind, purpose, identifier):
+        return f"code-{kind}:{purpose}:{identifier}"
+
+    def issue(self, purpose, identifier, length, ttl):
+        """Generate and store a new code, replacing any previous one. Returns the code.
+
+        Raises CodeRateLimitError if the identifier requested too many codes recently.
+        """
+        issued_key = self._counter_key('issued', purpose, identifier)
+        issued = self.counters.incr(issued_key)
+        if issued == 1:
+            self.counters.pexpire(issued_key, self.issue_window * 1000)
+        if issued > self.max_issues:
+            retry_after = max(self.counters.pttl(issued_key), 0) / 1000.0
+            raise CodeRateLimitError(retry_after)
+
+        code = _generate_code(length)
+        self._save(purpose, identifier, code, ttl)
+        self.counters.delete(self._counter_key('attempts', purpose, identifier))
+        return code
+
+    def verify(self, purpose, identifier, code):
+        """Check and consume a code. Returns VERIFIED, INVALID, EXPIRED or LOCKED."""
+        attempts_key = self._counter_key('attempts', purpose, identifier)
+        if int(self.counters.get(attempts_key) or 0) >= self.max_attempts:
+            return LOCKED
+
+        status = self._check(purpose, identifier, str(code or ''))
+        if status == INVALID:
+            attempts = self.counters.incr(attempts_key)
+            if attempts == 1:
+                self.counters.pexpire(attempts_key, self.issue_window * 1000)
+            if attempts >= self.max_attempts:
+                self._discard(purpose, identifier)
+        elif status == VERIFIED:
+            self.counters.delete(attempts_key)
+        return status
+
+    def recent(self, limit=10):
+        """Most recently issued codes (for the admin debug endpoint)."""
+        return []
+
+    @abstractmethod
+    def _save(self, purpose, identifier, code, ttl):
+        """Store code for identifier (replacing any earlier one) until ttl (a timedelta) passes."""
+
+    @abstractmethod
+    def _check(self, purpose, identifier, code):
+        """Return VERIFIED (consuming the code), INVALID or EXPIRED."""
+
+    @abstractmethod
+    def _discard(self, purpose, identifier):
+        """Forget identifier's current code."""
+
+
+class KVCodeStore(CodeStore):
+    """Codes kept in a key-value client with native expiry (in-process map or shared store)."""
+
+    def __init__(self, client, **limits):
+        super().__init__(client, **limits)
+        self.client = client
+
+    def _key(self, purpose, identifier):
+        return f"code:{purpose}:{identifier}"
+
+    def _save(self, purpose, identifier, code, ttl):
+        now = datetime.utcnow()
+        payload = json.dumps({
+            'purpose': purpose,
+            'identifier': identifier,
+            'code': code,
+            'created_at': now.isoformat(),
+            'expires_at': (now + ttl).isoformat()
+        })
+        self.client.set(self._key(purpose, identifier), payload,
+                        px=int((ttl + EXPIRED_GRACE).total_seconds() * 1000))
+
+    def _check(self, purpose, identifier, code):
+        key = self._key(purpose, identifier)
+        raw = self.client.get(key)
+        if raw is None:
+            return INVALID
+
+        entry = json.loads(raw)
+        if not hmac.compare_digest(entry['code'], code):
+            return INVALID
+        if datetime.utcnow() > datetime.fromisoformat(entry['expires_at']):
+            return EXPIRED
+
+        # Whoever deletes the key consumes the code; a concurrent duplicate gets INVALID
+        return VERIFIED if self.client.delete(key) else INVALID
+
+    def _discard(self, purpose, identifier):
+        self.client.delete(self._key(purpose, identifier))
+
+    def recent(self, limit=10):
+        entries = []
+        for key in self.client.scan_iter(match='code:*'):
+            raw = self.client.get(key)
+            if raw is not None:
+                entries.append(json.loads(raw))
+        entries.sort(key=lambda e: e['created_at'], reverse=True)
+        return entries[:limit]
+
+
+# purpose -> (model, identifier column, extra filter criteria)
+DATABASE_CODE_MODELS = {
+    'email': (VerificationCode, 'identifier', {'type': 'email'}),
+    'sms': (VerificationCode, 'identifier', {'type': 'sms'}),
+    'otp': (OTP, 'email', {}),
+    'password_reset': (PasswordResetCode, 'email', {}),
+}
+
+
+def consume_code(model, **criteria):
+    """Atomically mark a matching unused, unexpired code as used.
+
+    Runs a single UPDATE ... WHERE against the lookup index so two concurrent
+    requests can never both consume the same code. Returns a tuple
+    (consumed, expired) where expired is only meaningful when nothing was consumed.
+    """
+    now = datetime.utcnow()
+    consumed = model.query.filter_by(is_used=False, **criteria).filter(
+        model.expires_at >= now
+    ).update({model.is_used: True}, synchronize_session=False)
+    db.session.commit()
+
+    if consumed:
+        return True, False
+
+    # Only hit on failure: tell an expired code apart from a wrong one
+    expired = db.session.query(model.id).filter_by(is_used=False, **criteria).first() is not None
+    return False, expired
+
+
+def purge_expired_codes():
+    """Delete used and expired rows from the verification code tables. Returns rows deleted."""
+    global _last_code_purge
+
+    now = datetime.utcnow()
+    deleted = 0
+    for model in (VerificationCode, OTP, PasswordResetCode):
+        deleted += model.query.filter(
+            db.or_(model.expires_at < now, model.is_used.is_(True))
+        ).delete(synchronize_session=False)
+    db.session.commit()
+
+    _last_code_purge = now
+    return deleted
+
+
+def maybe_purge_expired_codes():
+    """Run purge_expired_codes() if it has not run in this process for CODE_PURGE_INTERVAL."""
+    if _last_code_purge is None or datetime.utcnow() - _last_code_purge >= CODE_PURGE_INTERVAL:
+        return purge_expired_codes()
+    return 0
+
+
+class DatabaseCodeStore(CodeStore):
+    """Codes kept in the VerificationCode / OTP / PasswordResetCode tables."""
+
+    def _save(self, purpose, identifier, code, ttl):
+        model, column, extra = DATABASE_CODE_MODELS[purpose]
+        maybe_purge_expired_codes()
+
+        # Delete any existing unused codes for this identifier
+        model.query.filter_by(is_used=False, **{column: identifier}, **extra).delete(synchronize_session=False)
+        db.session.add(model(code=code, expires_at=datetime.utcnow() + ttl, **{column: identifier}, **extra))
+        db.session.commit()
+
+    def _check(self, purpose, identifier, code):
+        model, column, extra = DATABASE_CODE_MODELS[purpose]
+        consumed, expired = consume_code(model, code=code, **{column: identifier}, **extra)
+        if consumed:
+            return VERIFIED
+        if expired:
+            return EXPIRED
+
+        # Diagnostic listing costs an extra query, so only run it when debugging
+        if log.isEnabledFor(logging.DEBUG):
+            rows = db.session.query(model.code, model.is_used, model.expires_at).filter_by(
+                **{column: identifier}, **extra).all()
+            log.debug("no matching unused code", purpose=purpose, identifier=identifier, codes=rows)
+        return INVALID
+
+    def _discard(self, purpose, identifier):
+        model, column, extra = DATABASE_CODE_MODELS[purpose]
+        model.query.filter_by(is_used=False, **{column: identifier}, **extra).update(
+            {model.is_used: True}, synchronize_session=False)
+        db.session.commit()
+
+    def recent(self, limit=10):
+        codes = VerificationCode.query.order_by(VerificationCode.created_at.desc()).limit(limit).all()
+        return [{
+            'purpose': c.type,
+            'identifier': c.identifier,
+            'code': c.code,
+            'is_used': c.is_used,
+            'created_at': c.created_at.isoformat(),
+            'expires_at': c.expires_at.isoformat()
+        } for c in codes]
+
+
+def create_code_store(app):
+    """Build the code store selected by CODE_STORE_BACKEND."""
+    backend = app.config.get('CODE_STORE_BACKEND', 'database')
+    limits = {
+        'max_attempts': app.config.get('CODE_MAX_ATTEMPTS', 5),
+        'max_issues': app.config.get('CODE_MAX_ISSUES', 5),
+        'issue_window': app.config.get('CODE_ISSUE_WINDOW', 900),
+    }
+    if backend == 'memory':
+        return KVCodeStore(LocalKVClient(), **limits)
+    if backend == 'shared':
+        return KVCodeStore(get_shared_client(app), **limits)
+    if backend == 'database':
+        # Codes live in the database; counters are shared when SHARED_STORE_URL is a real store
+        return DatabaseCodeStore(get_shared_client(app), **limits)
+    raise ValueError(f"Unknown CODE_STORE_BACKEND: {backend}")
+
+
+def get_code_store(app=None):
+    """Return the app-wide code store, creating it on first use."""
+    if app is None:
+        from flask import current_app
+        app = current_app._get_current_object()
+    store = app.extensions.get('code_store')
+    if store is None:
+        store = create_code_store(app)
+        app.extensions['code_store'] = store
+    return store
@@ -0,0 +1,148 @@
+"""
+On-the-fly response compression (gzip, and brotli when installed).
+
+init_compression(app) compresses responses whose mimetype is in
+COMPRESSION_MIMETYPES when the client sends a matching Accept-Encoding:
+
+    - buffered responses only when at least COMPRESSION_MIN_SIZE bytes
+      (tiny bodies grow once headers and framing are added)
+    - streamed (generator) responses chunk by chunk, flushing after every
+      chunk so the client still receives data as it is produced
+
+A strong ETag becomes "<etag>-<encoding>" on a compressed response, and
+If-None-Match is checked against that tag here, so a 304 carries the same
+ETag as the 200 it revalidates.
+
+Responses that are already encoded (the precompressed bundles from assets.py),
+file downloads, 'Cache-Control: no-transform' and bodiless statuses are left
+alone. Levels are a CPU/size trade-off; run benchmarks/compression.py.
+"""
+import zlib
+
+from flask import request
+
+from app_logging import get_logger
+
+log = get_logger(__name__)
+
+try:
+    import brotli  # optional: pip install brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_MIMETYPES = (
+    'text/html', 'text/css', 'text/plain', 'text/csv', 'text/xml',
+    'application/json', 'application/javascript', 'text/javascript', 'image/svg+xml',
+)
+
+
+class GzipStream:
+    def __init__(self, level):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip container
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliStream:
+    def __init__(self, quality):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+def choose_encoding(accept_encodings):
+    """'br', 'gzip' or None for the request's Accept-Encoding."""
+    if brotli is not None and accept_encodings['br']:
+        return 'br'
+    if accept_encodings['gzip']:
+        return 'gzip'
+    return None
+
+
+def make_stream(encoding, config):
+    if encoding == 'br':
+        return BrotliStream(config['COMPRESSION_BROTLI_QUALITY'])
+    return GzipStream(config['COMPRESSION_GZIP_LEVEL'])
+
+
+def compress_bytes(data, encoding, config):
+    stream = make_stream(encoding, config)
+    return stream.compress(data) + stream.finish()
+
+
+def compress_chunks(chunks, stream):
+    """Compress a streamed body, flushing after every chunk."""
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            if chunk:
+                yield stream.compress(chunk) + stream.flush()
+        yield stream.finish()
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+
+def should_compress(response, config):
+    if response.status_code < 200 or response.status_code in (204, 304):
+        return False
+    if response.direct_passthrough or 'Content-Encoding' in response.headers:
+        return False
+    if 'no-transform' in response.headers.get('Cache-Control', ''):
+        return False
+    return response.mimetype in config['COMPRESSION_MIMETYPES']
+
+
+def compress_response(response, config, request):
+    if not should_compress(response, config):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+    if not response.is_streamed and len(response.get_data()) < config['COMPRESSION_MIN_SIZE']:
+        return response
+
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # The bytes differ from the identity encoding, so the strong ETag gets the encoding
+        # appended; the view's make_conditional() never sees that tag, so revalidate it here
+        response.set_etag(f'{etag}-{encoding}')
+        response.make_conditional(request)
+        if response.status_code == 304:
+            return response
+
+    if response.is_streamed:
+        response.response = compress_chunks(response.response, make_stream(encoding, config))
+        response.headers.pop('Content-Length', None)
+    else:
+        response.set_data(compress_bytes(response.get_data(), encoding, config))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def init_compression(app):
+    app.config.setdefault('COMPRESSION_MIMETYPES', DEFAULT_MIMETYPES)
+    if not app.config['COMPRESSION_ENABLED']:
+        return
+    if brotli is None:
+        log.debug("brotli not installed, compressing with gzip only")
+
+    @app.after_request
+    def _compress(response):
+        return compress_response(response, app.config, request)
@@ -35,6 +35,9 @@ class CustomDishIngredient(db.Model):
     """Junction table linking custom dishes to ingredients"""
     __tablename__ = 'custom_dish_ingredient'
     __bind_key__ = 'custom_dishes'
+    __table_args__ = (
+        db.Index('ix_custom_dish_ingredient_dish_id', 'dish_id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     dish_id = db.Column(db.Integer, db.ForeignKey('custom_dish.id'), nullable=False)
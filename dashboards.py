@@ -0,0 +1,65 @@
+"""
+Query layer for the dashboards.
+
+Each function loads everything its template walks in a fixed number of
+queries (eager loading instead of per-row lazy loads), so page cost does not
+grow with the number of events or bookings.
+"""
+from datetime import datetime
+
+from sqlalchemy.orm import contains_eager, selectinload
+
+from models import Event, Booking
+
+CHEF_BOOKINGS_PER_PAGE = 20
+
+
+def get_customer_dashboard(customer_id):
+    """Template context for customer_dashboard.html: events with bookings, chefs and payments."""
+    events = Event.query.filter_by(customer_id=customer_id).options(
+        selectinload(Event.bookings).joinedload(Booking.chef),
+        selectinload(Event.bookings).selectinload(Booking.payments)
+    ).order_by(Event.id).all()
+
+    now = datetime.utcnow()
+    # booking.event resolves from the identity map, so this needs no further queries
+    completed_bookings = [
+        booking
+        for event in events if event.event_date <= now
+        for booking in event.bookings if booking.status == 'confirmed'
+    ]
+
+    return {
+        'events': events,
+        'completed_bookings': completed_bookings,
+        'pending_reviews': [b for b in completed_bookings if b.rating_value is None],
+        'rated_bookings': [b for b in completed_bookings if b.rating_value is not None]
+    }
+
+
+def _chef_bookings_page(chef_id, upcoming, now, page, per_page):
+    query = Booking.query.join(Booking.event).filter(Booking.chef_id == chef_id).options(
+        contains_eager(Booking.event).joinedload(Event.customer),
+        selectinload(Booking.payments)
+    )
+    if upcoming:
+        query = query.filter(Event.event_date > now).order_by(Event.event_date, Booking.id)
+    else:
+        query = query.filter(Event.event_date <= now).order_by(Event.event_date.desc(), Booking.id.desc())
+    return query.paginate(page=page, per_page=per_page, error_out=False)
+
+
+def get_chef_bookings(chef_id, upcoming_page=1, past_page=1, per_page=CHEF_BOOKINGS_PER_PAGE):
+    """Paginated upcoming (soonest first) and past (latest first) bookings for chef_dashboard.html.
+
+    Each page costs a count, one joined row query (booking, event, customer) and
+    one payments query over the ix_booking_chef_id index, however many bookings the chef has.
+    """
+    now = datetime.utcnow()
+    upcoming = _chef_bookings_page(chef_id, True, now, upcoming_page, per_page)
+    past = _chef_bookings_page(chef_id, False, now, past_page, per_page)
+    return {
+        'upcoming_bookings': upcoming,
+        'past_bookings': past,
+        'booking_count': upcoming.total + past.total
+    }
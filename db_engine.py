@@ -0,0 +1,121 @@
+"""
+Engine configuration for both binds (erugah.db and the custom_dishes dish.db).
+
+database_url() and engine_options() turn the DATABASE_URL / DISH_DATABASE_URL
+environment settings into Flask-SQLAlchemy engine config with the DB_POOL_*
+pool settings, so the app can run on PostgreSQL (pip install psycopg2-binary)
+as well as SQLite.
+
+SQLite connection tuning:
+
+Every new pooled connection to a file-backed SQLite database runs:
+
+    journal_mode=WAL      readers no longer block on a writer's commit (and vice versa)
+    synchronous=NORMAL    fsync at checkpoints only; safe with WAL, much cheaper commits
+    mmap_size             memory-mapped reads
+    cache_size            page cache per connection (negative = KiB)
+    busy_timeout          wait for a lock instead of failing with "database is locked"
+
+Values come from SQLITE_* config keys (see app_factory.load_config). In-memory
+databases and other dialects are left alone. Run benchmarks/sqlite_concurrency.py
+to compare.
+"""
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from models import db
+from app_logging import get_logger
+
+log = get_logger(__name__)
+
+# busy_timeout comes first so the other pragmas wait for locks held by busy connections
+DEFAULT_PRAGMAS = {
+    'busy_timeout': 5000,
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64000,
+}
+
+
+def database_url(value):
+    """Normalise a database URL from the environment (postgres:// is the Heroku-style alias)."""
+    if value.startswith('postgres://'):
+        value = 'postgresql://' + value[len('postgres://'):]
+    return value
+
+
+def is_memory_sqlite_url(url):
+    url = make_url(url)
+    return url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:')
+
+
+def engine_options(url, config):
+    """Engine options for one bind: url plus DB_POOL_* settings (in-memory SQLite keeps its StaticPool)."""
+    options = {'url': url}
+    if is_memory_sqlite_url(url):
+        return options
+    options.update(
+        pool_size=config['DB_POOL_SIZE'],
+        max_overflow=config['DB_MAX_OVERFLOW'],
+        pool_timeout=config['DB_POOL_TIMEOUT'],
+        pool_recycle=config['DB_POOL_RECYCLE'],
+        pool_pre_ping=config['DB_POOL_PRE_PING'],
+    )
+    return options
+
+
+def configure_database(app, url, bind_urls):
+    """Set SQLALCHEMY_DATABASE_URI/ENGINE_OPTIONS and SQLALCHEMY_BINDS with pool settings on every bind."""
+    default = engine_options(database_url(url), app.config)
+    app.config['SQLALCHEMY_DATABASE_URI'] = default.pop('url')
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = default
+    app.config['SQLALCHEMY_BINDS'] = {
+        key: engine_options(database_url(bind_url), app.config) for key, bind_url in bind_urls.items()
+    }
+
+
+def sqlite_pragmas(config):
+    """Pragmas from SQLITE_<NAME> config keys, falling back to DEFAULT_PRAGMAS."""
+    return {name: config.get(f'SQLITE_{name.upper()}', default) for name, default in DEFAULT_PRAGMAS.items()}
+
+
+def apply_pragmas(dbapi_connection, pragmas):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            if name == 'journal_mode':
+                # The journal mode is stored in the file; switching it needs a lock, so only do it once
+                current = cursor.execute('PRAGMA journal_mode').fetchone()[0]
+                if current.lower() == str(value).lower():
+                    continue
+            cursor.execute(f'PRAGMA {name}={value}')
+    finally:
+        cursor.close()
+
+
+def is_file_sqlite(engine):
+    return engine.dialect.name == 'sqlite' and engine.url.database not in (None, '', ':memory:')
+
+
+def tune_engine(engine, pragmas):
+    """Run the pragmas on every new connection of a file-backed SQLite engine. Returns True if tuned."""
+    if not is_file_sqlite(engine):
+        return False
+
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        apply_pragmas(dbapi_connection, pragmas)
+
+    return True
+
+
+def configure_engines(app):
+    """Tune every engine of the app (default database and binds)."""
+    if not app.config.get('SQLITE_TUNING_ENABLED', True):
+        return
+    pragmas = sqlite_pragmas(app.config)
+    with app.app_context():
+        for bind_key, engine in db.engines.items():
+            if tune_engine(engine, pragmas):
+                log.debug("sqlite engine tuned", bind=bind_key or 'default', **pragmas)
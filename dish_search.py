@@ -0,0 +1,184 @@
+"""
+Ranked, typo-tolerant search over the custom dish catalog (dish.db).
+
+check_custom_dish used to run name ILIKE '%...%' (a full scan) and take the
+first arbitrary hit. search_custom_dishes() queries the custom_dish_fts FTS5
+table instead, which indexes each dish's name, description and ingredient
+names, and ranks hits with bm25 (name matches count most, then ingredients):
+
+    dishes = search_custom_dishes('chiken pilau', limit=5)   # best match first
+
+Every query word matches as a prefix. A word that is not the start of any
+indexed term is treated as a typo and widened to its closest terms in the
+index vocabulary (difflib over the fts5vocab terms with the same first letter
+and a similar length, cached for VOCABULARY_TTL seconds). A dish must match
+every word; match_all=False returns dishes that match any word and
+names_only=True only looks at dish names. check_custom_dish reports a dish as
+found only when its name matches and offers the other hits as suggestions.
+
+SQLite triggers keep custom_dish_fts in sync with custom_dish,
+custom_dish_ingredient and custom_ingredient, so admin edits and seed scripts
+need no extra calls; invalidate_dish_vocabulary() refreshes the typo
+vocabulary in this process. The index is created with the tables (create_all)
+or by migration 0015. Without FTS5 search falls back to a name LIKE.
+"""
+import bisect
+import difflib
+import re
+
+from flask import current_app
+from sqlalchemy import DDL, event, func, inspect, or_, text
+
+from models import db
+from custom_dish_models import CustomDish, CustomDishIngredient
+from chef_search import fts5_available
+from kv_store import TTLCache
+
+VOCABULARY_TTL = 300  # seconds
+MAX_CORRECTIONS = 3  # closest vocabulary terms tried per misspelt word
+CORRECTION_CUTOFF = 0.75  # difflib similarity needed to count as a typo of a term
+# bm25 column weights: name, description, ingredients
+RANK = 'bm25(custom_dish_fts, 10.0, 1.0, 3.0)'
+
+_vocabulary = TTLCache()
+
+_INDEX_DISH = (
+    "INSERT INTO custom_dish_fts(rowid, name, description, ingredients) "
+    "SELECT d.id, d.name, coalesce(d.description, ''), "
+    "(SELECT coalesce(group_concat(i.name, ' '), '') FROM custom_dish_ingredient di "
+    "JOIN custom_ingredient i ON i.id = di.ingredient_id WHERE di.dish_id = d.id) "
+    "FROM custom_dish d WHERE d.id {match}"
+)
+
+
+def _reindex(dish_id_match):
+    return (f"DELETE FROM custom_dish_fts WHERE rowid {dish_id_match}; "
+            f"{_INDEX_DISH.format(match=dish_id_match)};")
+
+
+# One FTS row per dish (rowid = custom_dish.id), rebuilt by triggers whenever its text changes
+SQLITE_SEARCH_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS custom_dish_fts USING fts5("
+    "name, description, ingredients, tokenize='unicode61 remove_diacritics 2')",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS custom_dish_vocab USING fts5vocab(custom_dish_fts, 'row')",
+    "CREATE TRIGGER IF NOT EXISTS custom_dish_fts_insert AFTER INSERT ON custom_dish BEGIN "
+    + _reindex('= new.id') + " END",
+    "CREATE TRIGGER IF NOT EXISTS custom_dish_fts_update AFTER UPDATE OF name, description ON custom_dish BEGIN "
+    + _reindex('= new.id') + " END",
+    "CREATE TRIGGER IF NOT EXISTS custom_dish_fts_delete AFTER DELETE ON custom_dish BEGIN "
+    "DELETE FROM custom_dish_fts WHERE rowid = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS custom_dish_fts_ingredient_insert AFTER INSERT ON custom_dish_ingredient BEGIN "
+    + _reindex('= new.dish_id') + " END",
+    "CREATE TRIGGER IF NOT EXISTS custom_dish_fts_ingredient_delete AFTER DELETE ON custom_dish_ingredient BEGIN "
+    + _reindex('= old.dish_id') + " END",
+    "CREATE TRIGGER IF NOT EXISTS custom_dish_fts_ingredient_rename AFTER UPDATE OF name ON custom_ingredient BEGIN "
+    + _reindex('IN (SELECT dish_id FROM custom_dish_ingredient WHERE ingredient_id = new.id)') + " END",
+)
+
+
+def _sqlite_fts(ddl, target, bind, **kw):
+    return fts5_available(bind)
+
+
+# custom_dish_ingredient is created after the two tables its triggers read, and dropped first
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(CustomDishIngredient.__table__, 'after_create', DDL(_statement).execute_if(callable_=_sqlite_fts))
+for _table in ('custom_dish_vocab', 'custom_dish_fts'):
+    event.listen(CustomDishIngredient.__table__, 'before_drop',
+                 DDL(f'DROP TABLE IF EXISTS {_table}').execute_if(dialect='sqlite'))
+
+
+def _engine():
+    return db.engines['custom_dishes']
+
+
+def fts_enabled(app=None):
+    """True if dish.db has the custom_dish_fts index; looked up once per app."""
+    if app is None:
+        app = current_app._get_current_object()
+    if 'dish_search_fts' not in app.extensions:
+        engine = _engine()
+        app.extensions['dish_search_fts'] = (engine.dialect.name == 'sqlite'
+                                             and inspect(engine).has_table('custom_dish_fts'))
+    return app.extensions['dish_search_fts']
+
+
+def _execute(sql, **params):
+    return db.session.execute(text(sql), params, bind_arguments={'bind': _engine()})
+
+
+def dish_vocabulary():
+    """Sorted distinct terms of the index, cached for VOCABULARY_TTL seconds."""
+    key = str(_engine().url)
+    terms = _vocabulary.get(key)
+    if terms is None:
+        terms = [term for (term,) in _execute('SELECT term FROM custom_dish_vocab ORDER BY term')]
+        _vocabulary.set(key, terms, ttl=VOCABULARY_TTL)
+    return terms
+
+
+def invalidate_dish_vocabulary():
+    _vocabulary.clear()
+
+
+def search_words(query):
+    return re.findall(r'\w+', (query or '').lower())
+
+
+def _is_prefix(word, vocabulary):
+    index = bisect.bisect_left(vocabulary, word)
+    return index < len(vocabulary) and vocabulary[index].startswith(word)
+
+
+def correction_candidates(word, vocabulary):
+    """Terms worth comparing with a misspelt word: same first letter and a length that can reach
+    CORRECTION_CUTOFF (difflib's ratio is at most 2 * shorter / (len(a) + len(b)))."""
+    start = bisect.bisect_left(vocabulary, word[0])
+    end = bisect.bisect_left(vocabulary, chr(ord(word[0]) + 1), start)
+    ratio = CORRECTION_CUTOFF / (2 - CORRECTION_CUTOFF)
+    return [term for term in vocabulary[start:end] if len(word) * ratio <= len(term) <= len(word) / ratio]
+
+
+def match_groups(words, vocabulary):
+    """FTS5 expression per word: the word as a prefix, OR its closest terms if it looks misspelt."""
+    groups = []
+    for word in words:
+        options = [f'"{word}"*']
+        if len(word) >= 3 and not _is_prefix(word, vocabulary):
+            candidates = correction_candidates(word, vocabulary)
+            options += [f'"{term}"' for term in
+                        difflib.get_close_matches(word, candidates, n=MAX_CORRECTIONS, cutoff=CORRECTION_CUTOFF)]
+        groups.append(options[0] if len(options) == 1 else f"({' OR '.join(options)})")
+    return groups
+
+
+def _ranked_ids(match, limit):
+    return [dish_id for (dish_id,) in _execute(
+        f'SELECT rowid FROM custom_dish_fts WHERE custom_dish_fts MATCH :match ORDER BY {RANK} LIMIT :limit',
+        match=match, limit=limit)]
+
+
+def search_custom_dish_ids(query, limit=10, match_all=True, names_only=False):
+    """Ids of the best matching dishes, best first; names_only ignores descriptions and ingredients."""
+    words = search_words(query)
+    if not words:
+        return []
+    if not fts_enabled():
+        if match_all:
+            condition = CustomDish.name.ilike(f"%{' '.join(words)}%")
+        else:
+            condition = or_(*[CustomDish.name.ilike(f'%{word}%') for word in words])
+        return [dish_id for (dish_id,) in db.session.query(CustomDish.id).filter(condition).order_by(
+            func.length(CustomDish.name)).limit(limit)]
+
+    match = (' AND ' if match_all else ' OR ').join(match_groups(words, dish_vocabulary()))
+    return _ranked_ids(f'name : ({match})' if names_only else match, limit)
+
+
+def search_custom_dishes(query, limit=10, match_all=True, names_only=False):
+    """Best matching CustomDish rows for a customer's search, best first."""
+    ids = search_custom_dish_ids(query, limit, match_all, names_only)
+    if not ids:
+        return []
+    dishes = {dish.id: dish for dish in CustomDish.query.filter(CustomDish.id.in_(ids))}
+    return [dishes[dish_id] for dish_id in ids if dish_id in dishes]
@@ -0,0 +1,133 @@
+"""
+Fragment caching for templates.
+
+Wrap a rarely-changing template section in a cache tag:
+
+    {% cache 'featured_chefs', 300 %} ... {% endcache %}
+    {% cache 'chef_menu', 600, chef.id %} ... {% endcache %}
+
+The first argument names the fragment (and is what invalidate_fragments()
+takes), the second is the lifetime in seconds; any further values become part
+of the key, for sections that differ per chef, user or role. Keys also include the
+tag's template and line, so one name can cover several sections (and pages)
+that change together.
+
+Backends (FRAGMENT_CACHE_BACKEND):
+- 'memory' : in-process LRU of FRAGMENT_CACHE_MAX_ENTRIES fragments; invalidation
+             only reaches the worker that handled the admin request, others
+             catch up when the TTL runs out
+- 'shared' : shared key-value store from SHARED_STORE_URL, so invalidation
+             reaches every worker
+- 'none'   : render every time (useful while editing templates)
+
+Routes that change what a fragment shows call invalidate_fragments(). Static
+markup (url_for of fixed files) gains nothing from caching and is left
+uncached.
+"""
+import hashlib
+
+from flask import current_app
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from kv_store import LRUCache, get_shared_client
+
+KEY_PREFIX = 'fragment:'
+
+
+def fragment_key(name, location, vary=()):
+    digest = hashlib.sha1(repr([location, *vary]).encode()).hexdigest()[:16]
+    return f'{KEY_PREFIX}{name}:{digest}'
+
+
+class MemoryFragmentStore:
+    def __init__(self, max_entries):
+        self._cache = LRUCache(max_entries)
+
+    def get(self, key):
+        return self._cache.get(key)
+
+    def set(self, key, html, ttl):
+        self._cache.set(key, html, ttl)
+
+    def delete_prefix(self, prefix):
+        for key in self._cache.keys():
+            if key.startswith(prefix):
+                self._cache.delete(key)
+
+
+class SharedFragmentStore:
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, key):
+        return self.client.get(key)
+
+    def set(self, key, html, ttl):
+        self.client.set(key, html, px=int(ttl * 1000) if ttl else None)
+
+    def delete_prefix(self, prefix):
+        keys = list(self.client.scan_iter(match=prefix + '*'))
+        if keys:
+            self.client.delete(*keys)
+
+
+class FragmentCacheExtension(Extension):
+    """The {% cache name, ttl[, vary...] %} ... {% endcache %} tag."""
+
+    tags = {'cache'}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=None)
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        name = parser.parse_expression()
+        parser.stream.expect('comma')
+        ttl = parser.parse_expression()
+        vary = []
+        while parser.stream.skip_if('comma'):
+            vary.append(parser.parse_expression())
+        args = [name, ttl, nodes.List(vary), nodes.Const(f'{parser.name}:{lineno}')]
+        body = parser.parse_statements(('name:endcache',), drop_needle=True)
+        return nodes.CallBlock(self.call_method('_render', args), [], [], body).set_lineno(lineno)
+
+    def _render(self, name, ttl, vary, location, caller):
+        store = self.environment.fragment_cache
+        if store is None:
+            return caller()
+        key = fragment_key(name, location, vary)
+        html = store.get(key)
+        if html is None:
+            html = caller()
+            store.set(key, str(html), ttl)
+        return Markup(html)
+
+
+def create_fragment_store(app):
+    backend = app.config.get('FRAGMENT_CACHE_BACKEND', 'memory')
+    if backend == 'memory':
+        return MemoryFragmentStore(app.config.get('FRAGMENT_CACHE_MAX_ENTRIES', 256))
+    if backend == 'shared':
+        return SharedFragmentStore(get_shared_client(app))
+    if backend == 'none':
+        return None
+    raise ValueError(f"Unknown FRAGMENT_CACHE_BACKEND: {backend}")
+
+
+def invalidate_fragments(*names):
+    """Drop every cached variant of the named fragments."""
+    store = current_app.extensions.get('fragment_cache')
+    if store is None:
+        return
+    for name in names:
+        store.delete_prefix(f'{KEY_PREFIX}{name}:')
+
+
+def init_fragment_cache(app):
+    store = create_fragment_store(app)
+    app.extensions['fragment_cache'] = store
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    app.jinja_env.fragment_cache = store
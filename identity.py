@@ -0,0 +1,127 @@
+"""
+Cached identity for Flask-Login.
+
+Every authenticated request used to load the User row in load_user() (and
+chef pages then looked up the Chef row by user_id). load_principal() instead
+returns a Principal (id, email, role, verification flags and chef_id) from a
+short-lived cache, so the identity of most requests costs no query at all.
+
+Backends (IDENTITY_CACHE_BACKEND), entries live IDENTITY_CACHE_TTL seconds:
+- 'memory' : in-process cache; invalidation only reaches the current worker,
+             other workers pick up the change when the TTL runs out
+- 'shared' : shared key-value store from SHARED_STORE_URL (all workers)
+- 'none'   : query on every request
+
+Code that changes a user's role, email, verification flags or chef profile, or
+deletes the user, must call invalidate_identity(user_id) after committing.
+"""
+import json
+
+from flask import current_app
+from flask_login import UserMixin
+
+from models import db, User, Chef
+from kv_store import TTLCache, get_shared_client
+
+FIELDS = ('id', 'email', 'role', 'email_verified', 'sms_verified', 'chef_id')
+
+
+class Principal(UserMixin):
+    """The logged-in user as request handlers see it (current_user); not a database row."""
+
+    def __init__(self, id, email, role, email_verified=False, sms_verified=False, chef_id=None):
+        self.id = id
+        self.email = email
+        self.role = role
+        self.email_verified = email_verified
+        self.sms_verified = sms_verified
+        self.chef_id = chef_id
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def __repr__(self):
+        return f'<Principal {self.id} {self.role}>'
+
+
+class MemoryIdentityStore:
+    def __init__(self):
+        self._cache = TTLCache()
+
+    def get(self, user_id):
+        return self._cache.get(user_id)
+
+    def set(self, user_id, data, ttl):
+        self._cache.set(user_id, data, ttl)
+
+    def delete(self, user_id):
+        self._cache.delete(user_id)
+
+
+class SharedIdentityStore:
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, user_id):
+        raw = self.client.get(f'identity:{user_id}')
+        return json.loads(raw) if raw else None
+
+    def set(self, user_id, data, ttl):
+        self.client.set(f'identity:{user_id}', json.dumps(data), px=int(ttl * 1000))
+
+    def delete(self, user_id):
+        self.client.delete(f'identity:{user_id}')
+
+
+def create_identity_store(app):
+    backend = app.config.get('IDENTITY_CACHE_BACKEND', 'memory')
+    if backend == 'memory':
+        return MemoryIdentityStore()
+    if backend == 'shared':
+        return SharedIdentityStore(get_shared_client(app))
+    if backend == 'none':
+        return None
+    raise ValueError(f"Unknown IDENTITY_CACHE_BACKEND: {backend}")
+
+
+def get_identity_store(app=None):
+    """Return the app-wide identity store (None when caching is off), creating it on first use."""
+    if app is None:
+        app = current_app._get_current_object()
+    if 'identity_cache' not in app.extensions:
+        app.extensions['identity_cache'] = create_identity_store(app)
+    return app.extensions['identity_cache']
+
+
+def fetch_principal(user_id):
+    """Load a Principal with one query (user joined to their chef profile), or None.
+
+    Users whose chef profile is soft-deleted (chef_deletion) get None: they are logged out.
+    """
+    row = db.session.query(
+        User.id, User.email, User.role, User.email_verified, User.sms_verified, Chef.id
+    ).outerjoin(Chef, Chef.user_id == User.id).filter(
+        User.id == user_id, Chef.deleted_at.is_(None)
+    ).first()
+    if row is None:
+        return None
+    return Principal(*row)
+
+
+def load_principal(user_id):
+    store = get_identity_store()
+    if store is None:
+        return fetch_principal(user_id)
+    data = store.get(user_id)
+    if data is not None:
+        return Principal(**data)
+    principal = fetch_principal(user_id)
+    if principal is not None:
+        store.set(user_id, principal.to_dict(), current_app.config.get('IDENTITY_CACHE_TTL', 60))
+    return principal
+
+
+def invalidate_identity(user_id):
+    store = get_identity_store()
+    if store is not None:
+        store.delete(user_id)
@@ -0,0 +1,236 @@
+"""
+Key-value stores for short-lived data (verification codes, counters, caches)
+- TTLCache: thread-safe in-process map with per-key expiry (single node)
+- LRUCache: like TTLCache but bounded, evicting the least recently used key
+- LocalKVClient: in-process stand-in for a shared store, speaking the small
+  subset of the Redis client API we rely on (used in tests and single-node setups)
+- get_shared_client(): returns the configured shared client (SHARED_STORE_URL)
+"""
+import fnmatch
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe dict with per-key expiry. Expired keys are dropped lazily and by periodic sweeps."""
+
+    def __init__(self, sweep_every=256):
+        self._data = {}
+        self._lock = threading.Lock()
+        self._sweep_every = sweep_every
+        self._writes = 0
+
+    def _alive(self, key, now):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= now:
+            del self._data[key]
+            return None
+        return entry
+
+    def _sweep(self, now):
+        expired = [k for k, (_, exp) in self._data.items() if exp is not None and exp <= now]
+        for key in expired:
+            del self._data[key]
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._alive(key, time.monotonic())
+            return default if entry is None else entry[0]
+
+    def set(self, key, value, ttl=None):
+        """Store value under key; ttl is in seconds (None = no expiry)."""
+        now = time.monotonic()
+        with self._lock:
+            self._data[key] = (value, now + ttl if ttl is not None else None)
+            self._writes += 1
+            if self._writes % self._sweep_every == 0:
+                self._sweep(now)
+
+    def add(self, key, value, ttl=None):
+        """Store value only if key is absent. Returns True if stored."""
+        now = time.monotonic()
+        with self._lock:
+            if self._alive(key, now) is not None:
+                return False
+            self._data[key] = (value, now + ttl if ttl is not None else None)
+            return True
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._alive(key, time.monotonic())
+            if entry is None:
+                return default
+            del self._data[key]
+            return entry[0]
+
+    def delete(self, key):
+        return self.pop(key, _MISSING) is not _MISSING
+
+    def incr(self, key, amount=1, ttl=None):
+        """Increment a counter, creating it with ttl if missing. Keeps the existing expiry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._alive(key, now)
+            if entry is None:
+                value, expires = amount, (now + ttl if ttl is not None else None)
+            else:
+                value, expires = entry[0] + amount, entry[1]
+            self._data[key] = (value, expires)
+            return value
+
+    def expire(self, key, ttl):
+        """Give an existing key a new ttl in seconds. Returns False if the key is missing."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._alive(key, now)
+            if entry is None:
+                return False
+            self._data[key] = (entry[0], now + ttl if ttl is not None else None)
+            return True
+
+    def ttl(self, key):
+        """Seconds until key expires, None if it has no expiry, -1 if missing."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._alive(key, now)
+            if entry is None:
+                return -1
+            return None if entry[1] is None else entry[1] - now
+
+    def keys(self):
+        """Snapshot of live keys."""
+        return [k for k, _ in self.items()]
+
+    def items(self):
+        """Snapshot of live (key, value) pairs."""
+        now = time.monotonic()
+        with self._lock:
+            self._sweep(now)
+            return [(k, v) for k, (v, _) in self._data.items()]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        with self._lock:
+            self._sweep(time.monotonic())
+            return len(self._data)
+
+
+class LRUCache:
+    """Thread-safe map holding at most max_entries keys, with optional per-key expiry."""
+
+    def __init__(self, max_entries=256):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[1] is not None and entry[1] <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value, ttl=None):
+        """Store value under key; ttl is in seconds (None = no expiry)."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl if ttl is not None else None)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def keys(self):
+        """Snapshot of stored keys (expired ones included until touched or evicted)."""
+        with self._lock:
+            return list(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+
+class LocalKVClient:
+    """In-process stand-in for a shared key-value store (Redis-compatible subset)."""
+
+    def __init__(self):
+        self._cache = TTLCache()
+
+    def get(self, name):
+        return self._cache.get(name)
+
+    def set(self, name, value, px=None, nx=False):
+        ttl = px / 1000.0 if px is not None else None
+        if nx:
+            return True if self._cache.add(name, value, ttl) else None
+        self._cache.set(name, value, ttl)
+        return True
+
+    def delete(self, *names):
+        return sum(1 for name in names if self._cache.delete(name))
+
+    def incr(self, name, amount=1):
+        return self._cache.incr(name, amount)
+
+    def pexpire(self, name, ms):
+        return self._cache.expire(name, ms / 1000.0)
+
+    def pttl(self, name):
+        remaining = self._cache.ttl(name)
+        if remaining == -1:
+            return -2
+        if remaining is None:
+            return -1
+        return int(remaining * 1000)
+
+    def scan_iter(self, match=None):
+        for key in self._cache.keys():
+            if match is None or fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def flushdb(self):
+        self._cache.clear()
+        return True
+
+
+def create_shared_client(url):
+    """Build a shared store client from a URL: 'local://' (default) or 'redis://...'."""
+    if not url or url.startswith('local://'):
+        return LocalKVClient()
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("SHARED_STORE_URL points at Redis but the 'redis' package is not installed")
+        return redis.Redis.from_url(url, decode_responses=True)
+    raise ValueError(f"Unsupported SHARED_STORE_URL: {url}")
+
+
+def get_shared_client(app=None):
+    """Return the app-wide shared store client, creating it on first use."""
+    if app is None:
+        from flask import current_app
+        app = current_app._get_current_object()
+    client = app.extensions.get('shared_store')
+    if client is None:
+        client = create_shared_client(app.config.get('SHARED_STORE_URL'))
+        app.extensions['shared_store'] = client
+    return client
@@ -0,0 +1,181 @@
+"""
+Outbox for notification emails.
+
+Approving a chef used to build and send the email inside the request, over a
+new SMTP connection per message. enqueue_emails() instead inserts the
+messages into outbound_email as part of the caller's transaction, and
+send_queued_emails() delivers them MAIL_BATCH_SIZE at a time over one SMTP
+connection (reconnecting only if the server drops it).
+
+    enqueue_emails([{'to_address': ..., 'subject': ..., 'text_body': ..., 'html_body': ...}])
+    db.session.commit()
+    flush_outbox()
+
+Delivery after flush_outbox() (MAIL_DELIVERY):
+- 'thread' : drain the outbox in a background thread of this process
+- 'inline' : drain it before returning (tests, scripts)
+- 'cron'   : leave it to 'flask send-queued-emails'
+Failed messages stay queued and are retried by later runs up to MAX_ATTEMPTS times.
+Use one delivery mode per deployment: separate drainers would send twice.
+"""
+import threading
+from datetime import datetime
+
+from flask import current_app
+
+from app_logging import get_logger
+from models import db, OutboundEmail, SystemConfig
+
+log = get_logger(__name__)
+
+MAX_ATTEMPTS = 5
+SMTP_CONFIG_KEYS = ('gmail_user', 'gmail_password', 'smtp_host', 'smtp_port',
+                    'smtp_encryption', 'sender_name', 'email_timeout')
+
+_drain_lock = threading.Lock()
+
+
+def load_smtp_settings():
+    """SMTP settings from SystemConfig (set on the admin email settings page), or None if not configured."""
+    config = {c.key: c.value for c in SystemConfig.query.filter(SystemConfig.key.in_(SMTP_CONFIG_KEYS))}
+    if not config.get('gmail_user') or not config.get('gmail_password'):
+        return None
+    return {
+        'user': config['gmail_user'],
+        'password': config['gmail_password'],
+        'host': config.get('smtp_host', 'smtp.gmail.com'),
+        'port': int(config.get('smtp_port', 587)),
+        'encryption': config.get('smtp_encryption', 'tls'),
+        'sender_name': config.get('sender_name', 'e-Rugah'),
+        'timeout': int(config.get('email_timeout', 30)),
+    }
+
+
+def open_smtp(settings):
+    """Connect and log in; the connection is reused for every message of a run."""
+    import smtplib
+
+    if settings['encryption'] == 'ssl':
+        server = smtplib.SMTP_SSL(settings['host'], settings['port'], timeout=settings['timeout'])
+    else:
+        server = smtplib.SMTP(settings['host'], settings['port'], timeout=settings['timeout'])
+        if settings['encryption'] == 'tls':
+            server.starttls()
+    server.login(settings['user'], settings['password'])
+    return server
+
+
+def build_message(email, settings):
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
+    msg = MIMEMultipart('alternative')
+    msg['From'] = f"{settings['sender_name']} <{settings['user']}>"
+    msg['To'] = email.to_address
+    msg['Subject'] = email.subject
+    msg.attach(MIMEText(email.text_body, 'plain'))
+    if email.html_body:
+        msg.attach(MIMEText(email.html_body, 'html'))
+    return msg
+
+
+def enqueue_emails(messages):
+    """Queue dicts of to_address, subject, text_body and html_body with one INSERT (caller commits)."""
+    rows = [dict(message, created_at=datetime.utcnow()) for message in messages]
+    if rows:
+        db.session.execute(db.insert(OutboundEmail), rows)
+    return len(rows)
+
+
+def pending_emails(after_id, limit):
+    return OutboundEmail.query.filter(
+        OutboundEmail.sent_at.is_(None),
+        OutboundEmail.attempts < MAX_ATTEMPTS,
+        OutboundEmail.id > after_id,
+    ).order_by(OutboundEmail.id).limit(limit).all()
+
+
+def send_queued_emails(batch_size=None, connect=open_smtp):
+    """Send pending emails in batches over one SMTP connection. Returns (sent, failed)."""
+    import smtplib
+
+    settings = load_smtp_settings()
+    if settings is None:
+        log.warning("email not configured, outbox left queued")
+        return 0, 0
+    batch_size = batch_size or current_app.config.get('MAIL_BATCH_SIZE', 50)
+
+    sent = failed = 0
+    after_id = 0
+    server = None
+    try:
+        while True:
+            batch = pending_emails(after_id, batch_size)
+            if not batch:
+                break
+            if server is None:
+                server = connect(settings)
+
+            delivered = []
+            try:
+                for email in batch:
+                    message = build_message(email, settings)
+                    try:
+                        try:
+                            server.send_message(message)
+                        except smtplib.SMTPServerDisconnected:
+                            server = connect(settings)
+                            server.send_message(message)
+                        delivered.append(email.id)
+                    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                        # This message was refused; count the attempt and carry on with the batch
+                        email.attempts += 1
+                        email.last_error = str(e)[:200]
+                        failed += 1
+            finally:
+                # Record what went out even if the connection failed part-way
+                if delivered:
+                    OutboundEmail.query.filter(OutboundEmail.id.in_(delivered)).update(
+                        {OutboundEmail.sent_at: datetime.utcnow()}, synchronize_session=False)
+                db.session.commit()
+                sent += len(delivered)
+            after_id = batch[-1].id
+    except (smtplib.SMTPException, OSError) as e:
+        # Could not connect, log in or stay connected: leave the rest queued for the next run
+        log.error("outbox delivery stopped", error=str(e), sent=sent)
+    finally:
+        if server is not None:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+
+    if sent or failed:
+        log.info("outbox flushed", sent=sent, failed=failed)
+    return sent, failed
+
+
+def _drain(app):
+    # One drainer per process; rows queued meanwhile are picked up by its next batch query
+    if not _drain_lock.acquire(blocking=False):
+        return
+    try:
+        with app.app_context():
+            send_queued_emails()
+    except Exception:
+        log.exception("outbox flush failed")
+    finally:
+        _drain_lock.release()
+
+
+def flush_outbox(app=None):
+    """Start delivering queued emails according to MAIL_DELIVERY (call after committing)."""
+    if app is None:
+        app = current_app._get_current_object()
+    delivery = app.config.get('MAIL_DELIVERY', 'thread')
+    if delivery == 'thread':
+        threading.Thread(target=_drain, args=(app,), name='mail-outbox', daemon=True).start()
+    elif delivery == 'inline':
+        send_queued_emails()
+    elif delivery != 'cron':
+        raise ValueError(f"Unknown MAIL_DELIVERY: {delivery}")
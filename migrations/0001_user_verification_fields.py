@@ -0,0 +1,7 @@
+"""Add email_verified and sms_verified to user"""
+BIND = None
+
+
+def upgrade(op):
+    op.add_column('user', 'email_verified', 'BOOLEAN DEFAULT FALSE')
+    op.add_column('user', 'sms_verified', 'BOOLEAN DEFAULT FALSE')
@@ -0,0 +1,18 @@
+"""Create the password_reset_code table"""
+from sqlalchemy import Boolean, Column, DateTime, Integer, MetaData, String, Table
+
+BIND = None
+
+password_reset_code = Table(
+    'password_reset_code', MetaData(),
+    Column('id', Integer, primary_key=True),
+    Column('email', String(120), nullable=False),
+    Column('code', String(6), nullable=False),
+    Column('expires_at', DateTime, nullable=False),
+    Column('is_used', Boolean),
+    Column('created_at', DateTime),
+)
+
+
+def upgrade(op):
+    op.create_table(password_reset_code)
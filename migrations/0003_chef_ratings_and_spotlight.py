@@ -0,0 +1,13 @@
+"""Add chef rating aggregates, featured flags and booking ratings"""
+BIND = None
+
+
+def upgrade(op):
+    op.add_column('chef', 'rating_total', 'INTEGER DEFAULT 0')
+    op.add_column('chef', 'rating_count', 'INTEGER DEFAULT 0')
+    op.add_column('chef', 'is_featured', 'BOOLEAN DEFAULT FALSE')
+    op.add_column('chef', 'featured_priority', 'INTEGER DEFAULT 100')
+
+    op.add_column('booking', 'rating_value', 'INTEGER')
+    op.add_column('booking', 'rating_comment', 'TEXT')
+    op.add_column('booking', 'rating_submitted_at', 'TIMESTAMP')
@@ -0,0 +1,19 @@
+"""Create the review table"""
+from sqlalchemy import Boolean, Column, DateTime, Integer, MetaData, String, Table, Text
+
+BIND = None
+
+review = Table(
+    'review', MetaData(),
+    Column('id', Integer, primary_key=True),
+    Column('customer_name', String(100), nullable=False),
+    Column('event_type', String(100), nullable=False),
+    Column('rating', Integer, nullable=False),
+    Column('review_text', Text, nullable=False),
+    Column('is_approved', Boolean),
+    Column('created_at', DateTime),
+)
+
+
+def upgrade(op):
+    op.create_table(review)
@@ -0,0 +1,46 @@
+"""Index verification, OTP and password reset code lookups"""
+from sqlalchemy import Boolean, Column, DateTime, Integer, MetaData, String, Table
+
+BIND = None
+
+metadata = MetaData()
+TABLES = [
+    Table('verification_code', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('identifier', String(120), nullable=False),
+          Column('code', String(4), nullable=False),
+          Column('type', String(10), nullable=False),
+          Column('expires_at', DateTime, nullable=False),
+          Column('is_used', Boolean),
+          Column('created_at', DateTime)),
+    Table('otp', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('email', String(120), nullable=False),
+          Column('code', String(6), nullable=False),
+          Column('expires_at', DateTime, nullable=False),
+          Column('is_used', Boolean),
+          Column('created_at', DateTime)),
+    Table('password_reset_code', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('email', String(120), nullable=False),
+          Column('code', String(6), nullable=False),
+          Column('expires_at', DateTime, nullable=False),
+          Column('is_used', Boolean),
+          Column('created_at', DateTime)),
+]
+
+INDEXES = [
+    ('ix_verification_code_lookup', 'verification_code', 'identifier, type, is_used, code'),
+    ('ix_verification_code_expires_at', 'verification_code', 'expires_at'),
+    ('ix_otp_lookup', 'otp', 'email, is_used, code'),
+    ('ix_otp_expires_at', 'otp', 'expires_at'),
+    ('ix_password_reset_code_lookup', 'password_reset_code', 'email, is_used, code'),
+    ('ix_password_reset_code_expires_at', 'password_reset_code', 'expires_at'),
+]
+
+
+def upgrade(op):
+    for table in TABLES:
+        op.create_table(table)
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
@@ -0,0 +1,6 @@
+"""Index the approved-reviews feed"""
+BIND = None
+
+
+def upgrade(op):
+    op.create_index('ix_review_approved_created_at', 'review', 'is_approved, created_at')
@@ -0,0 +1,36 @@
+"""Create the review_stat aggregates table"""
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table
+
+BIND = None
+
+review_stat = Table(
+    'review_stat', MetaData(),
+    Column('id', Integer, primary_key=True),
+    Column('event_type', String(100), unique=True, nullable=False),
+    Column('review_count', Integer, nullable=False),
+    Column('rating_total', Integer, nullable=False),
+    *[Column(f'stars_{star}', Integer, nullable=False) for star in range(1, 6)],
+    Column('updated_at', DateTime),
+)
+
+STAR_SUMS = ', '.join(f'coalesce(sum(CASE WHEN rating = {star} THEN 1 ELSE 0 END), 0)' for star in range(1, 6))
+STAT_COLUMNS = 'event_type, review_count, rating_total, stars_1, stars_2, stars_3, stars_4, stars_5, updated_at'
+
+
+def upgrade(op):
+    op.create_table(review_stat)
+
+
+def backfill(op):
+    # Approving or removing a review increments these rows, so they must start from the real totals
+    if 'review' not in op.tables():
+        return
+    op.execute('DELETE FROM review_stat')
+    op.execute(
+        f"INSERT INTO review_stat ({STAT_COLUMNS}) "
+        f"SELECT event_type, count(*), coalesce(sum(rating), 0), {STAR_SUMS}, CURRENT_TIMESTAMP "
+        f"FROM review WHERE is_approved = :approved GROUP BY event_type", approved=True)
+    op.execute(
+        f"INSERT INTO review_stat ({STAT_COLUMNS}) "
+        f"SELECT '*', count(*), coalesce(sum(rating), 0), {STAR_SUMS}, CURRENT_TIMESTAMP "
+        f"FROM review WHERE is_approved = :approved", approved=True)
@@ -0,0 +1,65 @@
+"""Add the precomputed chef ranking_score and its ordering index"""
+from datetime import datetime
+
+from sqlalchemy import text
+
+BIND = None
+
+# The ranking as it stood when ranking_score was added; 'flask refresh-chef-rankings'
+# recomputes it with the current formula
+PRIOR_WEIGHT = 5.0
+HALF_LIFE_DAYS = 180.0
+DEFAULT_PRIOR_MEAN = 3.5
+PRIOR_MEAN_KEY = 'ranking_prior_mean'
+
+
+def upgrade(op):
+    op.add_column('chef', 'ranking_score', 'FLOAT DEFAULT 0')
+    op.create_index('ix_chef_ranking', 'chef', 'is_featured, featured_priority, ranking_score')
+
+
+def _score(booking_ratings, rating_total, rating_count, prior_mean, now):
+    rating_count = rating_count or 0
+    booking_ratings = sorted(booking_ratings, key=lambda r: r[1] or datetime.min, reverse=True)[:rating_count]
+    weighted_sum = weight_total = 0.0
+    for value, rated_at in booking_ratings:
+        age_days = max(0.0, (now - rated_at).total_seconds() / 86400.0) if rated_at else 0.0
+        weight = 0.5 ** (age_days / HALF_LIFE_DAYS)
+        weighted_sum += weight * value
+        weight_total += weight
+    manual_count = rating_count - len(booking_ratings)
+    if manual_count:
+        weighted_sum += max(0, (rating_total or 0) - sum(value for value, _ in booking_ratings))
+        weight_total += manual_count
+    return round((PRIOR_WEIGHT * prior_mean + weighted_sum) / (PRIOR_WEIGHT + weight_total), 4)
+
+
+def _timestamp(value):
+    # SQLite returns TIMESTAMP columns read with text() as strings
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def backfill(op):
+    # The ranked ORDER BY no longer wraps these in COALESCE, so NULLs must not remain
+    op.batched_update('chef', 'is_featured = :value', 'is_featured IS NULL', value=False)
+    op.batched_update('chef', 'featured_priority = 0', 'featured_priority IS NULL')
+
+    now = datetime.utcnow()
+    total, count = op.execute('SELECT sum(rating_total), sum(rating_count) FROM chef').one()
+    prior_mean = float(total) / float(count) if count else DEFAULT_PRIOR_MEAN
+    updated = op.execute('UPDATE system_config SET value = :value WHERE key = :key',
+                         key=PRIOR_MEAN_KEY, value=f'{prior_mean:.4f}')
+    if not updated.rowcount:
+        op.execute('INSERT INTO system_config (key, value) VALUES (:key, :value)',
+                   key=PRIOR_MEAN_KEY, value=f'{prior_mean:.4f}')
+
+    ratings = {}
+    for chef_id, value, rated_at in op.execute(
+            'SELECT chef_id, rating_value, rating_submitted_at FROM booking WHERE rating_value IS NOT NULL'):
+        ratings.setdefault(chef_id, []).append((value, _timestamp(rated_at)))
+    scores = [
+        {'id': chef_id, 'score': _score(ratings.get(chef_id, []), rating_total, rating_count, prior_mean, now)}
+        for chef_id, rating_total, rating_count in op.execute('SELECT id, rating_total, rating_count FROM chef')
+    ]
+    if scores:
+        op.conn.execute(text('UPDATE chef SET ranking_score = :score WHERE id = :id'), scores)
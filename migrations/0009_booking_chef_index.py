@@ -0,0 +1,6 @@
+"""Index bookings by chef"""
+BIND = None
+
+
+def upgrade(op):
+    op.create_index('ix_booking_chef_id', 'booking', 'chef_id')
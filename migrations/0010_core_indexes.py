@@ -0,0 +1,19 @@
+"""Index foreign keys and status columns of the core schema"""
+BIND = None
+
+INDEXES = [
+    ('ix_booking_event_id', 'booking', 'event_id'),
+    ('ix_booking_status', 'booking', 'status'),
+    ('ix_payment_booking_id', 'payment', 'booking_id, created_at'),
+    ('ix_payment_transaction_id', 'payment', 'transaction_id'),
+    ('ix_event_customer_id', 'event', 'customer_id'),
+    ('ix_event_event_date', 'event', 'event_date'),
+    ('ix_chef_user_id', 'chef', 'user_id'),
+    ('ix_dish_ingredient_dish_id', 'dish_ingredient', 'dish_id'),
+]
+
+
+def upgrade(op):
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    op.execute('ANALYZE')
@@ -0,0 +1,8 @@
+"""Index custom dish ingredients by dish"""
+BIND = 'custom_dishes'
+
+
+def upgrade(op):
+    if 'custom_dish_ingredient' in op.tables():
+        op.create_index('ix_custom_dish_ingredient_dish_id', 'custom_dish_ingredient', 'dish_id')
+        op.execute('ANALYZE')
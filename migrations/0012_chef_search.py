@@ -0,0 +1,42 @@
+"""Index the admin chef list and add the chef name/about search index"""
+BIND = None
+
+INDEXES = [
+    ('ix_chef_created_at', 'chef', 'created_at, id'),
+    ('ix_chef_approved_created_at', 'chef', 'is_approved, created_at, id'),
+    ('ix_chef_county_created_at', 'chef', 'county, created_at, id'),
+]
+
+# External-content FTS5 table over chef(name, about); rows are indexed by chef.id
+SQLITE_SEARCH_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS chef_fts USING fts5("
+    "name, about, content='chef', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS chef_fts_insert AFTER INSERT ON chef BEGIN "
+    "INSERT INTO chef_fts(rowid, name, about) VALUES (new.id, new.name, new.about); END",
+    "CREATE TRIGGER IF NOT EXISTS chef_fts_delete AFTER DELETE ON chef BEGIN "
+    "INSERT INTO chef_fts(chef_fts, rowid, name, about) VALUES ('delete', old.id, old.name, old.about); END",
+    "CREATE TRIGGER IF NOT EXISTS chef_fts_update AFTER UPDATE OF name, about ON chef BEGIN "
+    "INSERT INTO chef_fts(chef_fts, rowid, name, about) VALUES ('delete', old.id, old.name, old.about); "
+    "INSERT INTO chef_fts(rowid, name, about) VALUES (new.id, new.name, new.about); END",
+)
+POSTGRES_SEARCH_INDEX = ("CREATE INDEX IF NOT EXISTS ix_chef_search ON chef USING gin "
+                         "(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(about, '')))")
+
+
+def upgrade(op):
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    if op.fts5_available():
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+    elif op.dialect == 'postgresql':
+        op.execute(POSTGRES_SEARCH_INDEX)
+
+
+def backfill(op):
+    # Keyset pagination and the status filter do not match NULLs
+    op.batched_update('chef', 'created_at = CURRENT_TIMESTAMP', 'created_at IS NULL')
+    op.batched_update('chef', 'is_approved = :value', 'is_approved IS NULL', value=False)
+    if 'chef_fts' in op.tables():
+        op.execute("INSERT INTO chef_fts(chef_fts) VALUES ('rebuild')")
+    op.execute('ANALYZE')
@@ -0,0 +1,22 @@
+"""Create the outbound_email notification outbox"""
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, Text
+
+BIND = None
+
+outbound_email = Table(
+    'outbound_email', MetaData(),
+    Column('id', Integer, primary_key=True),
+    Column('to_address', String(120), nullable=False),
+    Column('subject', String(200), nullable=False),
+    Column('text_body', Text, nullable=False),
+    Column('html_body', Text),
+    Column('attempts', Integer, nullable=False),
+    Column('last_error', String(200)),
+    Column('created_at', DateTime),
+    Column('sent_at', DateTime),
+    Index('ix_outbound_email_pending', 'sent_at', 'id'),
+)
+
+
+def upgrade(op):
+    op.create_table(outbound_email)
@@ -0,0 +1,26 @@
+"""Add chef soft deletion and cascade chef deletes to bookings and payments"""
+BIND = None
+
+# (table, column, referenced table) whose foreign key gets ON DELETE CASCADE
+CASCADES = [
+    ('chef', 'user_id', 'user'),
+    ('booking', 'chef_id', 'chef'),
+    ('payment', 'booking_id', 'booking'),
+]
+
+
+def upgrade(op):
+    op.add_column('chef', 'deleted_at', 'TIMESTAMP')
+    op.create_index('ix_chef_deleted_at', 'chef', 'deleted_at')
+
+    # SQLite cannot alter a constraint in place (and does not enforce it here);
+    # chef_deletion deletes the dependent rows explicitly on every database
+    if op.dialect != 'postgresql':
+        return
+    for table, column, referred in CASCADES:
+        for fk in op.foreign_keys(table):
+            if fk['constrained_columns'] != [column] or fk['options'].get('ondelete') == 'CASCADE':
+                continue
+            op.execute(f"ALTER TABLE {op.quote(table)} DROP CONSTRAINT {op.quote(fk['name'])}")
+            op.execute(f"ALTER TABLE {op.quote(table)} ADD CONSTRAINT {op.quote(fk['name'])} "
+                       f"FOREIGN KEY ({op.quote(column)}) REFERENCES {op.quote(referred)} (id) ON DELETE CASCADE")
@@ -0,0 +1,50 @@
+"""Add the custom dish full-text search index"""
+BIND = 'custom_dishes'
+
+TABLES = {'custom_dish', 'custom_ingredient', 'custom_dish_ingredient'}
+
+INDEX_DISH = (
+    "INSERT INTO custom_dish_fts(rowid, name, description, ingredients) "
+    "SELECT d.id, d.name, coalesce(d.description, ''), "
+    "(SELECT coalesce(group_concat(i.name, ' '), '') FROM custom_dish_ingredient di "
+    "JOIN custom_ingredient i ON i.id = di.ingredient_id WHERE di.dish_id = d.id) "
+    "FROM custom_dish d WHERE d.id {match}"
+)
+
+
+def _reindex(dish_id_match):
+    return (f"DELETE FROM custom_dish_fts WHERE rowid {dish_id_match}; "
+            f"{INDEX_DISH.format(match=dish_id_match)};")
+
+
+# One FTS row per dish (rowid = custom_dish.id), rebuilt by triggers whenever its text changes
+SQLITE_SEARCH_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS custom_dish_fts USING fts5("
+    "name, description, ingredients, tokenize='unicode61 remove_diacritics 2')",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS custom_dish_vocab USING fts5vocab(custom_dish_fts, 'row')",
+    "CREATE TRIGGER IF NOT EXISTS custom_dish_fts_insert AFTER INSERT ON custom_dish BEGIN "
+    + _reindex('= new.id') + " END",
+    "CREATE TRIGGER IF NOT EXISTS custom_dish_fts_update AFTER UPDATE OF name, description ON custom_dish BEGIN "
+    + _reindex('= new.id') + " END",
+    "CREATE TRIGGER IF NOT EXISTS custom_dish_fts_delete AFTER DELETE ON custom_dish BEGIN "
+    "DELETE FROM custom_dish_fts WHERE rowid = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS custom_dish_fts_ingredient_insert AFTER INSERT ON custom_dish_ingredient BEGIN "
+    + _reindex('= new.dish_id') + " END",
+    "CREATE TRIGGER IF NOT EXISTS custom_dish_fts_ingredient_delete AFTER DELETE ON custom_dish_ingredient BEGIN "
+    + _reindex('= old.dish_id') + " END",
+    "CREATE TRIGGER IF NOT EXISTS custom_dish_fts_ingredient_rename AFTER UPDATE OF name ON custom_ingredient BEGIN "
+    + _reindex('IN (SELECT dish_id FROM custom_dish_ingredient WHERE ingredient_id = new.id)') + " END",
+)
+
+
+def upgrade(op):
+    # Without FTS5 (or on PostgreSQL) dish search falls back to a name LIKE
+    if op.fts5_available() and TABLES <= op.tables():
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+
+
+def backfill(op):
+    if 'custom_dish_fts' in op.tables():
+        op.execute('DELETE FROM custom_dish_fts')
+        op.execute(INDEX_DISH.format(match='IS NOT NULL'))
@@ -0,0 +1,13 @@
+"""Rebuild review aggregates on databases that ran 0007 before it had a backfill"""
+import importlib
+
+BIND = None
+
+
+def upgrade(op):
+    pass
+
+
+def backfill(op):
+    # Rows created at zero and then incremented undercount every review approved before them
+    importlib.import_module('migrations.0007_review_stats').backfill(op)
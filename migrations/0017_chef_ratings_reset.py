@@ -0,0 +1,8 @@
+"""Record when an admin last reset a chef's ratings"""
+BIND = None
+
+
+def upgrade(op):
+    # NULL for every chef: resets made before this column existed cannot be dated,
+    # so their older booking ratings count again until the next reset
+    op.add_column('chef', 'ratings_reset_at', 'TIMESTAMP')
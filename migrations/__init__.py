@@ -0,0 +1,2 @@
+"""Versioned schema migrations; apply with 'flask migrate' (see runner.py)."""
+from migrations.runner import MigrationRunner, MigrationError, discover_migrations, format_report
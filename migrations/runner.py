@@ -0,0 +1,222 @@
+"""
+Versioned schema migrations.
+
+Each migration is a module in this package named NNNN_description.py with:
+
+    BIND = None                 # or 'custom_dishes' for dish.db
+    def upgrade(op): ...        # schema changes, run in one transaction
+    def backfill(op): ...       # optional data changes, run after upgrade commits
+
+Applied versions are recorded in the schema_migrations table of the main
+database, so 'flask migrate' only runs what is pending. Migrations must be
+idempotent (check before adding a column, CREATE INDEX IF NOT EXISTS):
+databases upgraded by the old migrate_*.py scripts already have some changes.
+Backfills use op.batched_update(), which commits every batch and picks up
+where it stopped if a run is interrupted. Keep SQL portable between SQLite and
+PostgreSQL (BOOLEAN DEFAULT FALSE, TIMESTAMP); op quotes table and index names
+('user' is reserved in PostgreSQL) and op.dialect allows the odd special case.
+
+A migration must do the same thing on every future deploy, so it never imports
+models or other application modules, which keep changing: tables are declared
+with sqlalchemy.Table in the migration itself and DDL/SQL is written out there.
+"""
+import importlib
+import os
+import pkgutil
+import re
+import time
+from datetime import datetime
+
+from sqlalchemy import inspect, text
+
+from app_logging import get_logger
+
+log = get_logger(__name__)
+
+VERSION_TABLE = 'schema_migrations'
+MODULE_PATTERN = re.compile(r'^(\d{4})_(\w+)$')
+DEFAULT_BATCH_SIZE = 1000
+
+
+class MigrationError(Exception):
+    pass
+
+
+class Migration:
+    def __init__(self, version, name, module):
+        self.version = version
+        self.name = name
+        self.module = module
+        self.bind = getattr(module, 'BIND', None)
+        self.description = (module.__doc__ or name).strip().splitlines()[0]
+
+    def __repr__(self):
+        return f"<Migration {self.version:04d} {self.name}>"
+
+
+def discover_migrations(package='migrations'):
+    """Return all migrations in the package, ordered by version."""
+    path = os.path.dirname(importlib.import_module(package).__file__)
+    migrations = []
+    for info in pkgutil.iter_modules([path]):
+        match = MODULE_PATTERN.match(info.name)
+        if match:
+            module = importlib.import_module(f'{package}.{info.name}')
+            migrations.append(Migration(int(match.group(1)), match.group(2), module))
+    migrations.sort(key=lambda m: m.version)
+
+    versions = [m.version for m in migrations]
+    if len(set(versions)) != len(versions):
+        raise MigrationError(f"Duplicate migration versions in {package}: {versions}")
+    return migrations
+
+
+class Operations:
+    """Helpers passed to upgrade()/backfill() as 'op'."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    @property
+    def dialect(self):
+        return self.conn.dialect.name
+
+    def execute(self, sql, **params):
+        return self.conn.execute(text(sql), params)
+
+    def quote(self, name):
+        return self.conn.dialect.identifier_preparer.quote(name)
+
+    def tables(self):
+        return set(inspect(self.conn).get_table_names())
+
+    def columns(self, table):
+        return {c['name'] for c in inspect(self.conn).get_columns(table)}
+
+    def foreign_keys(self, table):
+        return inspect(self.conn).get_foreign_keys(table)
+
+    def add_column(self, table, column, ddl):
+        """ALTER TABLE ... ADD COLUMN unless the column exists. Returns True if added."""
+        if column in self.columns(table):
+            return False
+        self.execute(f'ALTER TABLE {self.quote(table)} ADD COLUMN {self.quote(column)} {ddl}')
+        return True
+
+    def create_table(self, table):
+        """CREATE TABLE with its indexes unless it exists; table is a Table declared in the migration."""
+        table.create(self.conn, checkfirst=True)
+
+    def fts5_available(self):
+        """True if this is SQLite built with FTS5."""
+        if self.dialect != 'sqlite':
+            return False
+        return bool(self.conn.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar())
+
+    def create_index(self, name, table, columns):
+        self.execute(f'CREATE INDEX IF NOT EXISTS {self.quote(name)} ON {self.quote(table)} ({columns})')
+
+    def batched_update(self, table, assignments, where, batch_size=DEFAULT_BATCH_SIZE, **params):
+        """UPDATE table SET assignments WHERE where, batch_size rows per transaction.
+
+        where must stop matching a row once it is updated (e.g. 'x IS NULL' when setting x),
+        otherwise the loop never ends. Returns the number of rows updated.
+        """
+        table = self.quote(table)
+        total = 0
+        while True:
+            result = self.execute(
+                f'UPDATE {table} SET {assignments} WHERE id IN '
+                f'(SELECT id FROM {table} WHERE {where} ORDER BY id LIMIT :_batch_size)',
+                _batch_size=batch_size, **params
+            )
+            self.conn.commit()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                return total
+
+
+class MigrationRunner:
+    def __init__(self, db, migrations=None):
+        self.db = db
+        self.migrations = discover_migrations() if migrations is None else migrations
+
+    def _ensure_version_table(self):
+        with self.db.engine.begin() as conn:
+            conn.execute(text(
+                f'CREATE TABLE IF NOT EXISTS {VERSION_TABLE} ('
+                'version INTEGER PRIMARY KEY, name VARCHAR(100) NOT NULL, '
+                'applied_at TIMESTAMP NOT NULL, duration_ms INTEGER NOT NULL)'
+            ))
+
+    def applied_versions(self):
+        if VERSION_TABLE not in inspect(self.db.engine).get_table_names():
+            return set()
+        with self.db.engine.connect() as conn:
+            return {row[0] for row in conn.execute(text(f'SELECT version FROM {VERSION_TABLE}'))}
+
+    def _record(self, conn, migration, duration_ms):
+        conn.execute(text(
+            f'INSERT INTO {VERSION_TABLE} (version, name, applied_at, duration_ms) '
+            'VALUES (:version, :name, :applied_at, :duration_ms)'
+        ), {'version': migration.version, 'name': migration.name,
+            'applied_at': datetime.utcnow(), 'duration_ms': duration_ms})
+
+    def stamp(self):
+        """Mark every migration as applied without running it (schema created by create_all)."""
+        self._ensure_version_table()
+        with self.db.engine.begin() as conn:
+            for migration in self.pending():
+                self._record(conn, migration, 0)
+
+    def pending(self):
+        applied = self.applied_versions()
+        return [m for m in self.migrations if m.version not in applied]
+
+    def _apply(self, migration):
+        engine = self.db.engines[migration.bind]
+        with engine.connect() as conn:
+            op = Operations(conn)
+            migration.module.upgrade(op)
+            conn.commit()
+            if hasattr(migration.module, 'backfill'):
+                migration.module.backfill(op)
+                conn.commit()
+
+    def run(self, dry_run=False):
+        """Apply pending migrations in order. Returns [(migration, seconds)] (seconds is None on dry run)."""
+        pending = self.pending()
+        if dry_run:
+            return [(migration, None) for migration in pending]
+
+        self._ensure_version_table()
+        report = []
+        for migration in pending:
+            started = time.perf_counter()
+            try:
+                self._apply(migration)
+            except Exception as e:
+                log.error("migration failed", version=migration.version, name=migration.name, error=str(e))
+                raise MigrationError(f"Migration {migration.version:04d}_{migration.name} failed: {e}") from e
+            elapsed = time.perf_counter() - started
+
+            with self.db.engine.begin() as conn:
+                self._record(conn, migration, int(elapsed * 1000))
+            log.info("migration applied", version=migration.version, name=migration.name,
+                     duration_ms=int(elapsed * 1000))
+            report.append((migration, elapsed))
+        return report
+
+
+def format_report(report, dry_run=False):
+    if not report:
+        return "Database is up to date."
+    lines = []
+    for migration, elapsed in report:
+        timing = 'pending' if dry_run else f'{elapsed * 1000:8.1f} ms'
+        bind = f' [{migration.bind}]' if migration.bind else ''
+        lines.append(f"  {migration.version:04d} {migration.name:<32} {timing}  {migration.description}{bind}")
+    header = f"{len(report)} pending migration(s):" if dry_run else f"Applied {len(report)} migration(s):"
+    if not dry_run:
+        lines.append(f"  total {sum(elapsed for _, elapsed in report) * 1000:.1f} ms")
+    return '\n'.join([header] + lines)
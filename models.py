@@ -23,26 +23,9 @@ class User(UserMixin, db.Model):
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
 
-class Chef(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    name = db.Column(db.String(100), nullable=False)
-    phone = db.Column(db.String(20), nullable=False)
-    county = db.Column(db.String(50), nullable=False)
-    sub_county = db.Column(db.String(50), nullable=False)
-    town = db.Column(db.String(50), nullable=False)
-    about = db.Column(db.Text)
-    meals_offered = db.Column(db.Text)
-    photo_url = db.Column(db.String(200))
-    is_verified = db.Column(db.Boolean, default=False)
-    is_approved = db.Column(db.Boolean, default=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    rating_total = db.Column(db.Integer, default=0)
-    rating_count = db.Column(db.Integer, default=0)
-    is_featured = db.Column(db.Boolean, default=False)
-    featured_priority = db.Column(db.Integer, default=100)
-    
-    bookings = db.relationship('Booking', backref='chef', lazy=True)
+class ChefDisplay:
+    """Display helpers shared by Chef and the slotted read_models.ChefSummary"""
+    __slots__ = ()
 
     @property
     def location(self):
@@ -58,7 +41,7 @@ class Chef(db.Model):
         if not self.rating_count:
             return None
         return round(self.rating_total / self.rating_count, 1)
-    
+
     @property
     def photo_path(self):
         """Returns the correct photo path for use with url_for('static', filename=...)"""
@@ -70,7 +53,48 @@ class Chef(db.Model):
         # Handle new format without prefix
         return self.photo_url
 
+class Chef(ChefDisplay, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+    phone = db.Column(db.String(20), nullable=False)
+    county = db.Column(db.String(50), nullable=False)
+    sub_county = db.Column(db.String(50), nullable=False)
+    town = db.Column(db.String(50), nullable=False)
+    about = db.Column(db.Text)
+    meals_offered = db.Column(db.Text)
+    photo_url = db.Column(db.String(200))
+    is_verified = db.Column(db.Boolean, default=False)
+    is_approved = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    rating_total = db.Column(db.Integer, default=0)
+    rating_count = db.Column(db.Integer, default=0)
+    is_featured = db.Column(db.Boolean, default=False)
+    featured_priority = db.Column(db.Integer, default=100)
+    ranking_score = db.Column(db.Float, default=3.5)  # precomputed by chef_ranking; new chefs start at DEFAULT_PRIOR_MEAN
+    ratings_reset_at = db.Column(db.DateTime)  # booking ratings before this were wiped by an admin reset
+    deleted_at = db.Column(db.DateTime)  # soft-deleted, waiting for chef_deletion.purge_deleted_chefs()
+    
+    bookings = db.relationship('Booking', backref='chef', lazy=True)
+
+    __table_args__ = (
+        # Serves ORDER BY is_featured, featured_priority, ranking_score without a sort step
+        db.Index('ix_chef_ranking', 'is_featured', 'featured_priority', 'ranking_score'),
+        db.Index('ix_chef_user_id', 'user_id'),
+        # Keyset pages of the admin chef list (chef_search), unfiltered and by status/county
+        db.Index('ix_chef_created_at', 'created_at', 'id'),
+        db.Index('ix_chef_approved_created_at', 'is_approved', 'created_at', 'id'),
+        db.Index('ix_chef_county_created_at', 'county', 'created_at', 'id'),
+        db.Index('ix_chef_deleted_at', 'deleted_at'),
+    )
+
+
 class Event(db.Model):
+    __table_args__ = (
+        db.Index('ix_event_customer_id', 'customer_id'),
+        db.Index('ix_event_event_date', 'event_date'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     customer_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     county = db.Column(db.String(50), nullable=False)
@@ -94,9 +118,15 @@ class MenuItem(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 class Booking(db.Model):
+    __table_args__ = (
+        db.Index('ix_booking_chef_id', 'chef_id'),
+        db.Index('ix_booking_event_id', 'event_id'),
+        db.Index('ix_booking_status', 'status'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(db.Integer, db.ForeignKey('event.id'), nullable=False)
-    chef_id = db.Column(db.Integer, db.ForeignKey('chef.id'), nullable=False)
+    chef_id = db.Column(db.Integer, db.ForeignKey('chef.id', ondelete='CASCADE'), nullable=False)
     status = db.Column(db.String(20), default='pending')
     deposit_amount = db.Column(db.Float)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -108,8 +138,15 @@ class Booking(db.Model):
     payments = db.relationship('Payment', backref='booking', lazy=True)
 
 class Payment(db.Model):
+    __table_args__ = (
+        # Latest payment per booking: filter on booking_id, ORDER BY created_at DESC
+        db.Index('ix_payment_booking_id', 'booking_id', 'created_at'),
+        # M-Pesa callbacks look payments up by CheckoutRequestID
+        db.Index('ix_payment_transaction_id', 'transaction_id'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
-    booking_id = db.Column(db.Integer, db.ForeignKey('booking.id'), nullable=False)
+    booking_id = db.Column(db.Integer, db.ForeignKey('booking.id', ondelete='CASCADE'), nullable=False)
     phone_number = db.Column(db.String(20), nullable=False)
     amount = db.Column(db.Float, nullable=False)
     mpesa_receipt_number = db.Column(db.String(50))
@@ -119,6 +156,11 @@ class Payment(db.Model):
     completed_at = db.Column(db.DateTime)
 
 class OTP(db.Model):
+    __table_args__ = (
+        db.Index('ix_otp_lookup', 'email', 'is_used', 'code'),
+        db.Index('ix_otp_expires_at', 'expires_at'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(120), nullable=False)
     code = db.Column(db.String(6), nullable=False)
@@ -127,6 +169,11 @@ class OTP(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 class VerificationCode(db.Model):
+    __table_args__ = (
+        db.Index('ix_verification_code_lookup', 'identifier', 'type', 'is_used', 'code'),
+        db.Index('ix_verification_code_expires_at', 'expires_at'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     identifier = db.Column(db.String(120), nullable=False)  # email or phone
     code = db.Column(db.String(4), nullable=False)
@@ -154,6 +201,10 @@ class Ingredient(db.Model):
 
 class DishIngredient(db.Model):
     """Junction table linking dishes to their ingredients"""
+    __table_args__ = (
+        db.Index('ix_dish_ingredient_dish_id', 'dish_id'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     dish_id = db.Column(db.Integer, db.ForeignKey('dish.id'), nullable=False)
     ingredient_id = db.Column(db.Integer, db.ForeignKey('ingredient.id'), nullable=False)
@@ -182,6 +233,11 @@ class MpesaConfig(db.Model):
 
 class PasswordResetCode(db.Model):
     """Stores password reset codes"""
+    __table_args__ = (
+        db.Index('ix_password_reset_code_lookup', 'email', 'is_used', 'code'),
+        db.Index('ix_password_reset_code_expires_at', 'expires_at'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(120), nullable=False)
     code = db.Column(db.String(6), nullable=False)
@@ -191,6 +247,10 @@ class PasswordResetCode(db.Model):
 
 class Review(db.Model):
     """Stores customer reviews"""
+    __table_args__ = (
+        db.Index('ix_review_approved_created_at', 'is_approved', 'created_at'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     customer_name = db.Column(db.String(100), nullable=False)
     event_type = db.Column(db.String(100), nullable=False)
@@ -198,3 +258,42 @@ class Review(db.Model):
     review_text = db.Column(db.Text, nullable=False)
     is_approved = db.Column(db.Boolean, default=False)  # Admin approval
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class ReviewStat(db.Model):
+    """Running rating aggregates for approved reviews, one row per event type plus an overall row"""
+    id = db.Column(db.Integer, primary_key=True)
+    event_type = db.Column(db.String(100), unique=True, nullable=False)  # '*' = all event types
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_total = db.Column(db.Integer, nullable=False, default=0)
+    stars_1 = db.Column(db.Integer, nullable=False, default=0)
+    stars_2 = db.Column(db.Integer, nullable=False, default=0)
+    stars_3 = db.Column(db.Integer, nullable=False, default=0)
+    stars_4 = db.Column(db.Integer, nullable=False, default=0)
+    stars_5 = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return None
+        return round(self.rating_total / self.review_count, 2)
+
+    @property
+    def histogram(self):
+        return {str(star): getattr(self, f'stars_{star}') for star in range(1, 6)}
+
+class OutboundEmail(db.Model):
+    """Queued notification email, delivered in batches by mail_outbox.send_queued_emails()"""
+    __table_args__ = (
+        db.Index('ix_outbound_email_pending', 'sent_at', 'id'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    to_address = db.Column(db.String(120), nullable=False)
+    subject = db.Column(db.String(200), nullable=False)
+    text_body = db.Column(db.Text, nullable=False)
+    html_body = db.Column(db.Text)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.String(200))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime)  # NULL while queued
@@ -1,40 +1,27 @@
-import random
-import string
 from datetime import datetime, timedelta
-from models import db, OTP
+from code_store import get_code_store, VERIFIED, EXPIRED, LOCKED
+from app_logging import get_logger
+
+log = get_logger(__name__)
 
 def generate_otp(email):
-    code = ''.join(random.choices(string.digits, k=6))
     expires_at = datetime.utcnow() + timedelta(minutes=5)
+    code = get_code_store().issue('otp', email, length=6, ttl=timedelta(minutes=5))
     
-    existing_otp = OTP.query.filter_by(email=email, is_used=False).first()
-    if existing_otp:
-        db.session.delete(existing_otp)
-    
-    otp = OTP(email=email, code=code, expires_at=expires_at)
-    db.session.add(otp)
-    db.session.commit()
-    
-    print(f"\n{'='*50}")
-    print(f"OTP VERIFICATION CODE")
-    print(f"{'='*50}")
-    print(f"Email: {email}")
-    print(f"Code: {code}")
-    print(f"Expires: {expires_at.strftime('%Y-%m-%d %H:%M:%S')} UTC")
-    print(f"{'='*50}\n")
+    log.debug("otp generated", email=email, code=code, expires_at=expires_at)
     
     return code
 
 def verify_otp(email, code):
-    otp = OTP.query.filter_by(email=email, code=code, is_used=False).first()
+    status = get_code_store().verify('otp', email, code)
     
-    if not otp:
-        return False, "Invalid OTP code"
-    
-    if datetime.utcnow() > otp.expires_at:
+    if status == EXPIRED:
         return False, "OTP code has expired"
     
-    otp.is_used = True
-    db.session.commit()
+    if status == LOCKED:
+        return False, "Too many incorrect attempts. Please request a new code."
+    
+    if status != VERIFIED:
+        return False, "Invalid OTP code"
     
     return True, "OTP verified successfully"
@@ -1,8 +1,10 @@
-import requests
 import base64
 import os
 from datetime import datetime
 from models import db, Payment, Booking, MpesaConfig
+from app_logging import get_logger
+
+log = get_logger(__name__)
 
 def get_mpesa_config():
     """Get M-Pesa configuration from database"""
@@ -15,6 +17,8 @@ def get_mpesa_config():
     return config
 
 def get_access_token():
+    import requests
+
     config = get_mpesa_config()
     consumer_key = config.consumer_key
     consumer_secret = config.consumer_secret
@@ -29,13 +33,15 @@ def get_access_token():
             return response.json().get('access_token')
         return None
     except Exception as e:
-        print(f"Error getting access token: {e}")
+        log.error("mpesa access token request failed", error=e)
         return None
 
 def initiate_mpesa_stk(phone, amount, booking_id):
+    import requests
+
     access_token = get_access_token()
     if not access_token:
-        print("Failed to get M-PESA access token. Using simulation mode.")
+        log.warning("no mpesa access token, using simulation mode", booking_id=booking_id)
         return simulate_payment(phone, amount, booking_id)
     
     config = get_mpesa_config()
@@ -80,19 +86,11 @@ def initiate_mpesa_stk(phone, amount, booking_id):
             'message': 'Failed to initiate payment'
         }
     except Exception as e:
-        print(f"Error initiating M-PESA payment: {e}")
+        log.error("mpesa stk push failed, using simulation mode", booking_id=booking_id, error=e)
         return simulate_payment(phone, amount, booking_id)
 
 def simulate_payment(phone, amount, booking_id):
-    print(f"\n{'='*50}")
-    print(f"M-PESA SIMULATION MODE")
-    print(f"{'='*50}")
-    print(f"Booking ID: {booking_id}")
-    print(f"Phone: {phone}")
-    print(f"Amount: KES {amount}")
-    print(f"{'='*50}")
-    print("Payment simulation: Automatically marking as successful")
-    print(f"{'='*50}\n")
+    log.info("mpesa simulation: marking payment as successful", booking_id=booking_id, phone=phone, amount=amount)
     
     payment = Payment.query.filter_by(booking_id=booking_id, status='pending').first()
     if payment:
@@ -152,5 +150,5 @@ def handle_mpesa_callback(callback_data):
         
         return {'success': False, 'message': 'Payment failed'}
     except Exception as e:
-        print(f"Error handling M-PESA callback: {e}")
+        log.exception("mpesa callback handling failed")
         return {'success': False, 'message': str(e)}
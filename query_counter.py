@@ -0,0 +1,76 @@
+"""
+SQL query counting, per request and per block.
+
+init_query_counter(app) counts every statement sent through the app's
+engines while a request is active. When QUERY_COUNTER_ENABLED is set (or the
+app is in testing mode) the total is returned in an X-Query-Count header and
+logged at DEBUG, so N+1 regressions show up in tests and in the browser.
+
+count_queries() counts statements inside a with-block, for scripts and tests.
+"""
+from contextlib import contextmanager
+
+from flask import g, request, has_request_context
+from sqlalchemy import event
+
+from models import db
+from app_logging import get_logger
+
+log = get_logger(__name__)
+
+HEADER = 'X-Query-Count'
+
+_active_counters = []
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+        self.statements = []
+        self.executed = []  # (engine, statement, parameters, executemany)
+
+    def record(self, statement, engine=None, parameters=None, executemany=False):
+        self.count += 1
+        self.statements.append(statement)
+        self.executed.append((engine, statement, parameters, executemany))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    for counter in _active_counters:
+        counter.record(statement, conn.engine, parameters, executemany)
+    if has_request_context() and 'query_count' in g:
+        g.query_count += 1
+
+
+def _listen(engine):
+    if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+
+
+def init_query_counter(app):
+    with app.app_context():
+        for engine in db.engines.values():
+            _listen(engine)
+
+    @app.before_request
+    def _start_query_count():
+        g.query_count = 0
+
+    @app.after_request
+    def _report_query_count(response):
+        if app.config.get('QUERY_COUNTER_ENABLED') or app.testing:
+            count = g.get('query_count', 0)
+            response.headers[HEADER] = str(count)
+            log.debug("request queries", path=request.path, queries=count)
+        return response
+
+
+@contextmanager
+def count_queries():
+    """Count statements executed inside the block: with count_queries() as counter: ..."""
+    counter = QueryCounter()
+    _active_counters.append(counter)
+    try:
+        yield counter
+    finally:
+        _active_counters.remove(counter)
@@ -0,0 +1,236 @@
+"""
+Token-bucket rate limiting for abuse-prone endpoints (code sending, login, password reset).
+
+Buckets are keyed by client IP and by the email/phone in the request, so a
+flood is rejected before any database, SMTP or password-hash work happens.
+Behind a reverse proxy set PROXY_FIX_HOPS, otherwise request.remote_addr is
+the proxy and every client shares one IP bucket.
+Backends (RATE_LIMIT_BACKEND):
+- 'memory' : in-process buckets (single process)
+- 'shared' : shared key-value store from SHARED_STORE_URL, so all workers
+             share the same buckets
+"""
+import json
+import math
+import re
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, request, jsonify, flash, redirect
+
+from kv_store import TTLCache, get_shared_client
+
+
+class Limit:
+    """Allow `capacity` requests in a burst, refilling to full over `per` seconds."""
+
+    def __init__(self, capacity, per):
+        self.capacity = capacity
+        self.per = per
+
+    @property
+    def refill_rate(self):
+        return self.capacity / float(self.per)
+
+
+def _take_all(buckets, now, cost):
+    """Refill each (limit, tokens, updated_at) bucket up to now and take cost tokens from all of them
+    or from none. Returns (allowed, tokens per bucket, retry_after)."""
+    tokens = [min(limit.capacity, left + max(0.0, now - updated_at) * limit.refill_rate)
+              for limit, left, updated_at in buckets]
+    retry_after = max([(cost - left) / limit.refill_rate
+                       for (limit, _, _), left in zip(buckets, tokens) if left < cost], default=0.0)
+    if retry_after:
+        return False, tokens, retry_after
+    return True, [left - cost for left in tokens], 0.0
+
+
+class MemoryBucketStore:
+    """Token buckets kept in an in-process TTL map."""
+
+    def __init__(self, clock=time.monotonic):
+        self._buckets = TTLCache()
+        self._lock = threading.Lock()
+        self._clock = clock
+
+    def consume(self, key, limit, cost=1):
+        """Try to take cost tokens from the bucket. Returns (allowed, retry_after_seconds)."""
+        return self.consume_all([(key, limit)], cost)
+
+    def consume_all(self, checks, cost=1):
+        """Take cost tokens from every (key, limit) bucket, or from none if any of them is short."""
+        with self._lock:
+            now = self._clock()
+            buckets = [(limit, *self._buckets.get(key, (limit.capacity, now))) for key, limit in checks]
+            allowed, tokens, retry_after = _take_all(buckets, now, cost)
+            # An untouched bucket is full again after `per` seconds, so it can be forgotten
+            for (key, limit), left in zip(checks, tokens):
+                self._buckets.set(key, (left, now), ttl=limit.per)
+            return allowed, retry_after
+
+
+# KEYS = bucket keys; ARGV = now, cost, then capacity, rate and ttl_ms for each key
+TOKEN_BUCKET_LUA = """
+local now = tonumber(ARGV[1])
+local cost = tonumber(ARGV[2])
+local tokens = {}
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 3])
+    local rate = tonumber(ARGV[i * 3 + 1])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local left = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    left = math.min(capacity, left + math.max(0, now - ts) * rate)
+    if left < cost then
+        retry_after = math.max(retry_after, (cost - left) / rate)
+    end
+    tokens[i] = left
+end
+local allowed = 0
+if retry_after == 0 then
+    allowed = 1
+end
+for i, key in ipairs(KEYS) do
+    local left = tokens[i]
+    if allowed == 1 then
+        left = left - cost
+    end
+    redis.call('HSET', key, 'tokens', tostring(left), 'ts', tostring(now))
+    redis.call('PEXPIRE', key, tonumber(ARGV[i * 3 + 2]))
+end
+return {allowed, tostring(retry_after)}
+"""
+
+
+class SharedBucketStore:
+    """Token buckets in a shared key-value store.
+
+    Redis clients run the bucket update as a Lua script so it is atomic across
+    workers; the in-process LocalKVClient stand-in is guarded by a lock instead.
+    """
+
+    def __init__(self, client, clock=time.time):
+        self.client = client
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._script = client.register_script(TOKEN_BUCKET_LUA) if hasattr(client, 'register_script') else None
+
+    def consume(self, key, limit, cost=1):
+        return self.consume_all([(key, limit)], cost)
+
+    def consume_all(self, checks, cost=1):
+        keys = [f"ratelimit:{key}" for key, _ in checks]
+        now = self._clock()
+
+        if self._script is not None:
+            args = [now, cost]
+            for _, limit in checks:
+                args += [limit.capacity, limit.refill_rate, int(limit.per * 1000)]
+            allowed, retry_after = self._script(keys=keys, args=args)
+            return bool(int(allowed)), float(retry_after)
+
+        with self._lock:
+            buckets = []
+            for key, (_, limit) in zip(keys, checks):
+                raw = self.client.get(key)
+                buckets.append((limit, *(json.loads(raw) if raw else (limit.capacity, now))))
+            allowed, tokens, retry_after = _take_all(buckets, now, cost)
+            for key, (_, limit), left in zip(keys, checks, tokens):
+                self.client.set(key, json.dumps([left, now]), px=int(limit.per * 1000))
+            return allowed, retry_after
+
+
+def create_bucket_store(app):
+    backend = app.config.get('RATE_LIMIT_BACKEND', 'memory')
+    if backend == 'memory':
+        return MemoryBucketStore()
+    if backend == 'shared':
+        return SharedBucketStore(get_shared_client(app))
+    raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {backend}")
+
+
+def get_bucket_store(app=None):
+    """Return the app-wide bucket store, creating it on first use."""
+    if app is None:
+        app = current_app._get_current_object()
+    store = app.extensions.get('rate_limiter')
+    if store is None:
+        store = create_bucket_store(app)
+        app.extensions['rate_limiter'] = store
+    return store
+
+
+def client_ip():
+    return request.remote_addr or 'unknown'
+
+
+def _request_value(name):
+    """The named string field from the JSON or form body; anything else (e.g. a JSON list) is None."""
+    if request.is_json:
+        data = request.get_json(silent=True)
+        value = data.get(name) if isinstance(data, dict) else None
+    else:
+        value = request.form.get(name)
+    return value if isinstance(value, str) else None
+
+
+def request_email():
+    email = (_request_value('email') or '').strip().lower()
+    return email or None
+
+
+def request_phone():
+    phone = _request_value('phone')
+    if not phone:
+        return None
+    digits = re.sub(r'\D', '', phone)
+    return digits or None
+
+
+KEY_FUNCS = {
+    'ip': client_ip,
+    'email': request_email,
+    'phone': request_phone,
+}
+
+
+def _too_many_requests(retry_after):
+    retry_after = max(1, math.ceil(retry_after))
+    message = f"Too many requests. Please try again in {retry_after} seconds."
+    if request.is_json:
+        response = jsonify({'success': False, 'message': message})
+        response.status_code = 429
+    else:
+        flash(message, 'danger')
+        response = redirect(request.full_path if request.query_string else request.path)
+    response.headers['Retry-After'] = str(retry_after)
+    return response
+
+
+def rate_limited(name, methods=('POST',), **limits):
+    """Route decorator applying token buckets per key type, e.g.
+
+        @rate_limited('login', ip=Limit(30, 300), email=Limit(10, 300))
+
+    Every applicable bucket must have a token, and a rejected request takes
+    none, so a flood against one email does not use up the sender's IP
+    bucket. A request without the key (e.g. no email in the body) skips that
+    bucket.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if request.method in methods and current_app.config.get('RATE_LIMIT_ENABLED', True):
+                checks = []
+                for key_type, limit in limits.items():
+                    value = KEY_FUNCS[key_type]()
+                    if value is not None:
+                        checks.append((f"{name}:{key_type}:{value}", limit))
+                allowed, retry_after = get_bucket_store().consume_all(checks)
+                if not allowed:
+                    return _too_many_requests(retry_after)
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
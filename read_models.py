@@ -0,0 +1,60 @@
+"""
+Slim read models for chef list pages.
+
+List views (admin dashboard, manage/featured chefs, chef matching) only show
+a handful of columns, yet loading Chef entities hydrates every column
+(including the 'about' text), registers each row in the session's identity map
+and lazy-loads chef.user per row for the email. chef_summaries() selects just
+the listed columns, with the user's email joined in, into slotted ChefSummary
+objects: no identity map, no per-row __dict__, one query.
+
+    chefs = chef_summaries(Chef.query.filter_by(is_approved=True).order_by(Chef.name),
+                           about_chars=100)
+
+Summaries are read-only snapshots; load the Chef entity to change a chef.
+"""
+from sqlalchemy import func
+
+from models import Chef, ChefDisplay, User
+
+SUMMARY_FIELDS = (
+    'id', 'name', 'email', 'phone', 'county', 'sub_county', 'town', 'about', 'meals_offered', 'photo_url',
+    'is_verified', 'is_approved', 'is_featured', 'featured_priority', 'rating_total', 'rating_count',
+    'created_at',
+)
+
+
+class ChefSummary(ChefDisplay):
+    """Column-only chef row for list templates (location, average_rating, ... come from ChefDisplay)."""
+
+    __slots__ = SUMMARY_FIELDS
+
+    def __init__(self, *values):
+        for field, value in zip(SUMMARY_FIELDS, values):
+            setattr(self, field, value)
+
+    def __repr__(self):
+        return f'<ChefSummary {self.id} {self.name!r}>'
+
+
+def summary_columns(about_chars=None):
+    """Columns in SUMMARY_FIELDS order; about_chars truncates 'about' in SQL (None = full text)."""
+    about = Chef.about if about_chars is None else func.substr(Chef.about, 1, about_chars + 1)
+    return (
+        Chef.id, Chef.name, User.email, Chef.phone, Chef.county, Chef.sub_county, Chef.town,
+        about, Chef.meals_offered, Chef.photo_url, Chef.is_verified, Chef.is_approved,
+        Chef.is_featured, Chef.featured_priority, Chef.rating_total, Chef.rating_count, Chef.created_at,
+    )
+
+
+def chef_summaries(query, about_chars=None, limit=None):
+    """Run a filtered/ordered Chef query as a list of ChefSummary.
+
+    With about_chars, 'about' holds at most about_chars + 1 characters, so templates
+    can still tell whether to show an ellipsis. Pass limit here rather than on the
+    query: the user join has to come first.
+    """
+    rows = query.outerjoin(User, User.id == Chef.user_id).with_entities(*summary_columns(about_chars))
+    if limit is not None:
+        rows = rows.limit(limit)
+    return [ChefSummary(*row) for row in rows]
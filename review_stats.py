@@ -0,0 +1,135 @@
+"""
+Rating aggregates (count, mean, 1-5 star histogram) for approved reviews,
+per event type and overall, kept in the ReviewStat table.
+
+Approving or removing a review applies an atomic +1/-1 UPDATE to the two
+affected rows inside the same transaction, so the summary endpoint never
+has to scan the review table. rebuild_review_stats() recomputes everything
+with one grouped query (migration 0007, 'flask rebuild-review-stats'). Until
+the overall row exists the aggregates are rebuilt rather than incremented, so
+scripts that write reviews directly (add_sample_reviews.py) delete the rows.
+"""
+import hashlib
+import json
+
+from sqlalchemy.exc import IntegrityError
+
+from models import db, Review, ReviewStat
+from kv_store import TTLCache
+
+OVERALL = '*'
+CACHE_TTL = 60  # seconds
+
+_cache = TTLCache()
+
+
+def _ensure_rows(event_types):
+    """Create missing aggregate rows (concurrent creators are tolerated)."""
+    existing = {row.event_type for row in db.session.query(ReviewStat.event_type).filter(
+        ReviewStat.event_type.in_(event_types))}
+    for event_type in event_types:
+        if event_type in existing:
+            continue
+        try:
+            with db.session.begin_nested():
+                db.session.add(ReviewStat(event_type=event_type))
+        except IntegrityError:
+            pass  # another request created it first
+
+
+def _apply(review, delta):
+    if db.session.query(ReviewStat.id).filter(ReviewStat.event_type == OVERALL).first() is None:
+        # Aggregates never built on this database: counting from zero would be wrong for good
+        _rebuild(exclude_review_id=review.id if delta < 0 else None)
+        return
+    event_types = [OVERALL, review.event_type]
+    _ensure_rows(event_types)
+    star_column = getattr(ReviewStat, f'stars_{review.rating}')
+    ReviewStat.query.filter(ReviewStat.event_type.in_(event_types)).update({
+        ReviewStat.review_count: ReviewStat.review_count + delta,
+        ReviewStat.rating_total: ReviewStat.rating_total + delta * review.rating,
+        star_column: star_column + delta,
+    }, synchronize_session=False)
+
+
+def record_review_approved(review):
+    """Add a newly approved review to the aggregates (caller commits)."""
+    _apply(review, 1)
+
+
+def record_review_removed(review):
+    """Remove a previously approved review from the aggregates (caller commits)."""
+    _apply(review, -1)
+
+
+def _rebuild(exclude_review_id=None):
+    """Replace all aggregate rows with ones computed from approved reviews (caller commits)."""
+    star_sums = [db.func.sum(db.case((Review.rating == star, 1), else_=0)) for star in range(1, 6)]
+    query = db.session.query(
+        Review.event_type, db.func.count(Review.id), db.func.sum(Review.rating), *star_sums
+    ).filter(Review.is_approved.is_(True))
+    if exclude_review_id is not None:
+        query = query.filter(Review.id != exclude_review_id)
+    rows = query.group_by(Review.event_type).all()
+
+    overall = ReviewStat(event_type=OVERALL, review_count=0, rating_total=0,
+                         stars_1=0, stars_2=0, stars_3=0, stars_4=0, stars_5=0)
+    stats = [overall]
+    for event_type, count, total, *stars in rows:
+        stat = ReviewStat(event_type=event_type, review_count=count, rating_total=total or 0)
+        for star, value in enumerate(stars, start=1):
+            setattr(stat, f'stars_{star}', value or 0)
+            setattr(overall, f'stars_{star}', getattr(overall, f'stars_{star}') + (value or 0))
+        overall.review_count += count
+        overall.rating_total += total or 0
+        stats.append(stat)
+
+    ReviewStat.query.delete(synchronize_session=False)
+    db.session.add_all(stats)
+    return len(stats)
+
+
+def rebuild_review_stats():
+    """Recompute all aggregates from approved reviews in one grouped query. Returns rows written."""
+    written = _rebuild()
+    db.session.commit()
+    invalidate_summary_cache()
+    return written
+
+
+def _serialize(stat):
+    return {
+        'count': stat.review_count,
+        'average': stat.average_rating,
+        'histogram': stat.histogram
+    }
+
+
+def get_review_summary():
+    """Return (json_bytes, etag) with overall and per-event-type rating summaries."""
+    cached = _cache.get('summary')
+    if cached is not None:
+        return cached
+
+    stats = ReviewStat.query.order_by(ReviewStat.event_type).all()
+    if not any(stat.event_type == OVERALL for stat in stats):
+        # First use on an existing database: build the aggregates once
+        rebuild_review_stats()
+        stats = ReviewStat.query.order_by(ReviewStat.event_type).all()
+
+    overall = next(stat for stat in stats if stat.event_type == OVERALL)
+    payload = {
+        'overall': _serialize(overall),
+        'event_types': [
+            dict(event_type=stat.event_type, **_serialize(stat))
+            for stat in stats if stat.event_type != OVERALL and stat.review_count > 0
+        ]
+    }
+    body = json.dumps(payload, separators=(',', ':')).encode()
+    cached = (body, hashlib.sha1(body).hexdigest())
+    _cache.set('summary', cached, ttl=CACHE_TTL)
+    return cached
+
+
+def invalidate_summary_cache():
+    _cache.clear()
@@ -0,0 +1,87 @@
+"""
+Approved-reviews feed served by GET /api/reviews.
+
+Pages are fetched with keyset pagination on (created_at, id) over the
+(is_approved, created_at) index and serialized once with their ETag. Only
+first pages (no cursor, at most one per limit) are kept in an in-process
+cache: cursors come from clients, so caching every page would let anyone
+fill worker memory. Admin approve/reject/delete call
+invalidate_reviews_cache(); the TTL bounds staleness in other workers.
+"""
+import base64
+import hashlib
+import json
+from datetime import datetime
+
+from models import db, Review
+from kv_store import TTLCache
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+CACHE_TTL = 60  # seconds
+
+_cache = TTLCache()
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(review):
+    raw = f"{review.created_at.isoformat()}|{review.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, review_id = base64.urlsafe_b64decode(padded.encode()).decode().split('|')
+        return datetime.fromisoformat(created_at), int(review_id)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidCursor('Invalid cursor')
+
+
+def serialize_review(review):
+    return {
+        'id': review.id,
+        'customer_name': review.customer_name,
+        'event_type': review.event_type,
+        'rating': review.rating,
+        'review_text': review.review_text,
+        'created_at': review.created_at.strftime('%Y-%m-%d')
+    }
+
+
+def _load_page(cursor, limit):
+    query = Review.query.filter(Review.is_approved.is_(True))
+    if cursor:
+        created_at, review_id = decode_cursor(cursor)
+        query = query.filter(db.or_(
+            Review.created_at < created_at,
+            db.and_(Review.created_at == created_at, Review.id < review_id)
+        ))
+
+    # Fetch one extra row to know whether there is a next page
+    reviews = query.order_by(Review.created_at.desc(), Review.id.desc()).limit(limit + 1).all()
+    next_cursor = encode_cursor(reviews[limit - 1]) if len(reviews) > limit else None
+
+    body = json.dumps([serialize_review(r) for r in reviews[:limit]], separators=(',', ':')).encode()
+    etag = hashlib.sha1(body).hexdigest()
+    return body, etag, next_cursor
+
+
+def get_reviews_page(cursor=None, limit=DEFAULT_PAGE_SIZE):
+    """Return (json_bytes, etag, next_cursor) for a page of approved reviews, newest first."""
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    if cursor:
+        return _load_page(cursor, limit)
+    page = _cache.get(limit)
+    if page is None:
+        page = _load_page(None, limit)
+        _cache.set(limit, page, ttl=CACHE_TTL)
+    return page
+
+
+def invalidate_reviews_cache():
+    """Drop all cached pages; call after any change to approved reviews."""
+    _cache.clear()
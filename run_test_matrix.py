@@ -0,0 +1,80 @@
+"""
+Run the test suite against each supported database.
+
+    sqlite      in-memory SQLite (the default for plain 'pytest')
+    postgresql  TEST_POSTGRES_URL if set, otherwise a throwaway local server
+                started with pgserver (pip install pgserver psycopg2-binary);
+                skipped when neither is available
+
+Each run sets TEST_DATABASE_URL (see test_support.py) for a pytest subprocess.
+The PostgreSQL database is emptied by the tests, so use a dedicated one.
+
+Usage: python run_test_matrix.py [sqlite|postgresql ...] [-- extra pytest args]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKENDS = ('sqlite', 'postgresql')
+
+
+def postgres_url(workdir):
+    """Return (url, server) for the PostgreSQL run; (None, reason) when unavailable."""
+    if os.getenv('TEST_POSTGRES_URL'):
+        return os.environ['TEST_POSTGRES_URL'], None
+    try:
+        import psycopg2  # noqa: F401
+        import pgserver
+    except ImportError as e:
+        return None, f"set TEST_POSTGRES_URL or pip install pgserver psycopg2-binary ({e})"
+    server = pgserver.get_server(workdir, cleanup_mode='stop')
+    # Name the driver: SQLAlchemy 2.1 defaults postgresql:// to psycopg 3
+    return server.get_uri().replace('postgresql://', 'postgresql+psycopg2://', 1), server
+
+
+def run_pytest(url, pytest_args):
+    env = dict(os.environ, TEST_DATABASE_URL=url)
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, '-m', 'pytest', '-q', *pytest_args], env=env)
+    return result.returncode, time.perf_counter() - started
+
+
+def main(argv):
+    split = argv.index('--') if '--' in argv else len(argv)
+    backends, pytest_args = argv[:split] or list(BACKENDS), argv[split + 1:]
+    unknown = set(backends) - set(BACKENDS)
+    if unknown:
+        print(f"Unknown backend(s): {', '.join(sorted(unknown))}. Choose from {', '.join(BACKENDS)}")
+        return 2
+
+    results = []
+    for backend in backends:
+        print(f"\n=== {backend} ===")
+        if backend == 'sqlite':
+            returncode, elapsed = run_pytest('sqlite://', pytest_args)
+            results.append((backend, 'passed' if returncode == 0 else 'FAILED', elapsed))
+            continue
+
+        with tempfile.TemporaryDirectory(prefix='test-postgres-') as workdir:
+            url, server = postgres_url(workdir)
+            if url is None:
+                print(f"skipped: {server}")
+                results.append((backend, 'skipped', 0.0))
+                continue
+            try:
+                returncode, elapsed = run_pytest(url, pytest_args)
+            finally:
+                if server is not None:
+                    server.cleanup()
+            results.append((backend, 'passed' if returncode == 0 else 'FAILED', elapsed))
+
+    print("\nTest matrix:")
+    for backend, status, elapsed in results:
+        print(f"  {backend:<12} {status:<8} {elapsed:6.1f}s")
+    return 1 if any(status == 'FAILED' for _, status, _ in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,48 @@
+"""
+Test script for the application factory and lazy imports
+"""
+import sys
+import os
+import subprocess
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app_factory import create_app
+from blueprints import BLUEPRINTS
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_create_app_registers_blueprints():
+    app = create_app({'DATABASE_URL': 'sqlite://', 'DISH_DATABASE_URL': 'sqlite://', 'TESTING': True})
+    assert set(BLUEPRINTS) <= set(app.blueprints)
+    endpoints = {rule.endpoint: rule.rule for rule in app.url_map.iter_rules()}
+    assert endpoints['reports.export_pdf'] == '/admin/reports/export-pdf'
+    assert endpoints['customer.create_event'] == '/customer/create-event'
+
+    response = app.test_client().get('/admin/reports')
+    assert response.status_code == 302 and '/login' in response.headers['Location']
+
+
+def test_proxy_fix_trusts_forwarded_client_ip():
+    from rate_limit import client_ip
+
+    app = create_app({'DATABASE_URL': 'sqlite://', 'DISH_DATABASE_URL': 'sqlite://', 'TESTING': True,
+                      'PROXY_FIX_HOPS': 1})
+    app.add_url_rule('/client-ip', 'client_ip', client_ip)
+    response = app.test_client().get('/client-ip', headers={'X-Forwarded-For': '203.0.113.7'},
+                                     environ_base={'REMOTE_ADDR': '10.0.0.1'})
+    assert response.get_data(as_text=True) == '203.0.113.7'
+
+
+def test_heavy_modules_load_lazily():
+    probe = "import sys, main; print(','.join(m for m in ('reportlab', 'requests', 'smtplib') if m in sys.modules))"
+    env = dict(os.environ, DATABASE_URL='sqlite://', DISH_DATABASE_URL='sqlite://')
+    result = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
+
+
+if __name__ == '__main__':
+    test_create_app_registers_blueprints()
+    test_proxy_fix_trusts_forwarded_client_ip()
+    test_heavy_modules_load_lazily()
+    print("✓ App factory tests passed")
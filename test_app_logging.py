@@ -0,0 +1,40 @@
+"""
+Test script for the structured logger
+"""
+import sys
+import os
+import logging
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app_logging import get_logger
+
+
+class Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_records_point_at_the_caller():
+    log = get_logger('test_app_logging')
+    handler = Capture()
+    log.logger.addHandler(handler)
+    log.logger.setLevel(logging.DEBUG)
+    try:
+        log.info("via wrapper", booking_id=1)
+        log.log(logging.WARNING, "direct")
+    finally:
+        log.logger.removeHandler(handler)
+
+    for record in handler.records:
+        assert record.pathname == os.path.abspath(__file__) and record.funcName == 'test_records_point_at_the_caller'
+    assert handler.records[0].fields == {'booking_id': 1}
+    assert handler.records[1].lineno == handler.records[0].lineno + 1
+
+
+if __name__ == '__main__':
+    test_records_point_at_the_caller()
+    print("✓ Logging tests passed")
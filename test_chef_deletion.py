@@ -0,0 +1,117 @@
+"""
+Test script for set-based chef deletion and soft deletion with background purge
+"""
+import sys
+import os
+from datetime import datetime
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app_factory import create_app
+from models import db, User, Chef, Event, Booking, Payment
+from query_counter import count_queries
+
+
+def make_app():
+    return create_app({'DATABASE_URL': 'sqlite://', 'DISH_DATABASE_URL': 'sqlite://', 'TESTING': True,
+                       'CHEF_PURGE_MODE': 'cron'})
+
+
+def add_chef(name, bookings):
+    """A chef with bookings (each with two payments) for one customer event. Returns (chef_id, user_id)."""
+    user = User(email=f'{name.lower()}@example.com', password_hash='x', role='chef')
+    customer = User(email=f'customer.{name.lower()}@example.com', password_hash='x', role='customer')
+    db.session.add_all([user, customer])
+    db.session.flush()
+    chef = Chef(user_id=user.id, name=name, phone='1', county='Nairobi', sub_county='A', town='B',
+                meals_offered='Pilau', is_verified=True, is_approved=True)
+    event = Event(customer_id=customer.id, county='Nairobi', sub_county='A', town='B', adult_guests=10,
+                  child_guests=0, event_date=datetime(2026, 1, 1))
+    db.session.add_all([chef, event])
+    db.session.flush()
+    for _ in range(bookings):
+        booking = Booking(event_id=event.id, chef_id=chef.id, deposit_amount=300)
+        db.session.add(booking)
+        db.session.flush()
+        db.session.add_all([Payment(booking_id=booking.id, phone_number='1', amount=100) for _ in range(2)])
+    db.session.commit()
+    return chef.id, user.id
+
+
+def login(app, client, role='admin'):
+    with app.app_context():
+        user = User(email=f'{role}@example.com', password_hash='x', role=role)
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(user_id)
+        sess['_fresh'] = True
+
+
+def test_delete_is_set_based():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        small, _ = add_chef('Small', bookings=1)
+        large, _ = add_chef('Large', bookings=20)
+        kept, _ = add_chef('Kept', bookings=3)
+
+    client = app.test_client()
+    login(app, client)
+    client.get('/admin/dashboard')  # cache the admin's identity first
+
+    counts = []
+    for chef_id in (small, large):
+        with count_queries() as queries:
+            response = client.post(f'/admin/chef/{chef_id}/delete')
+        assert response.status_code == 302
+        counts.append(sum(1 for sql in queries.statements if sql.lstrip().upper().startswith('DELETE')))
+    # One DELETE per table, however many bookings and payments the chef has
+    assert counts == [4, 4]
+
+    with app.app_context():
+        assert [c.id for c in Chef.query] == [kept]
+        assert Booking.query.count() == 3 and Payment.query.count() == 6
+        assert User.query.filter(User.email.in_(['small@example.com', 'large@example.com'])).count() == 0
+        # Customers and their events are not the chef's to delete
+        assert Event.query.count() == 3
+
+
+def test_soft_delete_hides_then_purges():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        chef_id, chef_user_id = add_chef('Zawadi', bookings=2)
+
+    chef_client = app.test_client()
+    with chef_client.session_transaction() as sess:
+        sess['_user_id'] = str(chef_user_id)
+        sess['_fresh'] = True
+    assert chef_client.get('/chef/dashboard').status_code == 200
+
+    client = app.test_client()
+    login(app, client)
+    response = client.post(f'/admin/chef/{chef_id}/delete', data={'mode': 'soft'})
+    assert response.status_code == 302
+
+    # Gone from the admin lists and logged out before any purge (the first page shows the flash message)
+    client.get('/admin/manage-chefs')
+    assert 'Zawadi' not in client.get('/admin/manage-chefs').get_data(as_text=True)
+    assert client.get('/admin/manage-chefs?format=json').get_json()['chefs'] == []
+    assert chef_client.get('/chef/dashboard').status_code == 302
+    with app.app_context():
+        chef = db.session.get(Chef, chef_id)
+        assert chef.deleted_at is not None and not chef.is_approved and Booking.query.count() == 2
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=['purge-deleted-chefs'])
+    assert 'Purged 1 deleted chefs' in result.output
+    with app.app_context():
+        assert Chef.query.count() == 0 and Booking.query.count() == 0 and Payment.query.count() == 0
+        assert db.session.get(User, chef_user_id) is None
+
+
+if __name__ == '__main__':
+    test_delete_is_set_based()
+    test_soft_delete_hides_then_purges()
+    print("✓ Chef deletion tests passed")
@@ -0,0 +1,92 @@
+"""
+Test script for the precomputed chef ranking score
+"""
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models import db, User, Chef, Event, Booking
+from test_support import make_test_app, reset_database
+from chef_ranking import compute_ranking_score, get_prior_mean, DEFAULT_PRIOR_MEAN, refresh_all_rankings, ranked_order, PRIOR_WEIGHT
+from chef_ratings import claim_booking_rating, add_chef_rating, reset_chef_rating
+
+
+def test_score_shrinks_towards_mean_and_decays():
+    now = datetime.utcnow()
+    single = compute_ranking_score([(5, now)], 5, 1, 3.5, now)
+    many = compute_ranking_score([(5, now)] * 20, 100, 20, 3.5, now)
+    assert 3.5 < single < many < 5
+    assert single == round((PRIOR_WEIGHT * 3.5 + 5) / (PRIOR_WEIGHT + 1), 4)
+
+    old = compute_ranking_score([(5, now - timedelta(days=720))] * 20, 100, 20, 3.5, now)
+    assert 3.5 < old < many
+    # No ratings, or ratings wiped by an admin reset, fall back to the prior
+    assert compute_ranking_score([], 0, 0, 3.5, now) == 3.5
+    assert compute_ranking_score([(1, now)], 0, 0, 3.5, now) == 3.5
+
+
+def test_incremental_matches_batch_and_orders_chefs():
+    app = make_test_app()
+    with app.app_context():
+        reset_database()
+        customer = User(email='c@example.com', password_hash='x', role='customer')
+        db.session.add(customer)
+        db.session.flush()
+        event = Event(customer_id=customer.id, county='Nairobi', sub_county='A', town='B',
+                      adult_guests=10, child_guests=0, event_date=datetime.utcnow(), total_cost=100)
+        db.session.add(event)
+
+        chefs = []
+        for name in ('Few', 'Many', 'None', 'Low'):
+            chef_user = User(email=f'{name}@example.com', password_hash='x', role='chef')
+            db.session.add(chef_user)
+            db.session.flush()
+            chef = Chef(user_id=chef_user.id, name=name, phone='1', county='Nairobi', sub_county='A', town='B',
+                        is_verified=True, is_approved=True, is_featured=False, featured_priority=0)
+            db.session.add(chef)
+            chefs.append(chef)
+        db.session.flush()
+
+        few, many, unrated, low = chefs
+        for chef, ratings in ((few, [5]), (many, [5] * 6), (low, [1, 1])):
+            for value in ratings:
+                booking = Booking(event_id=event.id, chef_id=chef.id, deposit_amount=10, status='confirmed')
+                db.session.add(booking)
+                db.session.flush()
+                assert claim_booking_rating(booking.id, value)
+                add_chef_rating(chef.id, value)
+        db.session.commit()
+
+        incremental = {c.id: c.ranking_score for c in Chef.query}
+        # A chef nobody has rated starts at the score the ranking gives an unrated chef, not at 0
+        assert incremental[unrated.id] == compute_ranking_score([], 0, 0, DEFAULT_PRIOR_MEAN)
+        assert incremental[unrated.id] > incremental[low.id]
+        refresh_all_rankings()
+        db.session.expire_all()
+        ordered = Chef.query.order_by(*ranked_order()).all()
+        assert [c.name for c in ordered] == ['Many', 'Few', 'None', 'Low']
+        # The batch recomputes the prior mean, so only relative order must agree with the incremental scores
+        assert incremental[many.id] > incremental[few.id]
+
+        reset_chef_rating(many.id)
+        db.session.commit()
+        db.session.expire_all()
+        assert db.session.get(Chef, many.id).ranking_score == db.session.get(Chef, unrated.id).ranking_score
+
+        # A manual rating after a reset is the chef's only rating; the wiped booking ratings stay out
+        reset_chef_rating(low.id)
+        add_chef_rating(low.id, 5)
+        db.session.commit()
+        db.session.expire_all()
+        for refresh in (lambda: None, refresh_all_rankings):
+            refresh()
+            db.session.expire_all()
+            expected = round((PRIOR_WEIGHT * get_prior_mean() + 5) / (PRIOR_WEIGHT + 1), 4)
+            assert db.session.get(Chef, low.id).ranking_score == expected
+
+
+if __name__ == '__main__':
+    test_score_shrinks_towards_mean_and_decays()
+    test_incremental_matches_batch_and_orders_chefs()
+    print("✓ Chef ranking tests passed")
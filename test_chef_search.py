@@ -0,0 +1,136 @@
+"""
+Test script for the admin chef list search, filters and keyset pagination
+"""
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app_factory import create_app
+from models import db, User, Chef
+from chef_search import chef_counties, parse_filters, search_backend, search_chefs
+
+CHEFS = [
+    # name, about, county, approved, featured, rating_total, rating_count
+    ('Amina Otieno', 'Swahili coastal dishes and biryani', 'Mombasa', True, True, 10, 2),
+    ('Brian Kamau', 'Nyama choma for weddings', 'Nairobi', True, False, 6, 2),
+    ('Cynthia Wanjiru', 'Vegetarian and vegan menus', 'Nairobi', False, False, 0, 0),
+    ('Daniel Mwangi', 'Pilau and biryani specialist', 'Kiambu', True, False, 8, 2),
+    ('Esther Akinyi', 'Fish and ugali from the lake', 'Kisumu', False, False, 3, 1),
+]
+
+
+def make_app():
+    return create_app({'DATABASE_URL': 'sqlite://', 'DISH_DATABASE_URL': 'sqlite://', 'TESTING': True})
+
+
+def add_chefs():
+    started = datetime(2025, 1, 1)
+    for i, (name, about, county, approved, featured, total, count) in enumerate(CHEFS):
+        user = User(email=f'chef{i}@example.com', password_hash='x', role='chef')
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(Chef(user_id=user.id, name=name, phone='1', county=county, sub_county='A', town='B',
+                            about=about, meals_offered='Pilau', is_verified=True, is_approved=approved,
+                            is_featured=featured, rating_total=total, rating_count=count,
+                            created_at=started + timedelta(days=i // 2)))  # pairs share a created_at
+    db.session.commit()
+
+
+def names(filters, **kwargs):
+    return [chef.name for chef in search_chefs(parse_filters(filters), **kwargs)[0]]
+
+
+def test_keyset_pages_cover_every_chef_once():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        add_chefs()
+        seen, cursor = [], None
+        while True:
+            chefs, cursor = search_chefs({}, cursor, limit=2)
+            seen += [chef.name for chef in chefs]
+            if cursor is None:
+                break
+        assert seen == [name for name, *_ in reversed(CHEFS)]
+
+
+def test_filters_and_search():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        add_chefs()
+        assert search_backend() == 'fts5'
+        assert names({'q': 'biry'}) == ['Daniel Mwangi', 'Amina Otieno']
+        assert names({'q': 'pilau BIRYANI'}) == ['Daniel Mwangi']
+        assert names({'q': 'wanji'}) == ['Cynthia Wanjiru']
+        assert names({'q': '"biry*) -'}) == names({'q': 'biry'})  # search syntax is dropped, not passed to MATCH
+        assert names({'status': 'pending'}) == ['Esther Akinyi', 'Cynthia Wanjiru']
+        assert names({'county': 'Nairobi', 'status': 'approved'}) == ['Brian Kamau']
+        assert names({'featured': 'yes'}) == ['Amina Otieno']
+        assert names({'min_rating': '4'}) == ['Daniel Mwangi', 'Amina Otieno']
+        assert names({'min_rating': '3', 'max_rating': '3.5'}) == ['Esther Akinyi', 'Brian Kamau']
+        assert names({'unrated': '1'}) == ['Cynthia Wanjiru']
+
+        # A county whose only chef is soft-deleted is no longer offered as a filter
+        assert chef_counties() == ['Kiambu', 'Kisumu', 'Mombasa', 'Nairobi']
+        Chef.query.filter_by(name='Esther Akinyi').one().deleted_at = datetime.utcnow()
+        db.session.commit()
+        assert chef_counties() == ['Kiambu', 'Mombasa', 'Nairobi']
+
+        # The FTS index follows renames and deletes
+        chef = Chef.query.filter_by(name='Brian Kamau').one()
+        chef.name = 'Brian Omondi'
+        db.session.commit()
+        assert names({'q': 'kamau'}) == [] and names({'q': 'omondi'}) == ['Brian Omondi']
+        db.session.delete(chef)
+        db.session.commit()
+        assert names({'q': 'omondi'}) == []
+
+        for bad in ({'status': 'rejected'}, {'min_rating': '6'}, {'max_rating': 'x'}, {'featured': 'maybe'}):
+            try:
+                parse_filters(bad)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f'{bad} should be rejected')
+
+
+def test_manage_chefs_html_and_json():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        add_chefs()
+        admin = User(email='admin@example.com', password_hash='x', role='admin')
+        db.session.add(admin)
+        db.session.commit()
+        admin_id = admin.id
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(admin_id)
+        sess['_fresh'] = True
+
+    response = client.get('/admin/manage-chefs?format=json&limit=3&status=approved')
+    data = response.get_json()
+    assert [chef['name'] for chef in data['chefs']] == ['Daniel Mwangi', 'Brian Kamau', 'Amina Otieno']
+    assert data['next_cursor'] is None
+
+    response = client.get('/admin/manage-chefs?limit=2&county=Nairobi')
+    page = response.get_data(as_text=True)
+    assert response.status_code == 200
+    assert 'Cynthia Wanjiru' in page and 'Brian Kamau' in page and 'Amina Otieno' not in page
+    assert '>5</h3>' in page  # stats count every chef, not the page
+
+    response = client.get('/admin/manage-chefs', query_string={'limit': 2})
+    assert 'cursor=' in response.get_data(as_text=True)
+
+    assert client.get('/admin/manage-chefs?format=json&cursor=nope').status_code == 400
+    assert client.get('/admin/manage-chefs?status=nope').status_code == 302
+
+
+if __name__ == '__main__':
+    test_keyset_pages_cover_every_chef_once()
+    test_filters_and_search()
+    test_manage_chefs_html_and_json()
+    print("✓ Chef search tests passed")
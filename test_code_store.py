@@ -0,0 +1,154 @@
+"""
+Test script for the ephemeral verification code store (memory, shared and database backends)
+"""
+import sys
+import os
+from datetime import datetime, timedelta
+from unittest import mock
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app_factory import load_config
+from flask import Flask
+from kv_store import LocalKVClient
+from test_support import make_test_app, reset_database
+from models import db, VerificationCode, OTP, PasswordResetCode
+from verification import generate_verification_code, verify_code
+from code_store import get_code_store, purge_expired_codes, CodeStore, CodeRateLimitError, DatabaseCodeStore, KVCodeStore, VERIFIED, INVALID, EXPIRED, LOCKED
+
+
+def make_app(backend):
+    app = make_test_app(CODE_STORE_BACKEND=backend, SHARED_STORE_URL='local://',
+                        CODE_MAX_ATTEMPTS=3, CODE_MAX_ISSUES=2)
+    with app.app_context():
+        reset_database()
+    return app
+
+
+def check_backend(backend):
+    app = make_app(backend)
+    with app.app_context():
+        store = get_code_store()
+
+        code = store.issue('email', 'chef@example.com', length=4, ttl=timedelta(minutes=10))
+        assert len(code) == 4
+        wrong = '0000' if code != '0000' else '1111'
+        assert store.verify('email', 'chef@example.com', wrong) == INVALID
+        assert store.verify('sms', 'chef@example.com', code) == INVALID
+        assert store.verify('email', 'chef@example.com', code) == VERIFIED
+        # Codes are single use
+        assert store.verify('email', 'chef@example.com', code) == INVALID
+
+        code = store.issue('otp', 'late@example.com', length=6, ttl=timedelta(seconds=-1))
+        assert store.verify('otp', 'late@example.com', code) == EXPIRED
+
+        # Too many wrong attempts locks the identifier until a new code is issued
+        code = store.issue('password_reset', 'guess@example.com', length=6, ttl=timedelta(minutes=5))
+        wrong = '000000' if code != '000000' else '111111'
+        for _ in range(3):
+            assert store.verify('password_reset', 'guess@example.com', wrong) == INVALID
+        assert store.verify('password_reset', 'guess@example.com', code) == LOCKED
+
+        # A new code clears the lock
+        code = store.issue('password_reset', 'guess@example.com', length=6, ttl=timedelta(minutes=5))
+        assert store.verify('password_reset', 'guess@example.com', code) == VERIFIED
+
+        # Only CODE_MAX_ISSUES codes per window
+        try:
+            store.issue('password_reset', 'guess@example.com', length=6, ttl=timedelta(minutes=5))
+        except CodeRateLimitError as e:
+            assert e.retry_after > 0
+        else:
+            raise AssertionError('expected CodeRateLimitError')
+
+
+def test_memory_backend():
+    check_backend('memory')
+
+
+def test_shared_backend():
+    check_backend('shared')
+
+
+def test_database_backend():
+    check_backend('database')
+
+
+def test_verify_code_is_single_use():
+    app = make_app('database')
+    with app.app_context():
+        code = generate_verification_code('once@example.com', 'email')
+        assert verify_code('once@example.com', code, 'email') == (True, "Code verified successfully")
+        assert verify_code('once@example.com', code, 'email') == (False, "Invalid verification code")
+        assert VerificationCode.query.filter_by(identifier='once@example.com', is_used=True).count() == 1
+
+
+def test_purge_deletes_only_expired_or_used_codes():
+    app = make_app('database')
+    with app.app_context():
+        now = datetime.utcnow()
+        future, past = now + timedelta(minutes=10), now - timedelta(minutes=1)
+        db.session.add_all([
+            VerificationCode(identifier='live@example.com', code='1111', type='email', expires_at=future),
+            VerificationCode(identifier='used@example.com', code='2222', type='email', expires_at=future, is_used=True),
+            VerificationCode(identifier='old@example.com', code='3333', type='sms', expires_at=past),
+            OTP(email='live@example.com', code='444444', expires_at=future),
+            OTP(email='old@example.com', code='555555', expires_at=past),
+            PasswordResetCode(email='live@example.com', code='666666', expires_at=future),
+            PasswordResetCode(email='used@example.com', code='777777', expires_at=future, is_used=True),
+        ])
+        db.session.commit()
+
+        assert purge_expired_codes() == 4
+        for model, column in ((VerificationCode, 'identifier'), (OTP, 'email'), (PasswordResetCode, 'email')):
+            assert [getattr(row, column) for row in model.query] == ['live@example.com']
+        assert purge_expired_codes() == 0
+
+
+def test_default_backend_is_shared_across_workers():
+    for env, expected in (({}, 'database'), ({'SHARED_STORE_URL': 'redis://cache:6379/0'}, 'shared')):
+        environ = {k: v for k, v in os.environ.items() if k not in ('SHARED_STORE_URL', 'CODE_STORE_BACKEND')}
+        with mock.patch.dict(os.environ, dict(environ, **env), clear=True):
+            app = Flask(__name__)
+            load_config(app)
+        assert app.config['CODE_STORE_BACKEND'] == expected
+
+    with make_test_app().app_context():
+        assert isinstance(get_code_store(), DatabaseCodeStore)
+    with make_test_app(CODE_STORE_BACKEND='memory').app_context():
+        assert isinstance(get_code_store(), KVCodeStore)
+
+
+def test_local_client_pexpire():
+    client = LocalKVClient()
+    assert client.pexpire('missing', 1000) is False
+    client.set('key', 'value')
+    assert client.pttl('key') == -1
+    assert client.pexpire('key', 60000) is True
+    assert client.get('key') == 'value' and 0 < client.pttl('key') <= 60000
+
+
+def test_incomplete_backend_fails_when_built():
+    class NoDiscard(CodeStore):
+        def _save(self, purpose, identifier, code, ttl):
+            pass
+
+        def _check(self, purpose, identifier, code):
+            return INVALID
+
+    try:
+        NoDiscard(LocalKVClient())
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('a backend without _discard() was built')
+
+
+if __name__ == '__main__':
+    for backend in ('memory', 'shared', 'database'):
+        check_backend(backend)
+        print(f"✓ {backend} backend")
+    test_verify_code_is_single_use()
+    test_purge_deletes_only_expired_or_used_codes()
+    test_default_backend_is_shared_across_workers()
+    test_local_client_pexpire()
+    test_incomplete_backend_fails_when_built()
@@ -0,0 +1,111 @@
+"""
+Test script for ranked, typo-tolerant custom dish search kept in sync by the FTS5 triggers
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app_factory import create_app
+from models import db, User
+from custom_dish_models import CustomDish, CustomIngredient
+from dish_search import correction_candidates, fts_enabled, match_groups, search_custom_dishes
+
+
+def make_app():
+    return create_app({'DATABASE_URL': 'sqlite://', 'DISH_DATABASE_URL': 'sqlite://', 'TESTING': True})
+
+
+def login(app, client, role):
+    with app.app_context():
+        user = User(email=f'{role}@example.com', password_hash='x', role=role)
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(user_id)
+        sess['_fresh'] = True
+
+
+def add_dish(client, name, description, ingredients):
+    return client.post('/admin/custom-dish-database', data={
+        'name': name, 'base_servings': '10', 'markup': '20', 'description': description,
+        'ingredient_name[]': [i[0] for i in ingredients], 'unit[]': ['kg'] * len(ingredients),
+        'unit_price[]': [str(i[1]) for i in ingredients], 'quantity[]': ['1'] * len(ingredients),
+    })
+
+
+def names(query, limit=10):
+    return [dish.name for dish in search_custom_dishes(query, limit)]
+
+
+def test_match_groups():
+    vocabulary = ['beef', 'chicken', 'pilau', 'rice']
+    assert match_groups(['pil'], vocabulary) == ['"pil"*']
+    assert match_groups(['chiken'], vocabulary) == ['("chiken"* OR "chicken")']
+    # Short words are never treated as typos
+    assert match_groups(['ric', 'bef'], vocabulary) == ['"ric"*', '("bef"* OR "beef")']
+    # Typos are only compared with terms that share the first letter and have a similar length
+    assert correction_candidates('chiken', ['beef', 'carrot', 'chicken', 'chickenpeas', 'cod', 'rice']) == [
+        'carrot', 'chicken']
+
+
+def test_ranked_typo_tolerant_search_stays_in_sync():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        assert fts_enabled()
+
+    admin = app.test_client()
+    login(app, admin, 'admin')
+    add_dish(admin, 'Chicken Pilau', 'Spiced rice', [('Chicken', 400), ('Rice', 150)])
+    add_dish(admin, 'Beef Stew', 'Slow cooked, serve with chicken broth', [('Beef', 600), ('Onion', 80)])
+    add_dish(admin, 'Vegetable Pilau', 'Rice with carrots', [('Rice', 150), ('Carrot', 60)])
+
+    with app.app_context():
+        # The name outranks a mention in the description
+        assert names('chicken') == ['Chicken Pilau', 'Beef Stew']
+        assert names('chiken pilau') == ['Chicken Pilau']
+        # Ingredients are searchable; prefixes match
+        assert names('carrot') == ['Vegetable Pilau']
+        assert set(names('pil')) == {'Chicken Pilau', 'Vegetable Pilau'}
+        # A dish must match every word; dishes matching any word are only suggestions
+        assert names('beef carrot') == []
+        assert set(dish.name for dish in search_custom_dishes('beef carrot', match_all=False)) == {
+            'Beef Stew', 'Vegetable Pilau'}
+        assert names('') == [] and names('sushi') == []
+
+        # Renaming a shared ingredient reindexes every dish using it
+        rice = CustomIngredient.query.filter_by(name='Rice').one()
+        rice.name = 'Basmati'
+        db.session.commit()
+        assert set(names('basmati')) == {'Chicken Pilau', 'Vegetable Pilau'}
+        dish_id = CustomDish.query.filter_by(name='Chicken Pilau').one().id
+
+    admin.post(f'/admin/delete-custom-dish/{dish_id}')
+    with app.app_context():
+        assert names('chicken') == ['Beef Stew']
+
+    customer = app.test_client()
+    login(app, customer, 'customer')
+    data = customer.post('/api/check-custom-dish', data={'dish_name': 'vegatable'}).get_json()
+    assert data['found'] and data['dish']['name'] == 'Vegetable Pilau'
+    assert [i['name'] for i in data['dish']['ingredients']] == ['Basmati', 'Carrot']
+    assert data['dish']['total_base_cost'] == 210.0
+
+    data = customer.post('/api/check-custom-dish', data={'dish_name': 'pilau'}).get_json()
+    assert data['dish']['name'] == 'Vegetable Pilau' and data['suggestions'] == []
+    assert customer.post('/api/check-custom-dish', data={'dish_name': 'sushi'}).get_json()['found'] is False
+
+    # Sharing one word with a dish is not finding it; it is offered as a suggestion instead
+    data = customer.post('/api/check-custom-dish', data={'dish_name': 'onion soup'}).get_json()
+    assert data['found'] is False and 'dish' not in data
+    assert [m['name'] for m in data['suggestions']] == ['Beef Stew']
+    # A dish that only lists the word as an ingredient is a suggestion too
+    data = customer.post('/api/check-custom-dish', data={'dish_name': 'carrot'}).get_json()
+    assert data['found'] is False and [m['name'] for m in data['suggestions']] == ['Vegetable Pilau']
+
+
+if __name__ == '__main__':
+    test_match_groups()
+    test_ranked_typo_tolerant_search_stays_in_sync()
+    print("✓ Custom dish search tests passed")
@@ -0,0 +1,93 @@
+"""
+Test script for the customer and chef dashboard query budgets
+"""
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Run against the test database (in-memory by default), never instance/erugah.db
+from test_support import TEST_DATABASE_URL, reset_database
+os.environ['DATABASE_URL'] = TEST_DATABASE_URL
+os.environ['DISH_DATABASE_URL'] = TEST_DATABASE_URL
+
+from main import app
+from models import db, User, Chef, Event, Booking, Payment
+
+QUERY_BUDGET = 5  # user, events, bookings + chefs, payments, spare
+CHEF_QUERY_BUDGET = 8  # user, chef, then count + rows + payments for each of the two pages
+
+app.config['TESTING'] = True
+with app.app_context():
+    reset_database()
+
+
+def add_customer_with_events(email, event_count):
+    customer = User(email=email, password_hash='x', role='customer')
+    chef_user = User(email=f'chef-{email}', password_hash='x', role='chef')
+    db.session.add_all([customer, chef_user])
+    db.session.flush()
+    chef = Chef(user_id=chef_user.id, name='Chef', phone='1', county='Nairobi', sub_county='A', town='B',
+                meals_offered='Pilau,Chapati', is_verified=True, is_approved=True)
+    db.session.add(chef)
+    db.session.flush()
+
+    for i in range(event_count):
+        past = i % 2 == 0
+        event = Event(customer_id=customer.id, county='Nairobi', sub_county='A', town='B',
+                      adult_guests=10, child_guests=0, total_cost=1000,
+                      event_date=datetime.utcnow() + timedelta(days=-10 if past else 10))
+        db.session.add(event)
+        db.session.flush()
+        booking = Booking(event_id=event.id, chef_id=chef.id, deposit_amount=300, status='confirmed',
+                          rating_value=5 if i % 4 == 0 else None,
+                          rating_submitted_at=datetime.utcnow() if i % 4 == 0 else None)
+        db.session.add(booking)
+        db.session.flush()
+        db.session.add(Payment(booking_id=booking.id, phone_number='254700000000', amount=300, status='completed'))
+    db.session.commit()
+    return customer.id, chef_user.id
+
+
+def dashboard_query_count(user_id, path='/customer/dashboard'):
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(user_id)
+        sess['_fresh'] = True
+    response = client.get(path)
+    assert response.status_code == 200
+    return int(response.headers['X-Query-Count']), response.get_data(as_text=True)
+
+
+def test_dashboard_query_count_is_constant():
+    with app.app_context():
+        small, _ = add_customer_with_events('small@example.com', 2)
+        large, _ = add_customer_with_events('large@example.com', 20)
+
+    small_count, _ = dashboard_query_count(small)
+    large_count, html = dashboard_query_count(large)
+    assert large_count <= QUERY_BUDGET, f"dashboard ran {large_count} queries (budget {QUERY_BUDGET})"
+    assert large_count == small_count
+    assert 'Chef' in html
+
+
+def test_chef_dashboard_is_paginated_and_split():
+    with app.app_context():
+        _, small = add_customer_with_events('busy-small@example.com', 2)
+        _, large = add_customer_with_events('busy-large@example.com', 50)
+
+    small_count, _ = dashboard_query_count(small, '/chef/dashboard')
+    large_count, html = dashboard_query_count(large, '/chef/dashboard')
+    assert large_count <= CHEF_QUERY_BUDGET, f"chef dashboard ran {large_count} queries (budget {CHEF_QUERY_BUDGET})"
+    assert large_count == small_count
+    assert 'Upcoming Bookings' in html and 'Past Bookings' in html
+    assert 'past_page=2' in html and 'upcoming_page=2' in html
+
+    _, page_two = dashboard_query_count(large, '/chef/dashboard?past_page=2')
+    assert 'Page 2 of 2' in page_two
+
+
+if __name__ == '__main__':
+    test_dashboard_query_count_is_constant()
+    test_chef_dashboard_is_paginated_and_split()
+    print("✓ Dashboard query budget tests passed")
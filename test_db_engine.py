@@ -0,0 +1,47 @@
+"""
+Test script for the SQLite connection pragmas
+"""
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+
+from db_engine import DEFAULT_PRAGMAS, sqlite_pragmas, tune_engine, database_url, engine_options
+
+
+def test_file_database_is_tuned():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_engine(f"sqlite:///{os.path.join(workdir, 'tuned.db')}")
+        assert tune_engine(engine, DEFAULT_PRAGMAS)
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql('PRAGMA journal_mode').scalar() == 'wal'
+            assert conn.exec_driver_sql('PRAGMA synchronous').scalar() == 1  # NORMAL
+            assert conn.exec_driver_sql('PRAGMA busy_timeout').scalar() == DEFAULT_PRAGMAS['busy_timeout']
+            assert conn.exec_driver_sql('PRAGMA cache_size').scalar() == DEFAULT_PRAGMAS['cache_size']
+        engine.dispose()
+
+
+def test_memory_database_and_config_overrides():
+    assert not tune_engine(create_engine('sqlite://'), DEFAULT_PRAGMAS)
+    pragmas = sqlite_pragmas({'SQLITE_SYNCHRONOUS': 'FULL', 'SQLITE_BUSY_TIMEOUT': 100})
+    assert pragmas['synchronous'] == 'FULL' and pragmas['busy_timeout'] == 100
+    assert pragmas['journal_mode'] == 'WAL'
+
+
+def test_pool_options_per_url():
+    config = {'DB_POOL_SIZE': 3, 'DB_MAX_OVERFLOW': 4, 'DB_POOL_TIMEOUT': 5, 'DB_POOL_RECYCLE': 60, 'DB_POOL_PRE_PING': True}
+    assert database_url('postgres://u:p@db/erugah') == 'postgresql://u:p@db/erugah'
+    options = engine_options('postgresql://u:p@db/erugah', config)
+    assert options['pool_size'] == 3 and options['max_overflow'] == 4 and options['pool_recycle'] == 60
+    # In-memory SQLite uses a single static connection, which takes no pool settings
+    assert engine_options('sqlite://', config) == {'url': 'sqlite://'}
+    assert engine_options('sqlite:///erugah.db', config)['pool_size'] == 3
+
+
+if __name__ == '__main__':
+    test_file_database_is_tuned()
+    test_memory_database_and_config_overrides()
+    test_pool_options_per_url()
+    print("✓ SQLite tuning tests passed")
@@ -0,0 +1,115 @@
+"""
+Test script for the {% cache %} template fragment cache
+"""
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from flask import render_template_string
+
+from app_factory import create_app
+from fragment_cache import invalidate_fragments
+from models import db, User, Chef, Event, Booking
+from query_counter import count_queries
+
+TEMPLATE = "<p>{% cache 'box', 60, who %}{{ render(who) }}{% endcache %}</p>"
+
+
+def make_app(**config):
+    return create_app({'DATABASE_URL': 'sqlite://', 'DISH_DATABASE_URL': 'sqlite://', 'TESTING': True, **config})
+
+
+def test_cache_tag_reuses_fragments_until_invalidated():
+    for backend in ('memory', 'shared', 'none'):
+        app = make_app(FRAGMENT_CACHE_BACKEND=backend)
+        renders = []
+
+        def render(who):
+            renders.append(who)
+            return f'<b>{who}</b>'
+
+        with app.test_request_context():
+            first = render_template_string(TEMPLATE, render=render, who='ann')
+            assert first == '<p>&lt;b&gt;ann&lt;/b&gt;</p>'
+            assert render_template_string(TEMPLATE, render=render, who='ann') == first
+            render_template_string(TEMPLATE, render=render, who='bob')
+            invalidate_fragments('box')
+            render_template_string(TEMPLATE, render=render, who='ann')
+
+        expected = ['ann', 'ann', 'bob', 'ann'] if backend == 'none' else ['ann', 'bob', 'ann']
+        assert renders == expected, (backend, renders)
+
+
+def add_chef(name, email):
+    user = User(email=email, password_hash='x', role='chef')
+    db.session.add(user)
+    db.session.flush()
+    chef = Chef(user_id=user.id, name=name, phone='1', county='Nairobi', sub_county='A', town='B',
+                is_verified=True, is_approved=True)
+    db.session.add(chef)
+    db.session.commit()
+    return chef.id
+
+
+def test_home_page_chef_carousel_is_cached():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        add_chef('Chef Amina', 'amina@example.com')
+        admin = User(email='admin@example.com', password_hash='x', role='admin')
+        db.session.add(admin)
+        db.session.commit()
+        admin_id = admin.id
+
+    client = app.test_client()
+    assert 'Chef Amina' in client.get('/').get_data(as_text=True)
+    with count_queries() as counter:
+        html = client.get('/').get_data(as_text=True)
+    assert 'Chef Amina' in html
+    assert not any('FROM chef' in statement for statement in counter.statements)
+
+    # A new chef shows up once an admin change invalidates the carousel
+    with app.app_context():
+        chef_id = add_chef('Chef Baraka', 'baraka@example.com')
+    assert 'Chef Baraka' not in client.get('/').get_data(as_text=True)
+
+    admin_client = app.test_client()
+    with admin_client.session_transaction() as sess:
+        sess['_user_id'] = str(admin_id)
+        sess['_fresh'] = True
+    assert admin_client.post(f'/admin/chefs/{chef_id}/toggle-featured').status_code == 302
+    assert 'Chef Baraka' in client.get('/').get_data(as_text=True)
+
+
+def test_customer_rating_refreshes_carousel():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        chef_id = add_chef('Chef Amina', 'amina@example.com')
+        customer = User(email='customer@example.com', password_hash='x', role='customer')
+        db.session.add(customer)
+        db.session.flush()
+        event = Event(customer_id=customer.id, county='Nairobi', sub_county='A', town='B', adult_guests=10,
+                      child_guests=0, event_date=datetime.utcnow() - timedelta(days=1), total_cost=100)
+        db.session.add(event)
+        db.session.flush()
+        booking = Booking(event_id=event.id, chef_id=chef_id, deposit_amount=10, status='confirmed')
+        db.session.add(booking)
+        db.session.commit()
+        customer_id, booking_id = customer.id, booking.id
+
+    client = app.test_client()
+    assert '(1 reviews)' not in client.get('/').get_data(as_text=True)
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(customer_id)
+        sess['_fresh'] = True
+    assert client.post(f'/booking/{booking_id}/rate', json={'rating': 4}).get_json()['success']
+    assert '4.0 (1 reviews)' in app.test_client().get('/').get_data(as_text=True)
+
+
+if __name__ == '__main__':
+    test_cache_tag_reuses_fragments_until_invalidated()
+    test_home_page_chef_carousel_is_cached()
+    test_customer_rating_refreshes_carousel()
+    print("✓ Fragment cache tests passed")
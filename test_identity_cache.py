@@ -0,0 +1,85 @@
+"""
+Test script for the cached Flask-Login identity (identity.py)
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app_factory import create_app
+from identity import Principal, invalidate_identity, load_principal
+from models import db, User, Chef
+
+
+def make_app(**config):
+    return create_app({'DATABASE_URL': 'sqlite://', 'DISH_DATABASE_URL': 'sqlite://', 'TESTING': True, **config})
+
+
+def add_chef_user(email):
+    user = User(email=email, password_hash='x', role='chef')
+    db.session.add(user)
+    db.session.flush()
+    chef = Chef(user_id=user.id, name='Chef Zawadi', phone='1', county='Nairobi', sub_county='A', town='B',
+                meals_offered='Pilau', is_verified=True, is_approved=True)
+    db.session.add(chef)
+    db.session.commit()
+    return user.id, chef.id
+
+
+def logged_in_client(app, user_id):
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(user_id)
+        sess['_fresh'] = True
+    return client
+
+
+def test_identity_is_served_from_cache_until_invalidated():
+    for backend in ('memory', 'shared'):
+        app = make_app(IDENTITY_CACHE_BACKEND=backend)
+        with app.app_context():
+            db.create_all()
+            user_id, chef_id = add_chef_user('zawadi@example.com')
+
+        client = logged_in_client(app, user_id)
+        first = client.get('/chef/dashboard')
+        second = client.get('/chef/dashboard')
+        assert first.status_code == second.status_code == 200
+        # One query fewer: the user (joined to their chef id) came from the cache
+        assert int(second.headers['X-Query-Count']) == int(first.headers['X-Query-Count']) - 1
+
+        with app.test_request_context():
+            principal = load_principal(user_id)
+            assert isinstance(principal, Principal)
+            assert (principal.role, principal.chef_id, principal.email) == ('chef', chef_id, 'zawadi@example.com')
+
+            # A role change is only seen once the identity is invalidated
+            db.session.get(User, user_id).role = 'customer'
+            db.session.commit()
+            assert load_principal(user_id).role == 'chef'
+            invalidate_identity(user_id)
+            assert load_principal(user_id).role == 'customer'
+        assert client.get('/chef/dashboard').status_code == 302
+
+
+def test_deleted_chef_is_logged_out():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        user_id, chef_id = add_chef_user('amani@example.com')
+        admin = User(email='admin@example.com', password_hash='x', role='admin')
+        db.session.add(admin)
+        db.session.commit()
+        admin_id = admin.id
+
+    chef_client = logged_in_client(app, user_id)
+    assert chef_client.get('/chef/dashboard').status_code == 200
+    admin_client = logged_in_client(app, admin_id)
+    assert admin_client.post(f'/admin/chef/{chef_id}/delete').status_code == 302
+    response = chef_client.get('/chef/dashboard')
+    assert response.status_code == 302 and '/login' in response.headers['Location']
+
+
+if __name__ == '__main__':
+    test_identity_is_served_from_cache_until_invalidated()
+    test_deleted_chef_is_logged_out()
+    print("✓ Identity cache tests passed")
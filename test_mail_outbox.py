@@ -0,0 +1,140 @@
+"""
+Test script for bulk chef moderation and the batched notification email outbox
+"""
+import sys
+import os
+import smtplib
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app_factory import create_app
+from models import db, User, Chef, OutboundEmail, SystemConfig
+from mail_outbox import enqueue_emails, send_queued_emails
+from query_counter import count_queries
+from chef_ranking import get_prior_mean
+
+
+class FakeSMTP:
+    """Records messages; refuses addresses starting with 'bad' and can drop the connection once."""
+    def __init__(self, drop_after=None):
+        self.sent = []
+        self.drop_after = drop_after
+
+    def send_message(self, msg):
+        if self.drop_after is not None and len(self.sent) == self.drop_after:
+            self.drop_after = None
+            raise smtplib.SMTPServerDisconnected('dropped')
+        if msg['To'].startswith('bad'):
+            raise smtplib.SMTPRecipientsRefused({msg['To']: (550, b'No such user')})
+        self.sent.append(msg['To'])
+
+    def quit(self):
+        pass
+
+
+def make_app():
+    return create_app({'DATABASE_URL': 'sqlite://', 'DISH_DATABASE_URL': 'sqlite://', 'TESTING': True,
+                       'MAIL_DELIVERY': 'cron'})
+
+
+def configure_email():
+    db.session.add(SystemConfig(key='gmail_user', value='noreply@example.com'))
+    db.session.add(SystemConfig(key='gmail_password', value='secret'))
+    db.session.commit()
+
+
+def queue(*addresses):
+    enqueue_emails([{'to_address': address, 'subject': 'Hi', 'text_body': 'Hello', 'html_body': '<p>Hello</p>'}
+                    for address in addresses])
+    db.session.commit()
+
+
+def test_batches_share_one_connection():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        configure_email()
+        queue('a@example.com', 'bad@example.com', 'b@example.com', 'c@example.com', 'd@example.com')
+
+        servers = []
+
+        def connect(settings):
+            servers.append(FakeSMTP(drop_after=2 if not servers else None))
+            return servers[-1]
+
+        assert send_queued_emails(batch_size=2, connect=connect) == (4, 1)
+        # One connection for all batches, plus one reconnect after the drop
+        assert len(servers) == 2
+        assert servers[0].sent + servers[1].sent == ['a@example.com', 'b@example.com', 'c@example.com', 'd@example.com']
+
+        refused = OutboundEmail.query.filter_by(to_address='bad@example.com').one()
+        assert refused.sent_at is None and refused.attempts == 1 and '550' in refused.last_error
+        assert OutboundEmail.query.filter(OutboundEmail.sent_at.is_(None)).count() == 1
+
+        # Sent messages are not sent again; the refused one is retried
+        assert send_queued_emails(connect=connect) == (0, 1)
+
+
+def test_unconfigured_email_stays_queued():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        queue('a@example.com')
+        assert send_queued_emails(connect=lambda settings: FakeSMTP()) == (0, 0)
+        assert OutboundEmail.query.filter(OutboundEmail.sent_at.is_(None)).count() == 1
+
+
+def test_bulk_actions_are_single_updates():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        admin = User(email='admin@example.com', password_hash='x', role='admin')
+        db.session.add(admin)
+        chef_ids = []
+        for i in range(4):
+            user = User(email=f'chef{i}@example.com', password_hash='x', role='chef')
+            db.session.add(user)
+            db.session.flush()
+            chef = Chef(user_id=user.id, name=f'Chef {i}', phone='1', county='Nairobi', sub_county='A', town='B',
+                        meals_offered='Pilau', is_verified=True, is_approved=(i == 0))
+            db.session.add(chef)
+            db.session.flush()
+            chef_ids.append(chef.id)
+        db.session.commit()
+        admin_id = admin.id
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(admin_id)
+        sess['_fresh'] = True
+    client.get('/admin/dashboard')  # cache the admin's identity first
+
+    with count_queries() as queries:
+        response = client.post('/admin/chefs/bulk', data={'action': 'approve', 'chef_ids': chef_ids[:3]})
+    assert response.status_code == 302
+    updates = [sql for sql in queries.statements if sql.lstrip().upper().startswith('UPDATE')]
+    assert len(updates) == 2  # the approval and one batched ranking refresh
+
+    with app.app_context():
+        assert Chef.query.filter_by(is_approved=True).count() == 3
+        # Newly approved chefs are ranked straight away, unrated ones at the prior mean
+        assert [db.session.get(Chef, chef_id).ranking_score for chef_id in chef_ids[1:3]] == [get_prior_mean()] * 2
+        # Only the two chefs that were not approved yet get an email
+        assert sorted(e.to_address for e in OutboundEmail.query) == ['chef1@example.com', 'chef2@example.com']
+
+    client.post('/admin/chefs/bulk', data={'action': 'feature', 'chef_ids': chef_ids[1:]})
+    client.post('/admin/chefs/bulk', data={'action': 'unfeature', 'chef_ids': [chef_ids[3]]})
+    client.post('/admin/chefs/bulk', data={'action': 'reject', 'chef_ids': [chef_ids[0]]})
+    with app.app_context():
+        assert sorted(c.id for c in Chef.query.filter_by(is_featured=True)) == chef_ids[1:3]
+        assert sorted(c.id for c in Chef.query.filter_by(is_approved=True)) == chef_ids[1:3]
+        assert OutboundEmail.query.count() == 2
+
+    response = client.post('/admin/chefs/bulk', data={'action': 'delete', 'chef_ids': chef_ids})
+    assert response.status_code == 302
+
+
+if __name__ == '__main__':
+    test_batches_share_one_connection()
+    test_unconfigured_email_stays_queued()
+    test_bulk_actions_are_single_updates()
+    print("✓ Mail outbox tests passed")
@@ -0,0 +1,46 @@
+"""
+Smoke test for check_query_plans.py on an in-memory app
+"""
+import sys
+import os
+from datetime import datetime
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app_factory import create_app
+from models import db, User, Chef, Event, Booking
+from check_query_plans import check_app, migrate_copy
+
+
+def test_checks_a_database_that_was_never_migrated():
+    app = create_app({'DATABASE_URL': 'sqlite://', 'DISH_DATABASE_URL': 'sqlite://', 'TESTING': True})
+    with app.app_context():
+        db.create_all()
+        # A database from before the ranking score existed
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql('DROP INDEX ix_chef_ranking')
+            conn.exec_driver_sql('ALTER TABLE chef DROP COLUMN ranking_score')
+            for role in ('admin', 'chef', 'customer'):
+                conn.exec_driver_sql(
+                    f"""INSERT INTO "user" (email, password_hash, role) VALUES ('{role}@example.com', 'x', '{role}')""")
+            conn.exec_driver_sql(
+                "INSERT INTO chef (user_id, name, phone, county, sub_county, town, meals_offered, is_approved) "
+                "VALUES (2, 'Chef', '1', 'Nairobi', 'A', 'B', 'Pilau', 1)")
+        customer = User.query.filter_by(role='customer').one()
+        event = Event(customer_id=customer.id, county='Nairobi', sub_county='A', town='B', adult_guests=10,
+                      child_guests=0, event_date=datetime(2026, 1, 1))
+        db.session.add(event)
+        db.session.flush()
+        db.session.add(Booking(event_id=event.id, chef_id=1, deposit_amount=300))
+        db.session.commit()
+
+    migrate_copy(app)
+    captured, flagged = check_app(app, min_rows=100)
+    assert flagged == 0
+    assert 'admin.admin_dashboard' in captured and 'customer.event_details' in captured
+    with app.app_context():
+        assert db.session.get(Chef, 1).ranking_score is not None
+
+
+if __name__ == '__main__':
+    test_checks_a_database_that_was_never_migrated()
+    print("✓ Query plan check tests passed")
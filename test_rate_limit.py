@@ -0,0 +1,103 @@
+"""
+Test script for the token-bucket rate limiter
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from flask import Flask, jsonify
+from kv_store import LocalKVClient
+from rate_limit import rate_limited, Limit, MemoryBucketStore, SharedBucketStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def check_bucket_store(store, clock):
+    limit = Limit(3, 60)  # 3 requests, one token back every 20 seconds
+    for _ in range(3):
+        assert store.consume('k', limit) == (True, 0.0)
+    allowed, retry_after = store.consume('k', limit)
+    assert not allowed and abs(retry_after - 20) < 1e-6
+
+    clock.now += 20
+    assert store.consume('k', limit)[0]
+    assert not store.consume('k', limit)[0]
+    # Other keys have their own bucket
+    assert store.consume('other', limit)[0]
+
+
+def test_memory_bucket_store():
+    clock = FakeClock()
+    check_bucket_store(MemoryBucketStore(clock=clock), clock)
+
+
+def test_shared_bucket_store():
+    clock = FakeClock()
+    check_bucket_store(SharedBucketStore(LocalKVClient(), clock=clock), clock)
+
+
+def test_rate_limited_endpoint():
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'test'
+
+    @app.route('/send', methods=['POST'])
+    @rate_limited('send', ip=Limit(5, 3600), email=Limit(2, 300))
+    def send():
+        return jsonify({'success': True})
+
+    client = app.test_client()
+    assert client.post('/send', json={'email': 'A@example.com'}).status_code == 200
+    assert client.post('/send', json={'email': 'a@example.com '}).status_code == 200
+    response = client.post('/send', json={'email': 'a@example.com'})
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) > 0
+
+    # A different email still passes until the IP bucket runs dry
+    assert client.post('/send', json={'email': 'b@example.com'}).status_code == 200
+    assert client.post('/send', json={'email': 'c@example.com'}).status_code == 200
+    # The request the email bucket rejected did not spend an IP token
+    assert client.post('/send', json={'email': 'd@example.com'}).status_code == 200
+    assert client.post('/send', json={'email': 'e@example.com'}).status_code == 429
+
+
+
+def test_malformed_bodies_use_the_ip_bucket():
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'test'
+
+    @app.route('/send', methods=['POST'])
+    @rate_limited('send', ip=Limit(3, 3600), email=Limit(1, 300))
+    def send():
+        return jsonify({'success': True})
+
+    client = app.test_client()
+    for body in (['a@example.com'], {'email': 123}, {'email': ['a@example.com']}):
+        assert client.post('/send', json=body).status_code == 200
+    assert client.post('/send', json={'email': None}).status_code == 429
+
+
+def test_rejected_request_takes_no_tokens():
+    clock = FakeClock()
+    for store in (MemoryBucketStore(clock=clock), SharedBucketStore(LocalKVClient(), clock=clock)):
+        ip, email = Limit(2, 60), Limit(1, 60)
+        assert store.consume_all([('ip', ip), ('email:a', email)]) == (True, 0.0)
+        allowed, retry_after = store.consume_all([('ip', ip), ('email:a', email)])
+        assert not allowed and abs(retry_after - 60) < 1e-6
+        # The IP bucket still has its second token
+        assert store.consume_all([('ip', ip), ('email:b', email)]) == (True, 0.0)
+        assert not store.consume('ip', ip)[0]
+
+
+if __name__ == '__main__':
+    test_memory_bucket_store()
+    test_shared_bucket_store()
+    test_rate_limited_endpoint()
+    test_malformed_bodies_use_the_ip_bucket()
+    test_rejected_request_takes_no_tokens()
+    print("✓ Rate limiter tests passed")
@@ -0,0 +1,76 @@
+"""
+Test script for the slotted chef list read models
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app_factory import create_app
+from models import db, User, Chef
+from read_models import ChefSummary, chef_summaries
+
+
+def make_app():
+    return create_app({'DATABASE_URL': 'sqlite://', 'DISH_DATABASE_URL': 'sqlite://', 'TESTING': True})
+
+
+def add_chefs(count):
+    start = User.query.count()
+    for i in range(start, start + count):
+        user = User(email=f'chef{i}@example.com', password_hash='x', role='chef')
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(Chef(user_id=user.id, name=f'Chef {i}', phone='1', county='Nairobi', sub_county='A',
+                            town='Karen', about='x' * 300, meals_offered='Pilau', photo_url='/static/images/c.jpg',
+                            is_verified=True, is_approved=True, rating_total=9, rating_count=2))
+    db.session.commit()
+    return f'Chef {i}'
+
+
+def test_summaries_match_entities():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        add_chefs(2)
+        chef = Chef.query.order_by(Chef.id).first()
+        summary = chef_summaries(Chef.query.order_by(Chef.id), about_chars=100)[0]
+
+        assert isinstance(summary, ChefSummary) and not hasattr(summary, '__dict__')
+        assert (summary.id, summary.name, summary.email) == (chef.id, chef.name, chef.user.email)
+        assert summary.about == chef.about[:101]
+        for attribute in ('location', 'has_ratings', 'average_rating', 'photo_path'):
+            assert getattr(summary, attribute) == getattr(chef, attribute), attribute
+        assert chef_summaries(Chef.query.order_by(Chef.id))[0].about == chef.about
+
+
+def test_admin_chef_lists_do_not_grow_with_chef_count():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        admin = User(email='admin@example.com', password_hash='x', role='admin')
+        db.session.add(admin)
+        db.session.commit()
+        admin_id = admin.id
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(admin_id)
+        sess['_fresh'] = True
+    client.get('/admin/dashboard')  # cache the admin's identity first
+
+    for path in ('/admin/manage-chefs', '/admin/featured-chefs', '/admin/dashboard'):
+        with app.app_context():
+            add_chefs(1)
+        few = client.get(path)
+        with app.app_context():
+            name = add_chefs(5)
+        many = client.get(path)
+        assert many.status_code == 200 and name in many.get_data(as_text=True)
+        # No per-chef lazy load of chef.user for the email
+        assert many.headers['X-Query-Count'] == few.headers['X-Query-Count'], path
+
+
+if __name__ == '__main__':
+    test_summaries_match_entities()
+    test_admin_chef_lists_do_not_grow_with_chef_count()
+    print("✓ Read model tests passed")
@@ -0,0 +1,112 @@
+"""
+Test script for the incremental review rating aggregates
+"""
+import sys
+import os
+import importlib
+import json
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models import db, Review, ReviewStat
+from test_support import make_test_app, reset_database
+from migrations.runner import Operations
+from review_stats import record_review_approved, record_review_removed, rebuild_review_stats, get_review_summary, invalidate_summary_cache
+
+
+def summary():
+    invalidate_summary_cache()
+    return json.loads(get_review_summary()[0])
+
+
+def test_incremental_matches_rebuild():
+    app = make_test_app()
+    with app.app_context():
+        reset_database()
+        ratings = [('Wedding', 5), ('Wedding', 4), ('Birthday', 3), ('Birthday', 5), ('Corporate', 1)]
+        reviews = []
+        for event_type, rating in ratings:
+            review = Review(customer_name='Test', event_type=event_type, rating=rating, review_text='Great', is_approved=True)
+            db.session.add(review)
+            record_review_approved(review)
+            reviews.append(review)
+        db.session.commit()
+
+        result = summary()
+        assert result['overall']['count'] == 5
+        assert result['overall']['average'] == 3.6
+        assert result['overall']['histogram'] == {'1': 1, '2': 0, '3': 1, '4': 1, '5': 2}
+        wedding = next(e for e in result['event_types'] if e['event_type'] == 'Wedding')
+        assert wedding['count'] == 2 and wedding['average'] == 4.5
+
+        # Removing the only corporate review drops that event type from the summary
+        record_review_removed(reviews[-1])
+        db.session.delete(reviews[-1])
+        db.session.commit()
+        incremental = summary()
+        assert all(e['event_type'] != 'Corporate' for e in incremental['event_types'])
+        assert incremental['overall']['count'] == 4
+
+        rebuild_review_stats()
+        assert summary() == incremental
+
+
+def add_approved(ratings):
+    reviews = [Review(customer_name='Test', event_type='Wedding', rating=rating, review_text='Great', is_approved=True)
+               for rating in ratings]
+    db.session.add_all(reviews)
+    db.session.commit()
+    return reviews
+
+
+def test_first_change_on_existing_reviews_rebuilds():
+    app = make_test_app()
+    with app.app_context():
+        reset_database()
+        reviews = add_approved([5, 5, 4, 4, 3])
+
+        # An approval before anyone asked for the summary counts the existing reviews too
+        review = Review(customer_name='New', event_type='Birthday', rating=1, review_text='Poor')
+        db.session.add(review)
+        db.session.commit()
+        review.is_approved = True
+        record_review_approved(review)
+        db.session.commit()
+        assert summary()['overall']['count'] == 6 and summary()['overall']['average'] == 3.67
+
+        # Same for a removal
+        ReviewStat.query.delete()
+        db.session.commit()
+        record_review_removed(reviews[0])
+        db.session.delete(reviews[0])
+        db.session.commit()
+        assert summary()['overall']['count'] == 5 and summary()['overall']['average'] == 3.4
+
+
+def test_migration_backfill_builds_aggregates():
+    app = make_test_app()
+    with app.app_context():
+        reset_database()
+        add_approved([5, 3])
+        db.session.add(Review(customer_name='Pending', event_type='Wedding', rating=1, review_text='x'))
+        db.session.commit()
+
+        with db.engine.connect() as conn:
+            importlib.import_module('migrations.0007_review_stats').backfill(Operations(conn))
+            conn.commit()
+        result = summary()
+        assert result['overall'] == {'count': 2, 'average': 4.0, 'histogram': {'1': 0, '2': 0, '3': 1, '4': 0, '5': 1}}
+        assert [e['event_type'] for e in result['event_types']] == ['Wedding']
+
+        # Later approvals increment the backfilled rows
+        review = Review(customer_name='New', event_type='Wedding', rating=4, review_text='Good', is_approved=True)
+        db.session.add(review)
+        record_review_approved(review)
+        db.session.commit()
+        assert summary()['overall']['count'] == 3
+
+
+if __name__ == '__main__':
+    test_incremental_matches_rebuild()
+    test_first_change_on_existing_reviews_rebuilds()
+    test_migration_backfill_builds_aggregates()
+    print("✓ Review stats tests passed")
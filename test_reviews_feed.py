@@ -0,0 +1,102 @@
+"""
+Test script for the paginated, cached GET /api/reviews feed
+"""
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app_factory import create_app
+from models import db, User, Review, ReviewStat
+from review_stats import OVERALL
+import reviews_feed
+
+
+def make_app():
+    reviews_feed.invalidate_reviews_cache()
+    return create_app({'DATABASE_URL': 'sqlite://', 'DISH_DATABASE_URL': 'sqlite://', 'TESTING': True})
+
+
+def add_reviews(count, approved=True):
+    start = datetime(2026, 1, 1)
+    reviews = [Review(customer_name=f'Customer {i}', event_type='Wedding', rating=5, review_text='Great',
+                      is_approved=approved, created_at=start + timedelta(days=i // 2)) for i in range(count)]
+    db.session.add_all(reviews)
+    db.session.commit()
+    return [review.id for review in reviews]
+
+
+def overall_count(app):
+    with app.app_context():
+        return ReviewStat.query.filter_by(event_type=OVERALL).one().review_count
+
+
+def test_keyset_pages_cover_every_review_once():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        # Pairs share a created_at, so the id tie-break decides the order
+        ids = add_reviews(7)
+        add_reviews(2, approved=False)
+
+    client = app.test_client()
+    seen, cursor = [], None
+    while True:
+        response = client.get('/api/reviews', query_string={'limit': 3, **({'cursor': cursor} if cursor else {})})
+        assert response.status_code == 200
+        seen += [review['id'] for review in response.get_json()]
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+    assert seen == ids[::-1]
+    assert client.get('/api/reviews?cursor=not-a-cursor').status_code == 400
+
+
+def test_etag_and_invalidation():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        add_reviews(2)
+        pending = add_reviews(1, approved=False)[0]
+        admin = User(email='admin@example.com', password_hash='x', role='admin')
+        db.session.add(admin)
+        db.session.commit()
+        admin_id = admin.id
+
+    client = app.test_client()
+    first = client.get('/api/reviews')
+    etag = first.headers['ETag']
+    assert client.get('/api/reviews', headers={'If-None-Match': etag}).status_code == 304
+
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(admin_id)
+        sess['_fresh'] = True
+    client.post(f'/admin/reviews/{pending}/approve')
+    approved = client.get('/api/reviews', headers={'If-None-Match': etag})
+    assert approved.status_code == 200 and len(approved.get_json()) == 3
+    # Approving again does not count the review twice
+    client.post(f'/admin/reviews/{pending}/approve')
+    assert overall_count(app) == 3
+
+    client.post(f'/admin/reviews/{pending}/delete')
+    assert len(client.get('/api/reviews').get_json()) == 2
+    assert overall_count(app) == 2
+
+
+def test_only_first_pages_are_cached():
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        add_reviews(5)
+        _, _, cursor = reviews_feed.get_reviews_page(limit=2)
+        for _ in range(3):
+            reviews_feed.get_reviews_page(cursor, limit=2)
+            reviews_feed.get_reviews_page(limit=2)
+        assert list(reviews_feed._cache.keys()) == [2]
+
+
+if __name__ == '__main__':
+    test_keyset_pages_cover_every_review_once()
+    test_etag_and_invalidation()
+    test_only_first_pages_are_cached()
+    print("✓ Reviews feed tests passed")
@@ -0,0 +1,34 @@
+"""
+Shared database setup for the test scripts.
+
+Tests run on in-memory SQLite unless TEST_DATABASE_URL is set (see
+run_test_matrix.py), in which case both binds use that database. It is
+emptied by reset_database(), so never point it at real data.
+"""
+import os
+
+from flask import Flask
+from sqlalchemy import text
+
+from models import db
+
+TEST_DATABASE_URL = os.getenv('TEST_DATABASE_URL', 'sqlite://')
+
+
+def make_test_app(**config):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = TEST_DATABASE_URL
+    app.config['SQLALCHEMY_BINDS'] = {'custom_dishes': TEST_DATABASE_URL}
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config.update(config)
+    db.init_app(app)
+    return app
+
+
+def reset_database():
+    """Drop and recreate every table (call inside an app context)."""
+    db.session.remove()
+    db.drop_all()
+    with db.engine.begin() as conn:
+        conn.execute(text('DROP TABLE IF EXISTS schema_migrations'))
+    db.create_all()
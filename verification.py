@@ -1,69 +1,53 @@
-import random
-import string
-import smtplib
-import requests
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
-from models import db, VerificationCode, SystemConfig, PasswordResetCode
+from models import SystemConfig
+from code_store import get_code_store, VERIFIED, EXPIRED, LOCKED
+from app_logging import get_logger
+
+log = get_logger(__name__)
 
 SMS_VERIFICATION_KEY = 'sms_verification_enabled'
 SMS_VERIFICATION_DEFAULT = 'true'
 
 def generate_verification_code(identifier, type):
     """Generate a 4-digit verification code for email or SMS"""
-    code = ''.join(random.choices(string.digits, k=4))
     expires_at = datetime.utcnow() + timedelta(minutes=10)
+    code = get_code_store().issue(type, identifier, length=4, ttl=timedelta(minutes=10))
 
-    # Delete any existing unused codes for this identifier and type
-    existing = VerificationCode.query.filter_by(identifier=identifier, type=type, is_used=False).first()
-    if existing:
-        print(f"[DEBUG] Deleting existing code for {identifier}: {existing.code}")
-        db.session.delete(existing)
-
-    verification = VerificationCode(identifier=identifier, code=code, type=type, expires_at=expires_at)
-    db.session.add(verification)
-    db.session.commit()
-
-    print(f"[DEBUG] Generated new code for {identifier}: {code}, expires at: {expires_at}")
+    log.debug("verification code generated", identifier=identifier, type=type, code=code, expires_at=expires_at)
     return code
 
 def verify_code(identifier, code, type):
     """Verify the code for email or SMS"""
-    print(f"[DEBUG] Verifying code: identifier={identifier}, code={code}, type={type}")
-    
-    verification = VerificationCode.query.filter_by(
-        identifier=identifier,
-        code=code,
-        type=type,
-        is_used=False
-    ).first()
-
-    if not verification:
-        # Check if code exists but is used or wrong
-        all_codes = VerificationCode.query.filter_by(identifier=identifier, type=type).all()
-        print(f"[DEBUG] No matching unused code found. All codes for {identifier}: {[(c.code, c.is_used, c.expires_at) for c in all_codes]}")
-        return False, "Invalid verification code"
+    status = get_code_store().verify(type, identifier, code)
 
-    if datetime.utcnow() > verification.expires_at:
-        print(f"[DEBUG] Code expired. Current time: {datetime.utcnow()}, Expires at: {verification.expires_at}")
+    if status == EXPIRED:
+        log.debug("verification code expired", identifier=identifier, type=type)
         return False, "Verification code has expired"
 
-    verification.is_used = True
-    db.session.commit()
-    
-    print(f"[DEBUG] Code verified successfully")
+    if status == LOCKED:
+        log.info("verification code locked after failed attempts", identifier=identifier, type=type)
+        return False, "Too many incorrect attempts. Please request a new code."
+
+    if status != VERIFIED:
+        log.debug("verification code invalid", identifier=identifier, type=type)
+        return False, "Invalid verification code"
+
+    log.debug("verification code accepted", identifier=identifier, type=type)
     return True, "Code verified successfully"
 
 def send_email_code(email):
     """Send 4-digit code via Gmail. Returns tuple (success, code)"""
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+    import smtplib
+
     gmail_user = SystemConfig.query.filter_by(key='gmail_user').first()
     gmail_password = SystemConfig.query.filter_by(key='gmail_password').first()
 
     code = generate_verification_code(email, 'email')
 
     if not gmail_user or not gmail_password:
-        print(f"[ERROR] Gmail credentials not configured. Please run setup_email.py to configure.")
+        log.error("gmail credentials not configured")
         return (False, code)
 
     msg = MIMEMultipart()
@@ -93,10 +77,10 @@ def send_email_code(email):
         text = msg.as_string()
         server.sendmail(gmail_user.value, email, text)
         server.quit()
-        print(f"[SUCCESS] Email sent to {email} with code: {code}")
+        log.info("verification email sent", email=email)
         return (True, code)
     except Exception as e:
-        print(f"[ERROR] Email sending failed: {e}. Code still generated: {code}")
+        log.error("verification email failed", email=email, error=e)
         return (False, code)
 
 def send_sms_code(phone):
@@ -111,7 +95,7 @@ def send_sms_code(phone):
 
     # Check if SMS credentials are configured
     if not sms_provider or not sms_api_key:
-        print(f"[ERROR] SMS provider credentials not configured in admin settings.")
+        log.error("sms provider credentials not configured")
         return (False, code)
 
     provider = sms_provider.value.lower()
@@ -128,22 +112,20 @@ def send_sms_code(phone):
             success = send_sms_messagebird(phone, message_text, sms_api_key.value, sms_sender_id.value if sms_sender_id else None)
         elif provider == 'custom':
             # For custom API integration
-            print(f"[INFO] Custom SMS provider selected. Implement your custom SMS logic here.")
+            log.info("custom sms provider selected but not implemented")
             success = False
         else:
-            print(f"[ERROR] Unknown SMS provider: {provider}")
+            log.error("unknown sms provider", provider=provider)
             success = False
 
         if success:
-            print(f"[SUCCESS] SMS sent to {phone} with code: {code} via {provider}")
+            log.info("verification sms sent", phone=phone, provider=provider)
             return (True, code)
         else:
-            print(f"[ERROR] SMS sending failed via {provider}. Code still generated: {code}")
+            log.error("verification sms failed", phone=phone, provider=provider)
             return (False, code)
-    except Exception as e:
-        print(f"[ERROR] SMS sending failed: {e}. Code still generated: {code}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        log.exception("verification sms failed", phone=phone, provider=provider)
         return (False, code)
 
 
@@ -159,7 +141,7 @@ def send_sms_twilio(phone, message, api_key, api_secret, sender_id):
         )
         return True
     except Exception as e:
-        print(f"[ERROR] Twilio SMS failed: {e}")
+        log.error("twilio sms failed", error=e)
         return False
 
 
@@ -174,12 +156,14 @@ def send_sms_africastalking(phone, message, api_key, sender_id):
         response = sms.send(message, [phone], sender_id)
         return True
     except Exception as e:
-        print(f"[ERROR] Africa's Talking SMS failed: {e}")
+        log.error("africastalking sms failed", error=e)
         return False
 
 
 def send_sms_nexmo(phone, message, api_key, api_secret, sender_id):
     """Send SMS via Nexmo/Vonage"""
+    import requests
+
     try:
         url = "https://rest.nexmo.com/sms/json"
         payload = {
@@ -195,15 +179,17 @@ def send_sms_nexmo(phone, message, api_key, api_secret, sender_id):
         if result['messages'][0]['status'] == '0':
             return True
         else:
-            print(f"[ERROR] Nexmo error: {result['messages'][0]['error-text']}")
+            log.error("nexmo sms rejected", error=result['messages'][0]['error-text'])
             return False
     except Exception as e:
-        print(f"[ERROR] Nexmo SMS failed: {e}")
+        log.error("nexmo sms failed", error=e)
         return False
 
 
 def send_sms_messagebird(phone, message, api_key, sender_id):
     """Send SMS via MessageBird"""
+    import requests
+
     try:
         url = "https://rest.messagebird.com/messages"
         headers = {
@@ -220,10 +206,10 @@ def send_sms_messagebird(phone, message, api_key, sender_id):
         if response.status_code == 201:
             return True
         else:
-            print(f"[ERROR] MessageBird error: {response.text}")
+            log.error("messagebird sms rejected", status=response.status_code, body=response.text)
             return False
     except Exception as e:
-        print(f"[ERROR] MessageBird SMS failed: {e}")
+        log.error("messagebird sms failed", error=e)
         return False
 
 
@@ -237,68 +223,46 @@ def is_sms_verification_enabled():
 
 def generate_password_reset_code(email):
     """Generate a 6-digit password reset code"""
-    code = ''.join(random.choices(string.digits, k=6))
     expires_at = datetime.utcnow() + timedelta(minutes=5)
+    code = get_code_store().issue('password_reset', email, length=6, ttl=timedelta(minutes=5))
 
-    # Delete any existing unused codes for this email
-    existing = PasswordResetCode.query.filter_by(email=email, is_used=False).all()
-    for code_obj in existing:
-        db.session.delete(code_obj)
-
-    reset_code = PasswordResetCode(email=email, code=code, expires_at=expires_at)
-    db.session.add(reset_code)
-    db.session.commit()
-
-    print(f"[DEBUG] Generated password reset code for {email}: {code}, expires at: {expires_at}")
+    log.debug("password reset code generated", email=email, code=code, expires_at=expires_at)
     return code
 
 
 def verify_password_reset_code(email, code):
-    """Verify the password reset code"""
-    print(f"[DEBUG] Verifying reset code: email={email}, code={code}")
-    
-    reset_code = PasswordResetCode.query.filter_by(
-        email=email,
-        code=code,
-        is_used=False
-    ).first()
-
-    if not reset_code:
-        print(f"[DEBUG] No matching unused reset code found")
-        return False, "Invalid reset code"
+    """Verify and consume the password reset code"""
+    status = get_code_store().verify('password_reset', email, code)
 
-    if datetime.utcnow() > reset_code.expires_at:
-        print(f"[DEBUG] Reset code expired. Current time: {datetime.utcnow()}, Expires at: {reset_code.expires_at}")
+    if status == EXPIRED:
+        log.debug("password reset code expired", email=email)
         return False, "Reset code has expired"
 
-    print(f"[DEBUG] Reset code verified successfully")
-    return True, "Code verified successfully"
+    if status == LOCKED:
+        log.info("password reset code locked after failed attempts", email=email)
+        return False, "Too many incorrect attempts. Please request a new code."
 
+    if status != VERIFIED:
+        log.debug("password reset code invalid", email=email)
+        return False, "Invalid reset code"
 
-def mark_reset_code_used(email, code):
-    """Mark the reset code as used"""
-    reset_code = PasswordResetCode.query.filter_by(
-        email=email,
-        code=code,
-        is_used=False
-    ).first()
-    
-    if reset_code:
-        reset_code.is_used = True
-        db.session.commit()
-        return True
-    return False
+    log.debug("password reset code accepted", email=email)
+    return True, "Code verified successfully"
 
 
 def send_password_reset_email(email):
     """Send 6-digit password reset code via email. Returns tuple (success, code)"""
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+    import smtplib
+
     gmail_user = SystemConfig.query.filter_by(key='gmail_user').first()
     gmail_password = SystemConfig.query.filter_by(key='gmail_password').first()
 
     code = generate_password_reset_code(email)
 
     if not gmail_user or not gmail_password:
-        print(f"[ERROR] Gmail credentials not configured. Please run setup_email.py to configure.")
+        log.error("gmail credentials not configured")
         return (False, code)
 
     msg = MIMEMultipart()
@@ -330,8 +294,8 @@ def send_password_reset_email(email):
         text = msg.as_string()
         server.sendmail(gmail_user.value, email, text)
         server.quit()
-        print(f"[SUCCESS] Password reset email sent to {email} with code: {code}")
+        log.info("password reset email sent", email=email)
         return (True, code)
     except Exception as e:
-        print(f"[ERROR] Email sending failed: {e}. Code still generated: {code}")
+        log.error("password reset email failed", email=email, error=e)
         return (False, code)
\ No newline at end of file